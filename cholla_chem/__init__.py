@@ -1,23 +1,45 @@
 """cholla_chem initialization."""
 
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
-from cholla_chem.main import (
-    ChemicalNameResolver,
-    ChemSpiPyResolver,
-    CIRpyNameResolver,
-    InorganicShorthandNameResolver,
-    ManualNameResolver,
-    OpsinNameResolver,
-    PubChemNameResolver,
-    PubChemNameResolverBatch,
-    StructuralFormulaNameResolver,
-    resolve_compounds_to_smiles,
-)
-from cholla_chem.name_manipulation.name_correction.dataclasses import CorrectorConfig
-from cholla_chem.name_manipulation.name_correction.name_corrector import (
-    ChemNameCorrector,
-)
+if TYPE_CHECKING:
+    from cholla_chem.main import (
+        ChemicalNameResolver,
+        ChemSpiPyResolver,
+        CIRpyNameResolver,
+        InorganicShorthandNameResolver,
+        ManualNameResolver,
+        OpsinNameResolver,
+        PubChemNameResolver,
+        PubChemNameResolverBatch,
+        StructuralFormulaNameResolver,
+        resolve_compounds_to_smiles,
+    )
+    from cholla_chem.name_manipulation.name_correction.dataclasses import (
+        CorrectorConfig,
+    )
+    from cholla_chem.name_manipulation.name_correction.name_corrector import (
+        ChemNameCorrector,
+    )
+
+# Public names are imported on first access, so importing the package (e.g. for the
+# CLI's --help) doesn't pay for RDKit and the resolvers until they are needed.
+_LAZY_EXPORTS = {
+    "resolve_compounds_to_smiles": "cholla_chem.main",
+    "ChemSpiPyResolver": "cholla_chem.main",
+    "ChemicalNameResolver": "cholla_chem.main",
+    "ManualNameResolver": "cholla_chem.main",
+    "OpsinNameResolver": "cholla_chem.main",
+    "PubChemNameResolverBatch": "cholla_chem.main",
+    "PubChemNameResolver": "cholla_chem.main",
+    "StructuralFormulaNameResolver": "cholla_chem.main",
+    "CIRpyNameResolver": "cholla_chem.main",
+    "InorganicShorthandNameResolver": "cholla_chem.main",
+    "ChemNameCorrector": "cholla_chem.name_manipulation.name_correction.name_corrector",
+    "CorrectorConfig": "cholla_chem.name_manipulation.name_correction.dataclasses",
+}
 
 __all__ = [
     "resolve_compounds_to_smiles",
@@ -34,6 +56,20 @@ __all__ = [
     "CorrectorConfig",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 try:
     __version__ = version("cholla_chem")
 except PackageNotFoundError:  # pragma: no cover
@@ -1,9 +1,6 @@
 import argparse
 from typing import Optional, Sequence
 
-from cholla_chem.main import resolve_compounds_to_smiles
-from cholla_chem.utils.file_utils import read_names_from_file, write_results
-
 
 def build_parser() -> argparse.ArgumentParser:
     """
@@ -47,40 +44,46 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument(
         "--detailed-name-dict",
         default=False,
-        type=bool,
+        action=argparse.BooleanOptionalAction,
         help="Whether to return a detailed name dictionary",
     )
     p.add_argument("--batch-size", default=500, type=int, help="Batch size")
     p.add_argument(
         "--normalize-unicode",
         default=True,
-        type=bool,
+        action=argparse.BooleanOptionalAction,
         help="Whether to normalize unicode",
     )
     p.add_argument(
         "--split-names-to-solve",
         default=True,
-        type=bool,
+        action=argparse.BooleanOptionalAction,
         help="Whether to split names to solve",
     )
     p.add_argument(
         "--resolve-peptide-shorthand",
         default=True,
-        type=bool,
+        action=argparse.BooleanOptionalAction,
         help="Whether to resolve peptide shorthand",
     )
     p.add_argument(
         "--attempt-name-correction",
         default=True,
-        type=bool,
+        action=argparse.BooleanOptionalAction,
         help="Whether to attempt name correction",
     )
     p.add_argument(
         "--internet-connection-available",
         default=True,
-        type=bool,
+        action=argparse.BooleanOptionalAction,
         help="Whether an internet connection is available",
     )
+    p.add_argument(
+        "--cache-db",
+        type=str,
+        default=None,
+        help="SQLite file used to cache resolved names across runs (default: $CHOLLA_CACHE_DB, else no cache)",
+    )
     return p
 
 
@@ -99,10 +102,14 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    # Deferred so that --help and argument errors don't load RDKit and the resolvers
+    from cholla_chem.main import resolve_compounds_to_smiles
+    from cholla_chem.utils.file_utils import iter_names_from_file, write_results
+
     names = list(args.names)
     if args.input:
         names.extend(
-            read_names_from_file(
+            iter_names_from_file(
                 args.input,
                 input_format=args.input_format,
                 input_column=args.input_column,
@@ -115,8 +122,11 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if args.output_format != "json" and args.detailed_name_dict:
         parser.error("--detailed-name-dict can only be used with JSON output format")
 
+    # Resolve each distinct name once; results are emitted in input order
+    unique_names = list(dict.fromkeys(names))
+
     results = resolve_compounds_to_smiles(
-        names,
+        unique_names,
         smiles_selection_mode=args.smiles_selection_mode,
         detailed_name_dict=args.detailed_name_dict,
         batch_size=args.batch_size,
@@ -125,10 +135,13 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         resolve_peptide_shorthand=args.resolve_peptide_shorthand,
         attempt_name_correction=args.attempt_name_correction,
         internet_connection_available=args.internet_connection_available,
+        cache_path=args.cache_db,
     )
 
+    ordered_results = {name: results[name] for name in unique_names if name in results}
+
     write_results(
-        results,
+        ordered_results,
         output_path=args.output,
         output_format=args.output_format,
     )
@@ -1,8 +1,11 @@
+import hashlib
+import json
+import os
 import shutil
 import time
 import warnings
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from rdkit import RDLogger
 
@@ -23,7 +26,10 @@ from cholla_chem.resolvers.inorganic_resolver.inorganic_resolver import (
     name_to_smiles_inorganic_shorthand,
 )
 from cholla_chem.resolvers.manual_resolver import name_to_smiles_manual
-from cholla_chem.resolvers.opsin_resolver.opsin_resolver import name_to_smiles_opsin
+from cholla_chem.resolvers.opsin_resolver.opsin_resolver import (
+    OPSIN_JAR_NAME,
+    name_to_smiles_opsin,
+)
 from cholla_chem.resolvers.pubchem_resolver.pubchem_resolver import (
     name_to_smiles_pubchem,
 )
@@ -38,6 +44,7 @@ from cholla_chem.types import (
     CompoundResolutionEntry,
     CompoundResolutionEntryWithNameCorrection,
 )
+from cholla_chem.utils.cache import CACHE_DB_ENV_VAR, ResolverCache
 from cholla_chem.utils.chem_utils import canonicalize_smiles
 from cholla_chem.utils.logging_config import logger
 
@@ -62,6 +69,8 @@ class ChemicalNameResolver(ABC):
         resolver_weight: float,
         requires_internet: bool = False,
         rate_limit_time: Optional[float] = None,
+        single_batch: bool = False,
+        cacheable: bool = False,
     ):
         if not isinstance(resolver_type, str):
             raise TypeError("Invalid input: resolver_type must be a string.")
@@ -80,6 +89,8 @@ class ChemicalNameResolver(ABC):
         self._resolver_weight: float = float(resolver_weight)
         self._requires_internet: bool = requires_internet
         self._rate_limit_time: Optional[float] = rate_limit_time
+        self._single_batch: bool = single_batch
+        self._cacheable: bool = cacheable
 
     @property
     def resolver_name(self) -> str:
@@ -101,6 +112,36 @@ class ChemicalNameResolver(ABC):
         """Return rate_limit_time."""
         return self._rate_limit_time
 
+    @property
+    def single_batch(self) -> bool:
+        """Return single_batch. If True, all names are resolved in one call, ignoring batch_size."""
+        return self._single_batch
+
+    @property
+    def cacheable(self) -> bool:
+        """Return cacheable. If True, results may be stored in a persistent cache."""
+        return self._cacheable
+
+    @property
+    def cache_key(self) -> str:
+        """
+        Return cache_key, the key this resolver's results are cached under.
+
+        It combines the resolver name with a fingerprint of the resolver type and of
+        the options that change its output, so results cached under one
+        configuration are not served to a resolver configured differently.
+        """
+        options = json.dumps(
+            {"resolver_type": self._resolver_type, **self._cache_options()},
+            sort_keys=True,
+        )
+        fingerprint = hashlib.sha256(options.encode("utf-8")).hexdigest()[:16]
+        return f"{self.resolver_name}:{fingerprint}"
+
+    def _cache_options(self) -> Dict[str, Any]:
+        """Return the options that change this resolver's output, for `cache_key`."""
+        return {}
+
     @abstractmethod
     def name_to_smiles(
         self, compound_name_list: List[str]
@@ -118,6 +159,32 @@ class ChemicalNameResolver(ABC):
         """
         pass
 
+    def name_to_smiles_with_failures(
+        self, compound_name_list: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str], Set[str]]:
+        """
+        Convert chemical names to SMILES strings, also reporting lookup errors.
+
+        Only names the resolver answered negatively are cached as misses, so failed
+        names (e.g. after a timeout or a rejected API key) are retried on the next run.
+        This default cannot tell the two apart and reports every unresolved name as
+        failed; resolvers that can should override it.
+
+        Args:
+            compound_name_list: List of chemical names.
+
+        Returns:
+            Tuple of:
+                - Dict mapping successful names to SMILES.
+                - Dict mapping failed names to error messages.
+                - Set of names that could not be resolved because of an error.
+        """
+        resolved_names, info_messages = self.name_to_smiles(compound_name_list)
+        failed_names = {
+            name for name in compound_name_list if not resolved_names.get(name)
+        }
+        return resolved_names, info_messages, failed_names
+
 
 class OpsinNameResolver(ChemicalNameResolver):
     """
@@ -139,6 +206,8 @@ class OpsinNameResolver(ChemicalNameResolver):
             resolver_name,
             resolver_weight,
             rate_limit_time=None,
+            single_batch=True,
+            cacheable=True,
         )
         self._allow_acid = allow_acid
         self._allow_radicals = allow_radicals
@@ -146,20 +215,44 @@ class OpsinNameResolver(ChemicalNameResolver):
         self._wildcard_radicals = wildcard_radicals
         self._jar_fpath = jar_fpath
 
+    def _cache_options(self) -> Dict[str, Any]:
+        """Return the OPSIN version and flags, which change the SMILES it returns."""
+        return {
+            "opsin_jar": OPSIN_JAR_NAME,
+            "allow_acid": self._allow_acid,
+            "allow_radicals": self._allow_radicals,
+            "allow_bad_stereo": self._allow_bad_stereo,
+            "wildcard_radicals": self._wildcard_radicals,
+        }
+
     def name_to_smiles(
         self, compound_name_list: List[str]
     ) -> Tuple[Dict[str, str], Dict[str, str]]:
         """
         Convert chemical names to SMILES using OPSIN.
         """
+        resolved_names, failure_message_dict, _ = self.name_to_smiles_with_failures(
+            compound_name_list
+        )
+        return resolved_names, failure_message_dict
+
+    def name_to_smiles_with_failures(
+        self, compound_name_list: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str], Set[str]]:
+        """
+        Convert chemical names to SMILES using OPSIN, also reporting names OPSIN
+        could not be run on.
+        """
+        failed_names: Set[str] = set()
         resolved_names, failure_message_dict = name_to_smiles_opsin(
             compound_name_list,
             allow_acid=self._allow_acid,
             allow_radicals=self._allow_radicals,
             allow_bad_stereo=self._allow_bad_stereo,
             wildcard_radicals=self._wildcard_radicals,
+            failed_names=failed_names,
         )
-        return resolved_names, failure_message_dict
+        return resolved_names, failure_message_dict, failed_names
 
 
 class PubChemNameResolverBatch(ChemicalNameResolver):
@@ -180,6 +273,7 @@ class PubChemNameResolverBatch(ChemicalNameResolver):
             resolver_weight,
             requires_internet=True,
             rate_limit_time=rate_limit_time,
+            cacheable=True,
         )
 
     def name_to_smiles(
@@ -188,9 +282,21 @@ class PubChemNameResolverBatch(ChemicalNameResolver):
         """
         Convert chemical names to SMILES using pubchem.
         """
-        resolved_names = name_to_smiles_pubchem_batch(compound_name_list)
+        resolved_names, _, _ = self.name_to_smiles_with_failures(compound_name_list)
         return resolved_names, {}
 
+    def name_to_smiles_with_failures(
+        self, compound_name_list: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str], Set[str]]:
+        """
+        Convert chemical names to SMILES using pubchem, also reporting lookup errors.
+        """
+        failed_names: Set[str] = set()
+        resolved_names = name_to_smiles_pubchem_batch(
+            compound_name_list, failed_names=failed_names
+        )
+        return resolved_names, {}, failed_names
+
 
 class PubChemNameResolver(ChemicalNameResolver):
     """
@@ -210,6 +316,7 @@ class PubChemNameResolver(ChemicalNameResolver):
             resolver_weight,
             requires_internet=True,
             rate_limit_time=rate_limit_time,
+            cacheable=True,
         )
 
     def name_to_smiles(
@@ -218,9 +325,21 @@ class PubChemNameResolver(ChemicalNameResolver):
         """
         Convert chemical names to SMILES using pubchem.
         """
-        resolved_names = name_to_smiles_pubchem(compound_name_list)
+        resolved_names, _, _ = self.name_to_smiles_with_failures(compound_name_list)
         return resolved_names, {}
 
+    def name_to_smiles_with_failures(
+        self, compound_name_list: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str], Set[str]]:
+        """
+        Convert chemical names to SMILES using pubchem, also reporting lookup errors.
+        """
+        failed_names: Set[str] = set()
+        resolved_names = name_to_smiles_pubchem(
+            compound_name_list, failed_names=failed_names
+        )
+        return resolved_names, {}, failed_names
+
 
 class CIRpyNameResolver(ChemicalNameResolver):
     """
@@ -239,6 +358,7 @@ class CIRpyNameResolver(ChemicalNameResolver):
             resolver_weight,
             requires_internet=True,
             rate_limit_time=rate_limit_time,
+            cacheable=True,
         )
 
     def name_to_smiles(
@@ -247,9 +367,21 @@ class CIRpyNameResolver(ChemicalNameResolver):
         """
         Convert chemical names to SMILES using cirpy.
         """
-        resolved_names = name_to_smiles_cirpy(compound_name_list)
+        resolved_names, _, _ = self.name_to_smiles_with_failures(compound_name_list)
         return resolved_names, {}
 
+    def name_to_smiles_with_failures(
+        self, compound_name_list: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str], Set[str]]:
+        """
+        Convert chemical names to SMILES using cirpy, also reporting lookup errors.
+        """
+        failed_names: Set[str] = set()
+        resolved_names = name_to_smiles_cirpy(
+            compound_name_list, failed_names=failed_names
+        )
+        return resolved_names, {}, failed_names
+
 
 class ChemSpiPyResolver(ChemicalNameResolver):
     """
@@ -269,6 +401,7 @@ class ChemSpiPyResolver(ChemicalNameResolver):
             resolver_weight,
             requires_internet=True,
             rate_limit_time=rate_limit_time,
+            cacheable=True,
         )
         if chemspider_api_key:
             if not isinstance(chemspider_api_key, str):
@@ -283,10 +416,20 @@ class ChemSpiPyResolver(ChemicalNameResolver):
         """
         Convert chemical names to SMILES using ChemSpiPy.
         """
+        resolved_names, _, _ = self.name_to_smiles_with_failures(compound_name_list)
+        return resolved_names, {}
+
+    def name_to_smiles_with_failures(
+        self, compound_name_list: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str], Set[str]]:
+        """
+        Convert chemical names to SMILES using ChemSpiPy, also reporting lookup errors.
+        """
+        failed_names: Set[str] = set()
         resolved_names = name_to_smiles_chemspipy(
-            compound_name_list, self._chemspider_api_key
+            compound_name_list, self._chemspider_api_key, failed_names=failed_names
         )
-        return resolved_names, {}
+        return resolved_names, {}, failed_names
 
 
 class ManualNameResolver(ChemicalNameResolver):
@@ -477,6 +620,7 @@ def resolve_compounds_using_resolvers(
     compounds_list: List[str],
     resolvers_list: List[ChemicalNameResolver],
     batch_size: int,
+    cache: Optional[ResolverCache] = None,
 ) -> Dict[str, Dict[str, Dict[str, str]]]:
     """
     Resolve a list of compound names using a list of resolvers.
@@ -485,24 +629,63 @@ def resolve_compounds_using_resolvers(
         compounds_list (List[str]): A list of compound names to resolve.
         resolvers_list (List[ChemicalNameResolver]): A list of resolvers to use.
         batch_size (int): The number of compound names to process in each batch.
+        cache (ResolverCache, optional): Persistent cache consulted before, and updated after,
+            calling cacheable resolvers. Entries are keyed on each resolver's `cache_key`, and
+            store the resolver's info message for the name along with its SMILES.
 
     Returns:
         Dict[str, Dict[str, Dict[str, str]]]: A dictionary mapping each resolver name to its output dictionary, which maps each compound name to its resolved SMILES string and error message.
     """
     resolvers_out_dict = {}
     for resolver in resolvers_list:
-        out = {}
-        additional_info = {}
+        out: Dict[str, str] = {}
+        additional_info: Dict[str, str] = {}
+        resolver_cache = cache if resolver.cacheable else None
+        names_to_resolve = compounds_list
+        if resolver_cache is not None:
+            cached = resolver_cache.get_many_with_info(
+                resolver.cache_key, compounds_list
+            )
+            # Cached misses map to "" and are skipped until they expire
+            out = {name: smiles for name, (smiles, _) in cached.items() if smiles}
+            additional_info = {name: info for name, (_, info) in cached.items() if info}
+            names_to_resolve = [c for c in compounds_list if c not in cached]
+            logger.info(
+                f"{resolver.resolver_name}: {len(cached)} cached, {len(names_to_resolve)} to resolve."
+            )
         last_request_duration = 0.0
-        for i in range(0, len(compounds_list), batch_size):
+        # Resolvers with a fixed per-call cost (e.g. OPSIN's JVM startup) get every
+        # name in a single call.
+        resolver_batch_size = (
+            max(len(names_to_resolve), 1) if resolver.single_batch else batch_size
+        )
+        for i in range(0, len(names_to_resolve), resolver_batch_size):
             if resolver.rate_limit_time and i != 0:
                 sleep_time = resolver.rate_limit_time - last_request_duration
                 if sleep_time > 0:
                     time.sleep(sleep_time)
-            chunk = compounds_list[i : i + batch_size]
+            chunk = names_to_resolve[i : i + resolver_batch_size]
             start_time = time.time()
-            out_chunk, additional_info_chunk = resolver.name_to_smiles(chunk)
+            out_chunk, additional_info_chunk, failed_names = (
+                resolver.name_to_smiles_with_failures(chunk)
+            )
             last_request_duration = time.time() - start_time
+            if resolver_cache is not None:
+                if failed_names:
+                    logger.info(
+                        f"{resolver.resolver_name}: {len(failed_names)} names failed with an error and were not cached as misses."
+                    )
+                # Only names the resolver answered negatively are cached as misses
+                resolver_cache.set_many(
+                    resolver.cache_key,
+                    out_chunk,
+                    info=additional_info_chunk,
+                    misses=[
+                        c
+                        for c in chunk
+                        if not out_chunk.get(c) and c not in failed_names
+                    ],
+                )
             out.update(out_chunk)
             additional_info.update(additional_info_chunk)
         resolvers_out_dict[resolver.resolver_name] = {
@@ -699,6 +882,7 @@ def resolve_compounds_to_smiles(
     attempt_name_correction: bool = True,
     internet_connection_available: bool = True,
     name_correction_config: Optional[CorrectorConfig] = None,
+    cache_path: Optional[str] = None,
 ) -> (
     Dict[str, CompoundResolutionEntry]
     | Dict[str, CompoundResolutionEntryWithNameCorrection]
@@ -724,6 +908,9 @@ def resolve_compounds_to_smiles(
             Defaults to True.
         internet_connection_available (bool, optional): Whether an internet connection is available to resolve compound names. Defaults to True.
         name_correction_config (CorrectorConfig, optional): Configuration for name correction. Defaults to None.
+        cache_path (str, optional): Path to a SQLite database used to persist resolutions from
+            network and OPSIN resolvers across runs, keyed on resolver name and configuration. Names a
+            resolver found no match for are remembered for a day; lookups that fail with an error are not cached. Defaults to the CHOLLA_CACHE_DB environment variable if set, otherwise None (no cache).
 
     Returns:
         Dict[str, Dict[str, Dict[str, List[str]]]] | Dict[str, str]: A dictionary mapping each compound to its SMILES representation and resolvers, or a simple dictionary mapping each compound to it's selected SMILES representation.
@@ -764,7 +951,7 @@ def resolve_compounds_to_smiles(
                 )
     if len(compounds_list) != len(set(compounds_list)):
         logger.info("Removing duplicate compound names from compounds_list.")
-        compounds_list = list(set(compounds_list))
+        compounds_list = list(dict.fromkeys(compounds_list))
 
     non_empty_compounds_list = [string for string in compounds_list if string]
     if len(non_empty_compounds_list) != len(compounds_list):
@@ -808,6 +995,12 @@ def resolve_compounds_to_smiles(
     if not isinstance(internet_connection_available, bool):
         raise ValueError("Invalid input: internet_connection_available must be a bool.")
 
+    if cache_path is None:
+        cache_path = os.getenv(CACHE_DB_ENV_VAR) or None
+
+    if cache_path is not None and not isinstance(cache_path, (str, os.PathLike)):
+        raise ValueError("Invalid input: cache_path must be a string or path.")
+
     if not internet_connection_available:
         logger.info(
             "Internet connection not available, filtering out internet-dependent resolvers."
@@ -835,9 +1028,14 @@ def resolve_compounds_to_smiles(
         )
 
     # Resolve compounds and split compound names with resolvers
-    resolvers_out_dict = resolve_compounds_using_resolvers(
-        cleaned_compounds_list, resolvers_list, batch_size
-    )
+    cache = ResolverCache(cache_path) if cache_path is not None else None
+    try:
+        resolvers_out_dict = resolve_compounds_using_resolvers(
+            cleaned_compounds_list, resolvers_list, batch_size, cache=cache
+        )
+    finally:
+        if cache is not None:
+            cache.close()
 
     # Assemble the resolution dictionary
     compounds_out_dict = assemble_compounds_resolution_dict(
@@ -891,6 +1089,7 @@ def resolve_compounds_to_smiles(
                     split_names_to_solve=split_names_to_solve,
                     resolve_peptide_shorthand=False,
                     attempt_name_correction=False,
+                    cache_path=cache_path,
                 )
 
                 # ugliness to get rid of mypy error.
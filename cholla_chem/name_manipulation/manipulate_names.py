@@ -31,8 +31,13 @@ def correct_names(
     Returns:
         Dictionary mapping original names to their correction information
     """
-    if not name_correction_config:
-        corrector = ChemNameCorrector(config=name_correction_config)
+    # Reuse the module-level corrector (and its cache of corrected names) unless a
+    # custom configuration is given
+    name_corrector = (
+        ChemNameCorrector(config=name_correction_config)
+        if name_correction_config
+        else corrector
+    )
 
     all_compound_correction_dict = {}
     names_to_correct = []
@@ -42,7 +47,7 @@ def correct_names(
         if not v.get("SMILES", ""):
             names_to_correct.append(k)
 
-    corrected_names = corrector.correct_batch(names_to_correct)
+    corrected_names = name_corrector.correct_batch(names_to_correct)
     for name, correction_candidates in corrected_names.items():
         if name not in compounds_out_dict:
             continue
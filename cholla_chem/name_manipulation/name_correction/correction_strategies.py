@@ -4,7 +4,7 @@ import itertools
 import re
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
-from typing import ClassVar, Dict, List, Optional, Tuple
+from typing import ClassVar, Dict, List, Optional, Sequence, Tuple
 
 from flashtext import KeywordProcessor
 
@@ -21,6 +21,32 @@ from cholla_chem.name_manipulation.name_correction.dataclasses import (
 )
 from cholla_chem.name_manipulation.name_correction.regexes import PATTERNS
 
+# Any whitespace character (the same characters as str.isspace()), and runs of
+# anything else
+WHITESPACE_PATTERN = re.compile(r"\s")
+NON_WHITESPACE_RUN_PATTERN = re.compile(r"\S+")
+
+
+def squash_whitespace(text: str) -> Tuple[str, Sequence[int]]:
+    """
+    Remove whitespace from text, keeping the original index of each remaining character.
+
+    Args:
+        text: Text to squash
+
+    Returns:
+        Tuple of (text without whitespace, original index of each of its characters)
+    """
+    if WHITESPACE_PATTERN.search(text) is None:
+        return text, range(len(text))
+
+    runs = []
+    idx_map: List[int] = []
+    for match in NON_WHITESPACE_RUN_PATTERN.finditer(text):
+        runs.append(match.group())
+        idx_map.extend(range(match.start(), match.end()))
+    return "".join(runs), idx_map
+
 
 class CorrectionStrategy(ABC):
     """
@@ -121,15 +147,7 @@ class CharacterSubstitutionStrategy(CorrectionStrategy):
         assert kp is not None, "Keyword processor should be initialized"
 
         # 1. SQUASH & MAP
-        clean_chars = []
-        idx_map = []
-
-        for i, char in enumerate(text):
-            if not char.isspace():
-                clean_chars.append(char)
-                idx_map.append(i)
-
-        clean_text = "".join(clean_chars)
+        clean_text, idx_map = squash_whitespace(text)
 
         if not clean_text:
             return
@@ -284,15 +302,7 @@ class CharacterInsertionStrategy(CorrectionStrategy):
         kp = self.keyword_processor
         assert kp is not None, "Keyword processor should be initialized"
 
-        clean_chars = []
-        idx_map = []
-
-        for i, char in enumerate(text):
-            if not char.isspace():
-                clean_chars.append(char)
-                idx_map.append(i)
-
-        clean_text = "".join(clean_chars)
+        clean_text, idx_map = squash_whitespace(text)
         if not clean_text:
             return
 
@@ -401,15 +411,7 @@ class CharacterDeletionStrategy(CorrectionStrategy):
         kp = self.keyword_processor
         assert kp is not None, "Keyword processor should be initialized"
 
-        clean_chars = []
-        idx_map = []
-
-        for i, char in enumerate(text):
-            if not char.isspace():
-                clean_chars.append(char)
-                idx_map.append(i)
-
-        clean_text = "".join(clean_chars)
+        clean_text, idx_map = squash_whitespace(text)
         if not clean_text:
             return
 
@@ -518,15 +520,7 @@ class CharacterTranspositionStrategy(CorrectionStrategy):
         kp = self.keyword_processor
         assert kp is not None, "Keyword processor should be initialized"
 
-        clean_chars = []
-        idx_map = []
-
-        for i, char in enumerate(text):
-            if not char.isspace():
-                clean_chars.append(char)
-                idx_map.append(i)
-
-        clean_text = "".join(clean_chars)
+        clean_text, idx_map = squash_whitespace(text)
         if not clean_text:
             return
 
@@ -770,7 +764,7 @@ class LocantCorrectionStrategy(CorrectionStrategy):
             # We use a loop to catch all instances of one error type (e.g. multiple 'l's)
             # before moving to the next pattern type.
 
-            matches = list(re.finditer(pattern, current_text))
+            matches = list(pattern.finditer(current_text))
             if not matches:
                 continue
 
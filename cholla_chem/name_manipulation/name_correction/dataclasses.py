@@ -13,6 +13,9 @@ class CorrectorConfig:
     Attributes:
         max_candidates: Maximum number of candidates to generate
         max_corrections_per_candidate: Maximum corrections per candidate
+        beam_width: Maximum number of texts that strategies are applied to
+        generation_ceiling: Number of candidates after which no further strategies
+            are applied (defaults to 4 x max_candidates)
         min_score_threshold: Minimum score to include candidate in results
         enable_character_substitution: Enable OCR character correction
         max_character_substitution_edits: Max number of substitution edits
@@ -21,10 +24,16 @@ class CorrectorConfig:
         custom_substitutions: Additional user-defined substitution rules
         custom_rules: Additional user-defined correction rules
         enable_external_validation: Enable external validation of candidates
+        cache_size: Number of names whose ranked candidates are cached (0 disables)
+        workers: Number of worker processes correct_batch may use for large batches.
+            Workers are forked, so on platforms without the "fork" start method
+            (e.g. Windows) batches are always corrected in-process
     """
 
     max_candidates: int = 100
     max_corrections_per_candidate: int = 3
+    beam_width: int = 100
+    generation_ceiling: Optional[int] = None
     min_score_threshold: float = 0.1
     enable_locant_correction: bool = True
 
@@ -45,6 +54,8 @@ class CorrectorConfig:
     custom_substitutions: Dict[str, List[str]] = field(default_factory=dict)
     custom_rules: List[CorrectionRule] = field(default_factory=list)
     enable_external_validation: bool = True
+    cache_size: int = 1024
+    workers: int = 1
 
 
 @dataclass
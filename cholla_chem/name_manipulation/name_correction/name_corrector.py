@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import heapq
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from operator import itemgetter
 from typing import Dict, List, Optional
 
 from cholla_chem.name_manipulation.name_correction.correction_strategies import (
@@ -24,6 +30,12 @@ from cholla_chem.name_manipulation.name_correction.validators import (
     Validator,
 )
 
+# Fewest uncached names in a batch worth spreading over worker processes
+CORRECT_BATCH_MIN_PARALLEL = 200
+
+# Names sent to a worker process per task
+CORRECT_BATCH_CHUNK_SIZE = 16
+
 
 class ChemNameCorrector:
     """
@@ -80,13 +92,28 @@ class ChemNameCorrector:
         if self.config.enable_external_validation:
             self.validator = OPSINValidator()
 
+        # Ranked (unvalidated) candidates per name, least recently used first
+        self._ranked_cache: OrderedDict[str, List[CorrectionCandidate]] = OrderedDict()
+
     def _create_default_strategies(self) -> List[CorrectionStrategy]:
-        """Create the default set of correction strategies based on config."""
+        """
+        Create the default set of correction strategies based on config.
+
+        Strategies that yield few candidates come first, and the character edit
+        strategies, which yield many, come last. Candidate generation stops once
+        `config.generation_ceiling` is reached, so the cheap strategies always run.
+        """
         strategies: List[CorrectionStrategy] = []
 
         if self.config.enable_locant_correction:
             strategies.append(LocantCorrectionStrategy())
 
+        if self.config.enable_bracket_balancing:
+            strategies.append(BracketBalancingStrategy())
+
+        if self.config.enable_punctuation_restoration:
+            strategies.append(PunctuationRestorationStrategy())
+
         if self.config.enable_character_substitution:
             char_strategy = CharacterSubstitutionStrategy(
                 max_edits=self.config.max_character_substitution_edits_per_morpheme
@@ -111,12 +138,6 @@ class ChemNameCorrector:
             )
             strategies.append(char_transposition_strategy)
 
-        if self.config.enable_punctuation_restoration:
-            strategies.append(PunctuationRestorationStrategy())
-
-        if self.config.enable_bracket_balancing:
-            strategies.append(BracketBalancingStrategy())
-
         return strategies
 
     def add_strategy(self, strategy: CorrectionStrategy) -> None:
@@ -127,6 +148,7 @@ class ChemNameCorrector:
             strategy: The strategy to add
         """
         self.strategies.append(strategy)
+        self._ranked_cache.clear()
 
     def remove_strategy(self, strategy_name: str) -> bool:
         """
@@ -141,6 +163,7 @@ class ChemNameCorrector:
         for i, strategy in enumerate(self.strategies):
             if strategy.name == strategy_name:
                 self.strategies.pop(i)
+                self._ranked_cache.clear()
                 return True
         return False
 
@@ -158,11 +181,35 @@ class ChemNameCorrector:
         Returns:
             List of CorrectionCandidate objects, sorted by score (descending)
         """
-        # Generate all candidates
-        candidates = self._generate_all_candidates(name)
+        # Copy the cached candidates so validation can adjust their scores without
+        # changing the cached ranking
+        limited_candidates = [replace(c) for c in self._rank_candidates(name)]
 
-        # Remove duplicates while preserving best corrections
-        unique_candidates = self._deduplicate_candidates(candidates)
+        if use_validator:
+            self._validate_candidates_batch(
+                {name: limited_candidates}, self.validator, validate_all
+            )
+
+            limited_candidates = sorted(
+                limited_candidates, key=lambda c: c.score, reverse=True
+            )
+
+        return limited_candidates
+
+    def _rank_candidates(self, name: str) -> List[CorrectionCandidate]:
+        """
+        Generate, score and rank candidates for a name, without validation.
+
+        Results for the last `config.cache_size` names are cached, so names that
+        repeat across calls and batches are only corrected once.
+        """
+        cached = self._ranked_cache.get(name)
+        if cached is not None:
+            self._ranked_cache.move_to_end(name)
+            return cached
+
+        # Generate all unique candidates
+        unique_candidates = self._generate_all_candidates(name)
 
         # Score all candidates
         scored_candidates = [
@@ -182,16 +229,60 @@ class ChemNameCorrector:
         # Limit to max candidates
         limited_candidates = sorted_candidates[: self.config.max_candidates]
 
-        if use_validator:
-            self._validate_candidates_batch(
-                {name: limited_candidates}, self.validator, validate_all
-            )
+        self._cache_ranked(name, limited_candidates)
 
-            limited_candidates = sorted(
-                limited_candidates, key=lambda c: c.score, reverse=True
+        return limited_candidates
+
+    def _cache_ranked(self, name: str, candidates: List[CorrectionCandidate]) -> None:
+        """Cache ranked candidates for a name, evicting the least recently used."""
+        if self.config.cache_size > 0:
+            self._ranked_cache[name] = candidates
+            if len(self._ranked_cache) > self.config.cache_size:
+                self._ranked_cache.popitem(last=False)
+
+    def _rank_in_workers(
+        self, names: List[str]
+    ) -> Dict[str, List[CorrectionCandidate]]:
+        """
+        Rank candidates for uncached names in worker processes, caching the results.
+
+        Returns an empty dict unless `config.workers` is above 1, there are at
+        least CORRECT_BATCH_MIN_PARALLEL uncached names and the "fork" start
+        method is available.
+        """
+        uncached = [name for name in names if name not in self._ranked_cache]
+        n_workers = min(self.config.workers, len(uncached))
+        if n_workers <= 1 or len(uncached) < CORRECT_BATCH_MIN_PARALLEL:
+            return {}
+        # Workers inherit this corrector by forking; spawned workers would each
+        # unpickle tens of MB of strategy state, which costs more than it saves
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return {}
+
+        # Rank one name here first, so the strategies' keyword processors are built
+        # before the workers start and forked workers can share them
+        first = uncached.pop(0)
+        ranked = {first: self._rank_candidates(first)}
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_correction_worker,
+            initargs=(self,),
+        ) as executor:
+            ranked.update(
+                zip(
+                    uncached,
+                    executor.map(
+                        _rank_candidates_in_worker,
+                        uncached,
+                        chunksize=CORRECT_BATCH_CHUNK_SIZE,
+                    ),
+                )
             )
 
-        return limited_candidates
+        for name in uncached:
+            self._cache_ranked(name, ranked[name])
+        return ranked
 
     def correct_batch(
         self, names: List[str], use_validator: bool = True, validate_all: bool = False
@@ -206,10 +297,21 @@ class ChemNameCorrector:
 
         Returns:
             Dictionary mapping original names to their candidates
+
+        Note:
+            With `config.workers` above 1, batches of at least
+            CORRECT_BATCH_MIN_PARALLEL uncached names are ranked in a pool of forked
+            worker processes. Validation always runs in this process.
         """
+        unique_names = list(dict.fromkeys(names))
+        ranked = self._rank_in_workers(unique_names)
+
         results = {}
-        for name in names:
-            results[name] = self.correct(name, use_validator=False)
+        for name in unique_names:
+            if name in ranked:
+                results[name] = [replace(c) for c in ranked[name]]
+            else:
+                results[name] = self.correct(name, use_validator=False)
 
         if use_validator:
             self._validate_candidates_batch(results, self.validator, validate_all)
@@ -220,49 +322,57 @@ class ChemNameCorrector:
         return results
 
     def _generate_all_candidates(self, name: str) -> List[CorrectionCandidate]:
-        """Generate candidates from all strategies."""
-        candidates: List[CorrectionCandidate] = []
+        """
+        Generate unique candidates from all strategies.
 
-        names_to_process = [(name, 0)]
+        Each strategy is applied to a beam of texts, starting with the input name.
+        After each strategy, the beam is topped up to `config.beam_width` texts with
+        the strategy's new texts that needed the fewest corrections. A text generated
+        more than once keeps the candidate with the fewest corrections. Remaining
+        strategies are skipped once `config.generation_ceiling` candidates exist.
+        """
+        candidates: Dict[str, CorrectionCandidate] = {}
+        max_corrections = self.config.max_corrections_per_candidate
+        generation_ceiling = self.config.generation_ceiling
+        if generation_ceiling is None:
+            generation_ceiling = 4 * self.config.max_candidates
+
+        # Texts to pass to the next strategy, and the corrections each needed
+        beam: Dict[str, int] = {name: 0}
         for strategy in self.strategies:
-            for name_to_process, num_corrections in names_to_process:
+            if len(candidates) >= generation_ceiling:
+                break
+
+            new_texts: Dict[str, int] = {}
+            for text, num_corrections in beam.items():
                 for new_text, new_corrections in strategy.generate_candidates(
-                    name_to_process, num_corrections, self.config
+                    text, num_corrections, self.config
                 ):
+                    num_new_corrections = len(new_corrections)
+                    if num_new_corrections > max_corrections:
+                        continue
+
+                    existing = candidates.get(new_text)
                     if (
-                        len(new_corrections)
-                        <= self.config.max_corrections_per_candidate
+                        existing is None
+                        or num_new_corrections < existing.num_corrections
                     ):
-                        candidate = CorrectionCandidate(
+                        candidates[new_text] = CorrectionCandidate(
                             name=new_text,
                             original_name=name,
                             corrections=new_corrections,
                         )
-                        candidates.append(candidate)
-
-                        if new_text in names_to_process:
-                            continue
-                        if len(names_to_process) >= self.config.max_candidates:
-                            continue
-                        names_to_process.append((new_text, len(new_corrections)))
-
-        return candidates
 
-    def _deduplicate_candidates(
-        self, candidates: List[CorrectionCandidate]
-    ) -> List[CorrectionCandidate]:
-        """Remove duplicate candidates, keeping the one with fewer corrections."""
-        seen: Dict[str, CorrectionCandidate] = {}
+                    if new_text not in beam and num_new_corrections < new_texts.get(
+                        new_text, max_corrections + 1
+                    ):
+                        new_texts[new_text] = num_new_corrections
 
-        for candidate in candidates:
-            if candidate.name not in seen:
-                seen[candidate.name] = candidate
-            else:
-                # Keep the one with fewer corrections
-                if candidate.num_corrections < seen[candidate.name].num_corrections:
-                    seen[candidate.name] = candidate
+            room = self.config.beam_width - len(beam)
+            if room > 0 and new_texts:
+                beam.update(heapq.nsmallest(room, new_texts.items(), key=itemgetter(1)))
 
-        return list(seen.values())
+        return list(candidates.values())
 
     def _validate_candidates_batch(
         self,
@@ -274,34 +384,27 @@ class ChemNameCorrector:
         if not validator:
             return
 
-        all_candidate_names = []
-        original_name_candidate_name_map = {}
-        candidate_name_candidate_object_map = {}
-        for original_name, candidates_list in candidates.items():
-            original_name_candidate_name_map[original_name] = [
-                candidate.name for candidate in candidates_list
-            ]
-            candidate_name_candidate_object_map.update(
-                {candidate.name: candidate for candidate in candidates_list}
-            )
-            all_candidate_names.extend(
-                [candidate.name for candidate in candidates_list]
-            )
+        # Different names can share candidate texts, so each text is validated once
+        # and the result applied to every candidate object with that text
+        candidates_by_name: Dict[str, List[CorrectionCandidate]] = {}
+        for candidates_list in candidates.values():
+            for candidate in candidates_list:
+                candidates_by_name.setdefault(candidate.name, []).append(candidate)
 
-        validator_outputs = validator.batch_validate(all_candidate_names)
+        validator_outputs = validator.batch_validate(list(candidates_by_name))
 
         for candidate_name, (is_valid, result) in validator_outputs.items():
-            candidate = candidate_name_candidate_object_map[candidate_name]
-            candidate.validated = True
-            candidate.validation_result = result
+            for candidate in candidates_by_name[candidate_name]:
+                candidate.validated = True
+                candidate.validation_result = result
 
-            if is_valid:
-                # Boost score for valid candidates
-                candidate.score = min(1.0, candidate.score + 0.3)
+                if is_valid:
+                    # Boost score for valid candidates
+                    candidate.score = min(1.0, candidate.score + 0.3)
 
-            else:
-                # Lower score for invalid candidates
-                candidate.score = max(0.0, candidate.score - 0.2)
+                else:
+                    # Lower score for invalid candidates
+                    candidate.score = max(0.0, candidate.score - 0.2)
 
         return
 
@@ -359,3 +462,19 @@ class ChemNameCorrector:
             lines.append(f"Validated: {candidate.validation_result or 'No result'}")
 
         return "\n".join(lines)
+
+
+# Corrector used by a worker process, set when the worker starts
+_worker_corrector: Optional[ChemNameCorrector] = None
+
+
+def _init_correction_worker(corrector: ChemNameCorrector) -> None:
+    """Store the corrector a worker process uses for the names it is sent."""
+    global _worker_corrector
+    _worker_corrector = corrector
+
+
+def _rank_candidates_in_worker(name: str) -> List[CorrectionCandidate]:
+    """Rank correction candidates for a name in a worker process."""
+    assert _worker_corrector is not None, "Worker corrector should be initialized"
+    return _worker_corrector._rank_candidates(name)
@@ -1,4 +1,9 @@
-PATTERNS = [
+import re
+from typing import List, Tuple
+
+# (compiled pattern, replacement, description) for common OCR errors in locants.
+# Compiled once here, since they are searched on every scored candidate.
+PATTERNS: List[Tuple[re.Pattern, str, str]] = [
     # =================================================================
     # 1. CHARACTER SUBSTITUTION (l/I -> 1, O -> 0)
     # =================================================================
@@ -7,20 +12,20 @@ PATTERNS = [
     # Followed by: digit, separator, Space, Indicated Hydrogen (H), or Stereochem (R/S)
     # Example: "l, 2-", "(lS, 2R)", "lH-indole"
     (
-        r"(?<![a-zA-Z])[lI](?=\s*(?:[,\-\d]|H\b|[RS]\b))",
+        re.compile(r"(?<![a-zA-Z])[lI](?=\s*(?:[,\-\d]|H\b|[RS]\b))"),
         "1",
         "Locant: 'l/I' → '1'",
     ),
     # CASE: 'O' acting as '0'
     # Look for: O surrounded by digits or separators
     # Example: "2O,3-"
-    (r"(?<=[\d,])O(?=[\d,\-])", "0", "Locant: 'O' → '0'"),
+    (re.compile(r"(?<=[\d,])O(?=[\d,\-])"), "0", "Locant: 'O' → '0'"),
     (
         # Pattern: Matches 'Z' only when surrounded by hyphens,
         # and preceded specifically by lowercase letters or digits.
         # Matches: "pyrid-Z-yl", "onyloxy-Z-(", "3-Z-chloro"
         # Ignores: "(Z)-2-", "N-Z-glycine"
-        r"(?<=[a-z0-9]-)Z(?=-)",
+        re.compile(r"(?<=[a-z0-9]-)Z(?=-)"),
         "2",
         "Locant: 'Z' → '2' (e.g., 'pyrid-Z-yl')",
     ),
@@ -33,7 +38,7 @@ PATTERNS = [
     # Note: We use negative lookahead (?!.*]) strictly if you deal with Bicyclo[2.2.2]
     # but for general names, this pattern is usually safe.
     (
-        r"(?<=[\dRS])\.(?=\s*\d)(?![^\[]*\])",
+        re.compile(r"(?<=[\dRS])\.(?=\s*\d)(?![^\[]*\])"),
         ",",
         "Locant: '.' → ',' (ignoring [x.y.z] descriptors)",
     ),
@@ -45,7 +50,9 @@ PATTERNS = [
     # it is almost certainly a list of positions, not carbon #12.
     # Example: "12-dichlorobenzene" -> "1,2-dichlorobenzene"
     (
-        r"(?<!\d)(\d)(\d)\s*-(?=\s*(?:di|tri|tetra|penta|hexa|bis|tris|tetrakis))",
+        re.compile(
+            r"(?<!\d)(\d)(\d)\s*-(?=\s*(?:di|tri|tetra|penta|hexa|bis|tris|tetrakis))"
+        ),
         r"\1,\2-",
         "Locant: Insert missing comma '12-di' → '1,2-di'",
     ),
@@ -54,5 +61,5 @@ PATTERNS = [
     # =================================================================
     # CASE: Cleanup spaces inside locants
     # Example: "1, 2-di" -> "1,2-di"
-    (r"(?<=,)\s+(?=[\dRS])", "", "Locant: Remove space after comma"),
+    (re.compile(r"(?<=,)\s+(?=[\dRS])"), "", "Locant: Remove space after comma"),
 ]
@@ -4,7 +4,7 @@ import json
 import os
 import re
 from pathlib import Path
-from typing import ClassVar, Dict, List, Optional
+from typing import ClassVar, Dict, Iterable, List, Optional, Tuple
 
 from flashtext import KeywordProcessor
 from Levenshtein import ratio as levenshtein_ratio
@@ -43,6 +43,14 @@ class ChemicalNameScorer:
         "number_of_regex_matches": 0.20,
     }
 
+    # Bracket characters, and the open/close pairs they form
+    BRACKET_PATTERN: ClassVar[re.Pattern] = re.compile(r"[()\[\]{}]")
+    BRACKET_PAIRS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("(", ")"),
+        ("[", "]"),
+        ("{", "}"),
+    )
+
     def __init__(self, config: Optional[CorrectorConfig] = None):
         """
         Initialize the scorer.
@@ -52,6 +60,9 @@ class ChemicalNameScorer:
         """
         self.config = config or CorrectorConfig()
 
+        # Counts for the original name of the candidates being scored, which are
+        # usually scored in runs sharing the same original name
+        self.original_name: Optional[str] = None
         self.original_name_num_morphemes: Optional[int] = None
         self.original_name_num_regex_matches: Optional[int] = None
         self.keyword_processor: Optional[KeywordProcessor] = None
@@ -86,12 +97,11 @@ class ChemicalNameScorer:
             The same candidate with updated score and score_components
         """
         components: Dict[str, float] = {}
-        if not self.original_name_num_morphemes:
+        if candidate.original_name != self.original_name:
+            self.original_name = candidate.original_name
             self.original_name_num_morphemes = self._get_number_of_chemical_morphemes(
                 candidate.original_name
             )
-
-        if not self.original_name_num_regex_matches:
             self.original_name_num_regex_matches = self._get_number_of_regex_matches(
                 candidate.original_name
             )
@@ -120,9 +130,6 @@ class ChemicalNameScorer:
         candidate.score = total_score
         candidate.score_components = components
 
-        self.original_name_num_regex_matches = None
-        self.original_name_num_morphemes = None
-
         return candidate
 
     def _get_number_of_chemical_morphemes(self, name: str) -> int:
@@ -160,9 +167,7 @@ class ChemicalNameScorer:
         """
         Get the number of regex matches in the name.
         """
-        num_regex_matches = sum(
-            1 for pattern, _, _ in PATTERNS if re.search(pattern, name)
-        )
+        num_regex_matches = sum(1 for pattern, _, _ in PATTERNS if pattern.search(name))
 
         if not num_regex_matches:
             return 0
@@ -192,22 +197,23 @@ class ChemicalNameScorer:
 
         Returns 1.0 if all brackets are balanced, 0.0 if severely unbalanced.
         """
-        bracket_pairs = [("(", ")"), ("[", "]"), ("{", "}")]
-        total_imbalance = 0
+        # Only the brackets themselves matter, and most names have few or none
+        brackets = self.BRACKET_PATTERN.findall(name)
+        if not brackets:
+            return 1.0
 
-        for open_b, close_b in bracket_pairs:
-            open_count = name.count(open_b)
-            close_count = name.count(close_b)
-            total_imbalance += abs(open_count - close_count)
+        total_imbalance = 0
+        for open_b, close_b in self.BRACKET_PAIRS:
+            total_imbalance += abs(brackets.count(open_b) - brackets.count(close_b))
 
         # Also check for proper nesting
-        if not self._check_bracket_nesting(name):
+        if not self._check_bracket_nesting(brackets):
             total_imbalance += 2
 
         # Convert imbalance to score (0-1)
         return max(0.0, 1.0 - (total_imbalance * 0.25))
 
-    def _check_bracket_nesting(self, name: str) -> bool:
+    def _check_bracket_nesting(self, name: Iterable[str]) -> bool:
         """Check if brackets are properly nested."""
         stack = []
         bracket_map = {")": "(", "]": "[", "}": "{"}
@@ -1,4 +1,10 @@
-from typing import Dict, List, Tuple
+import os
+import re
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import product
+from typing import Dict, Iterable, List, Tuple
 
 from cholla_chem.utils.constants import (
     AA_FULL,
@@ -17,25 +23,20 @@ from cholla_chem.utils.constants import (
 
 def generate_side_chain_protections() -> Dict[str, Tuple[str, str]]:
     """Generate the complete side chain protections dictionary"""
-    protections = {}
-
-    # Generate standard combinations
-    for aa_code, (aa_name, site) in AA_FULL.items():
-        for pg_code, pg_name in PROTECTING_GROUPS.items():
-            key = f"{aa_code}({pg_code})"
-
-            # Handle special formatting for different types
-            if pg_code.startswith("o"):  # Ester forms
-                value = f"{site}-{pg_name}"
-            elif aa_code in ["asp", "glu"] and not pg_code.startswith("o"):
-                # For asp/glu without 'o' prefix, assume ester
-                value = f"{site}-{pg_name} ester"
-            elif aa_code == "met" and pg_code == "o":
-                value = f"{site}-{pg_name}"
-            else:
-                value = f"{site}-{pg_name}"
-
-            protections[key] = (aa_name, value)
+    # Every amino acid/protecting group combination. asp and glu side chains are
+    # carboxylic acids, so groups not already written as esters ("o" codes) are
+    # named as esters.
+    protections = {
+        f"{aa_code}({pg_code})": (
+            aa_name,
+            f"{site}-{pg_name} ester"
+            if aa_code in ("asp", "glu") and not pg_code.startswith("o")
+            else f"{site}-{pg_name}",
+        )
+        for (aa_code, (aa_name, site)), (pg_code, pg_name) in product(
+            AA_FULL.items(), PROTECTING_GROUPS.items()
+        )
+    }
 
     # Add special cases
     protections.update(SPECIAL_CASES)
@@ -46,6 +47,52 @@ def generate_side_chain_protections() -> Dict[str, Tuple[str, str]]:
 # Generate the complete dictionary
 SIDE_CHAIN_PROTECTIONS = generate_side_chain_protections()
 
+# A cyclic peptide wrapped in matching brackets, e.g. cyclo(...), cyclo-[...]
+CYCLO_PATTERN = re.compile(
+    r"cyclo-?(?:\((.*)\)|\[(.*)\]|\{(.*)\})", re.IGNORECASE | re.DOTALL
+)
+
+# Standalone stereochemistry tokens, mapped to the text used when no residue follows
+# them and the prefix applied to the residue that does
+STEREO_MARKERS: Dict[str, Tuple[str, str]] = {
+    "d": ("d", "d-"),
+    "(d)": ("d", "d-"),
+    "l": ("l", "l-"),
+    "(l)": ("l", "l-"),
+    "dl": ("d/l", "dl-"),
+    "(dl)": ("d/l", "dl-"),
+    "(d/l)": ("d/l", "dl-"),
+    "d/l": ("d/l", "dl-"),
+    "d,l": ("d/l", "dl-"),
+    "(d,l)": ("d/l", "dl-"),
+}
+
+# Stereochemistry markers written directly before a residue, and their prefixes
+ATTACHED_STEREO_MARKERS = (("(d)", "d-"), ("(l)", "l-"), ("(d/l)", "(d/l)-"))
+
+# Prefix modifiers, longest first so parenthesized forms are tried before bare ones
+PREFIX_MAP_BY_LENGTH = sorted(
+    PREFIX_MAP.items(), key=lambda item: len(item[0]), reverse=True
+)
+
+# Full amino acid name to its -yl form in AA_FULL. Where several codes share a name
+# (e.g. leu/leuc), the entry for the first one listed is kept.
+AA_YL_FORMS = {aa_name: yl_name for aa_name, yl_name in reversed(AA_FULL.values())}
+
+
+# Fewest unique shorthands worth spreading over a worker pool. Each conversion takes
+# microseconds, so smaller batches are faster in-process than the pool start-up.
+PEPTIDE_BATCH_MIN_PARALLEL = 10_000
+
+# Shorthands sent to a worker per task, to amortize inter-process communication
+PEPTIDE_BATCH_CHUNK_SIZE = 256
+
+# A string whose parentheses are balanced and never nested
+SINGLE_LEVEL_PARENS_PATTERN = re.compile(r"[^()]*(?:\([^()]*\)[^()]*)*")
+
+# A hyphen that is not inside a (single-level) parenthesized group
+TOKEN_SEPARATOR_PATTERN = re.compile(r"-(?![^()]*\))")
+
 
 def split_peptide_shorthand(shorthand: str) -> List[str]:
     """
@@ -59,27 +106,35 @@ def split_peptide_shorthand(shorthand: str) -> List[str]:
     Returns:
         List of tokens
     """
+    shorthand = shorthand.strip()
+
+    # Without parentheses every hyphen is a separator, so str.split does all the work
+    if "(" not in shorthand and ")" not in shorthand:
+        return [token for token in shorthand.split("-") if token]
+
+    # With balanced, unnested parentheses a hyphen is inside a group exactly when
+    # the next parenthesis after it is a closing one
+    if SINGLE_LEVEL_PARENS_PATTERN.fullmatch(shorthand):
+        return [token for token in TOKEN_SEPARATOR_PATTERN.split(shorthand) if token]
+
+    # Nested or unbalanced parentheses: track the depth character by character
     tokens = []
-    current_token = ""
+    start = 0
     paren_depth = 0
 
-    for char in shorthand.strip():
+    for i, char in enumerate(shorthand):
         if char == "(":
             paren_depth += 1
-            current_token += char
         elif char == ")":
             paren_depth -= 1
-            current_token += char
         elif char == "-" and paren_depth == 0:
             # Split here - we're not inside parentheses
-            if current_token:
-                tokens.append(current_token)
-                current_token = ""
-        else:
-            current_token += char
+            if i > start:
+                tokens.append(shorthand[start:i])
+            start = i + 1
 
-    if current_token:
-        tokens.append(current_token)
+    if start < len(shorthand):
+        tokens.append(shorthand[start:])
 
     return tokens
 
@@ -95,9 +150,9 @@ def parse_protected_residue(token: str) -> Tuple[str, str] | Tuple[None, None]:
         tuple: (base_aa, protection) or (None, None) if the token cannot be parsed.
     """
     if "(" in token and token.endswith(")"):
-        if token.lower() in SIDE_CHAIN_PROTECTIONS:
-            base_aa, protection = SIDE_CHAIN_PROTECTIONS[token.lower()]
-            return base_aa, protection
+        token_lower = token.lower()
+        if token_lower in SIDE_CHAIN_PROTECTIONS:
+            return SIDE_CHAIN_PROTECTIONS[token_lower]
         else:
             # Try to parse manually
             base = token.split("(")[0]
@@ -120,7 +175,7 @@ def extract_prefix_modifier(token: str) -> Tuple[str, str, str] | Tuple[None, st
     token_lower = token.lower().strip().replace(" ", "")
 
     # Check for parenthesized prefixes first (longer matches)
-    for prefix, full_name in sorted(PREFIX_MAP.items(), key=len, reverse=True):
+    for prefix, full_name in PREFIX_MAP_BY_LENGTH:
         if token_lower.startswith(prefix):
             remaining = token[len(prefix) :]
             remaining_lower = remaining.lower().strip().replace(" ", "")
@@ -129,7 +184,7 @@ def extract_prefix_modifier(token: str) -> Tuple[str, str, str] | Tuple[None, st
             if remaining_lower in AA_FULL:
                 return full_name, remaining, remaining_lower
 
-    return None, token, token.lower().strip().replace(" ", "")
+    return None, token, token_lower
 
 
 def process_amino_acid_token(
@@ -147,16 +202,14 @@ def process_amino_acid_token(
     Returns:
         str: The IUPAC name of the amino acid.
     """
-    next_token_lower_stripped = next_token.lower().strip().replace(" ", "")
-
     # Handle Greek letter prefix
     greek_prefix = None
     if next_token and next_token[0] in GREEK_LETTERS:
         greek_prefix = next_token[0]
         next_token = next_token[1:]
-        next_token_lower_stripped = next_token.lower().strip().replace(" ", "")
 
-    # Handle prefix modifiers (methyl, acetyl, etc.)
+    # Handle prefix modifiers (methyl, acetyl, etc.). This also returns the
+    # normalized (lowercased, space-free) form of the remaining token.
     prefix_modifier, next_token, next_token_lower_stripped = extract_prefix_modifier(
         next_token
     )
@@ -174,15 +227,9 @@ def process_amino_acid_token(
             base = base_aa
         else:
             # Convert to -yl form
-            base_key = None
-            for key, val in AA_FULL.items():
-                if val == base_aa:
-                    base_key = key
-                    break
-            if base_key and base_key.lower().strip().replace(" ", "") in AA_FULL:
-                base = AA_FULL[base_key.lower().strip().replace(" ", "")][1]
-            else:
-                base = base_aa.replace("ine", "yl").replace("ic acid", "yl")
+            base = AA_YL_FORMS.get(base_aa) or base_aa.replace("ine", "yl").replace(
+                "ic acid", "yl"
+            )
 
         # Add stereochemistry prefix (not for glycine)
         if not base_aa.startswith("glycine"):
@@ -203,6 +250,17 @@ def process_amino_acid_token(
         return f"{stereo_prefix}{next_token}"
 
 
+# Names of residues written as a bare AA_FULL code with the default l- stereochemistry,
+# as (intermediate -yl form, final residue form), so common tokens skip the parse
+PLAIN_RESIDUE_NAMES: Dict[str, Tuple[str, str]] = {
+    aa_code: (
+        process_amino_acid_token(aa_code, is_last=False, is_cyclic=False),
+        process_amino_acid_token(aa_code, is_last=True, is_cyclic=False),
+    )
+    for aa_code in AA_FULL
+}
+
+
 def peptide_shorthand_to_iupac(shorthand: str) -> str:
     """
     Converts a peptide shorthand into its IUPAC name.
@@ -211,63 +269,66 @@ def peptide_shorthand_to_iupac(shorthand: str) -> str:
     checking if it's a cyclic peptide. If not cyclic, it removes any counter acid
     suffixes (if present) and processes the shorthand as a regular peptide.
 
+    Results are memoized on the whitespace-stripped shorthand, so repeated shorthands
+    within a process are only parsed once.
+
     Parameters:
         shorthand (str): The peptide shorthand to process
 
     Returns:
         str: The IUPAC name of the peptide
     """
-    shorthand = shorthand.strip()
+    return _peptide_shorthand_to_iupac(shorthand.strip())
+
+
+@lru_cache(maxsize=65_536)
+def _peptide_shorthand_to_iupac(shorthand: str) -> str:
+    """Convert a stripped peptide shorthand. Exceptions propagate, so they are never cached."""
     shorthand = shorthand.strip("-")
     shorthand = shorthand.replace("--", "-")
 
     # Check if it's a cyclic peptide
     is_cyclic = False
-    cyclic_patterns = [
-        ("cyclo(", ")", 6, -1),
-        ("cyclo[", "]", 6, -1),
-        ("cyclo-(", ")", 7, -1),
-        ("cyclo-[", "]", 7, -1),
-        ("cyclo-{", "}", 7, -1),
-    ]
-
-    for start_pattern, end_pattern, start_idx, end_idx in cyclic_patterns:
-        if shorthand.lower().startswith(start_pattern) and shorthand.endswith(
-            end_pattern
-        ):
-            is_cyclic = True
-            shorthand = shorthand[start_idx:end_idx].strip()
-            break
-
-    if not is_cyclic and shorthand.lower().startswith("cyclo"):
+    cyclo_match = CYCLO_PATTERN.fullmatch(shorthand)
+    if cyclo_match:
+        is_cyclic = True
+        shorthand = cyclo_match.group(cyclo_match.lastindex or 0).strip()
+    elif shorthand.lower().startswith("cyclo"):
         is_cyclic = True
         shorthand = shorthand[5:].strip()
 
-    items_to_remove = []
+    # Counter acid salts, e.g. "Ala-Gly.TFA". The acid is only removed from the
+    # shorthand when exactly one of the two parts is a counter acid.
     counter_acid_suffix = None
-    if len(shorthand.split(".")) == 2:
-        for item in shorthand.split("."):
-            if item.lower().strip().replace(" ", "") in COUNTER_ACIDS:
-                counter_acid_suffix = COUNTER_ACIDS[
-                    item.lower().strip().replace(" ", "")
-                ]
-                items_to_remove.append(item)
-        if len(items_to_remove) == 1:
-            new_shorthand_split = shorthand.split(".")
-            new_shorthand_split.remove(items_to_remove[0])
-            shorthand = ".".join(new_shorthand_split)
+    salt_parts = shorthand.split(".")
+    if len(salt_parts) == 2:
+        first_acid, second_acid = [
+            COUNTER_ACIDS.get(part.lower().strip().replace(" ", ""))
+            for part in salt_parts
+        ]
+        if second_acid is not None:
+            counter_acid_suffix = second_acid
+            if first_acid is None:
+                shorthand = salt_parts[0]
+        elif first_acid is not None:
+            counter_acid_suffix = first_acid
+            shorthand = salt_parts[1]
 
     tokens = split_peptide_shorthand(shorthand.strip())
 
-    # N-cap
-    prefix = ""
-    if tokens and tokens[0].lower() in N_CAPS:
-        prefix = N_CAPS[tokens.pop(0).lower()]
+    # N-cap. Some caps (e.g. H-) map to an empty string, so test against None.
+    prefix = N_CAPS.get(tokens[0].lower()) if tokens else None
+    if prefix is not None:
+        del tokens[0]
+    else:
+        prefix = ""
 
     # C-cap
-    suffix = ""
-    if tokens and tokens[-1].lower() in C_CAPS:
-        suffix = C_CAPS[tokens.pop().lower()]
+    suffix = C_CAPS.get(tokens[-1].lower()) if tokens else None
+    if suffix is not None:
+        del tokens[-1]
+    else:
+        suffix = ""
 
     if not tokens:
         raise ValueError("No residues found")
@@ -284,44 +345,30 @@ def peptide_shorthand_to_iupac(shorthand: str) -> str:
         if is_cyclic:
             is_last = False  # Treat all as intermediate residues
 
-        # Check if this token is a stereochemistry indicator
-        if t_lower_stripped in ["d", "(d)"]:
+        # Check if this token is a stereochemistry indicator for the next residue
+        stereo = STEREO_MARKERS.get(t_lower_stripped)
+        if stereo:
+            marker, stereo_prefix = stereo
             i += 1
             if i >= len(tokens):
-                parts.append("d")
+                parts.append(marker)
                 break
             is_last = i == len(tokens) - 1
-            parts.append(process_amino_acid_token(tokens[i], is_last, is_cyclic, "d-"))
-
-        elif t_lower_stripped in ["l", "(l)"]:
-            i += 1
-            if i >= len(tokens):
-                parts.append("l")
-                break
-            is_last = i == len(tokens) - 1
-            parts.append(process_amino_acid_token(tokens[i], is_last, is_cyclic, "l-"))
-
-        elif t_lower_stripped in ["dl", "(dl)", "(d/l)", "d/l", "d,l", "(d,l)"]:
-            i += 1
-            if i >= len(tokens):
-                parts.append("d/l")
-                break
-            is_last = i == len(tokens) - 1
-            parts.append(process_amino_acid_token(tokens[i], is_last, is_cyclic, "dl-"))
-
+            parts.append(
+                process_amino_acid_token(tokens[i], is_last, is_cyclic, stereo_prefix)
+            )
+        elif t_lower_stripped in PLAIN_RESIDUE_NAMES:
+            parts.append(PLAIN_RESIDUE_NAMES[t_lower_stripped][is_last])
         else:
-            # Regular token (not preceded by d or l)
-            if t_lower_stripped.startswith(("(d)")):
-                base_prefix = "d-"
-                t = t[3:]
-            elif t_lower_stripped.startswith(("(l)")):
-                base_prefix = "l-"
-                t = t[3:]
-            elif t_lower_stripped.startswith(("(d/l)")):
-                base_prefix = "(d/l)-"
-                t = t[5:]
-            else:
-                base_prefix = "l-"
+            # Regular token (not preceded by d or l), possibly with an attached
+            # stereochemistry marker such as "(D)Ala"
+            base_prefix = "l-"
+            if t_lower_stripped.startswith("("):
+                for marker, stereo_prefix in ATTACHED_STEREO_MARKERS:
+                    if t_lower_stripped.startswith(marker):
+                        base_prefix = stereo_prefix
+                        t = t[len(marker) :]
+                        break
             parts.append(process_amino_acid_token(t, is_last, is_cyclic, base_prefix))
         i += 1
 
@@ -361,3 +408,65 @@ def looks_like_peptide_shorthand(potential_peptide: str) -> bool:
         if f"-{k}-" in potential_peptide.lower():
             return True
     return False
+
+
+def _try_peptide_shorthand_to_iupac(shorthand: str) -> str:
+    """Convert a peptide shorthand, returning an empty string if it can't be parsed."""
+    try:
+        return peptide_shorthand_to_iupac(shorthand)
+    except Exception:
+        return ""
+
+
+def _gil_disabled() -> bool:
+    """Return True when running on a free-threaded build with the GIL disabled."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def peptide_shorthands_to_iupac(
+    shorthands: Iterable[str], max_workers: int | None = None
+) -> Dict[str, str]:
+    """
+    Convert a batch of peptide shorthands into their IUPAC names.
+
+    Duplicate shorthands are only converted once. Large batches are spread over a
+    pool of workers: threads on free-threaded Python builds, where the module's
+    lookup tables can be shared without locking, and processes otherwise.
+
+    Args:
+        shorthands (Iterable[str]): The peptide shorthands to convert.
+        max_workers (int | None): Maximum number of workers. Defaults to the number of
+            CPUs. Pass 1 to always convert in-process.
+
+    Returns:
+        Dict[str, str]: A dictionary mapping each shorthand to its IUPAC name.
+            Shorthands that could not be converted are omitted.
+    """
+    unique_shorthands = list(dict.fromkeys(shorthands))
+    n_workers = max(1, min(max_workers or os.cpu_count() or 1, len(unique_shorthands)))
+
+    if n_workers == 1 or len(unique_shorthands) < PEPTIDE_BATCH_MIN_PARALLEL:
+        iupac_names: Iterable[str] = map(
+            _try_peptide_shorthand_to_iupac, unique_shorthands
+        )
+    else:
+        executor: Executor
+        if _gil_disabled():
+            executor = ThreadPoolExecutor(max_workers=n_workers)
+        else:
+            executor = ProcessPoolExecutor(max_workers=n_workers)
+        with executor:
+            iupac_names = list(
+                executor.map(
+                    _try_peptide_shorthand_to_iupac,
+                    unique_shorthands,
+                    chunksize=PEPTIDE_BATCH_CHUNK_SIZE,
+                )
+            )
+
+    return {
+        shorthand: iupac_name
+        for shorthand, iupac_name in zip(unique_shorthands, iupac_names)
+        if iupac_name
+    }
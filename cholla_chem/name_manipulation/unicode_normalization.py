@@ -15,8 +15,8 @@ def normalize_unicode_and_return_mapping(
     Returns:
         Tuple[List[str], Dict[str, str]]: A tuple containing the list of cleaned strings and a dictionary mapping the original strings to their cleaned versions.
     """
-    cleaned_compounds_list = [clean_strings(ele) for ele in compounds_list]
     cleaned_compounds_dict = {
-        k: v for k, v in zip(compounds_list, cleaned_compounds_list)
+        ele: clean_strings(ele) for ele in dict.fromkeys(compounds_list)
     }
+    cleaned_compounds_list = [cleaned_compounds_dict[ele] for ele in compounds_list]
     return cleaned_compounds_list, cleaned_compounds_dict
@@ -1,45 +1,131 @@
-from typing import Dict, List
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
 
+import requests
 from chemspipy import ChemSpider
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from cholla_chem.utils.logging_config import logger
 from cholla_chem.utils.string_utils import filter_latin1_compatible
 
+CHEMSPIDER_MAX_WORKERS = 16
+CHEMSPIDER_MAX_REQUESTS_PER_SECOND = 5.0
+
+_rate_limit_lock = threading.Lock()
+_next_request_time = 0.0
+
+
+def _wait_for_rate_limit() -> None:
+    """Block until another ChemSpider request may be started without exceeding the rate limit."""
+    global _next_request_time
+    with _rate_limit_lock:
+        now = time.monotonic()
+        start_time = max(now, _next_request_time)
+        _next_request_time = start_time + 1.0 / CHEMSPIDER_MAX_REQUESTS_PER_SECOND
+    if start_time > now:
+        time.sleep(start_time - now)
+
+
+@lru_cache(maxsize=None)
+def _get_chemspider_client(chemspider_api_key: str) -> ChemSpider:
+    """
+    Return a ChemSpider client for the given API key, reused across calls.
+
+    The client's HTTP session is given a connection pool large enough for the worker
+    threads, and retries transient failures with backoff.
+    """
+    cs = ChemSpider(chemspider_api_key)
+    session = getattr(cs, "http", None)
+    if isinstance(session, requests.Session):
+        adapter = HTTPAdapter(
+            pool_connections=CHEMSPIDER_MAX_WORKERS,
+            pool_maxsize=CHEMSPIDER_MAX_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        session.mount("https://", adapter)
+    return cs
+
+
+@lru_cache(maxsize=100_000)
+def _search_chemspider_smiles(chemspider_api_key: str, compound_name: str) -> str:
+    """
+    Search ChemSpider for a compound name and return the SMILES of the top hit.
+
+    Exceptions propagate, so failed requests are never cached. ChemSpiPy stores
+    search errors on the results by default, so they are re-raised from `wait()`.
+    """
+    _wait_for_rate_limit()
+    results = _get_chemspider_client(chemspider_api_key).search(
+        compound_name, raise_errors=True
+    )
+    results.wait()
+    if len(results) == 0:
+        return ""
+    return results[0].smiles or ""
+
 
 def name_to_smiles_chemspipy(
     compound_name_list: List[str],
     chemspider_api_key: str,
+    max_workers: int = CHEMSPIDER_MAX_WORKERS,
+    failed_names: Optional[Set[str]] = None,
 ) -> Dict[str, str]:
     """
     Convert chemical names to SMILES using ChemSpiPy.
 
+    Searches are issued concurrently from a thread pool sharing one HTTP session, and
+    are rate limited to CHEMSPIDER_MAX_REQUESTS_PER_SECOND. Duplicate names (after NFC
+    normalization) are only queried once, and results are memoized per API key for
+    the lifetime of the process.
+
     Args:
         compound_name_list (List[str]): List of compound names to convert to SMILES.
         chemspider_api_key (str): ChemSpider API key (https://developer.rsc.org/getting-started)
+        max_workers (int): Maximum number of concurrent ChemSpider requests.
+        failed_names (Set[str], optional): If given, names whose search raised an
+            error (rather than finding no match) are added to this set.
 
     Returns:
         Dict[str, str]: Dictionary of compound names to SMILES.
     """
     try:
-        cs = ChemSpider(chemspider_api_key)
+        _get_chemspider_client(chemspider_api_key)
     except Exception as e:
         logger.warning(f"Error initializing ChemSpiPy: {e}")
+        if failed_names is not None:
+            failed_names.update(compound_name_list)
         return {}
 
-    chemspipy_name_dict = {}
-    for compound_name in filter_latin1_compatible(compound_name_list):
+    query_names = {
+        compound_name: unicodedata.normalize("NFC", compound_name)
+        for compound_name in filter_latin1_compatible(compound_name_list)
+    }
+    unique_queries = list(dict.fromkeys(query_names.values()))
+    if not unique_queries:
+        return {}
+
+    def _query(query_name: str) -> Optional[str]:
         try:
-            results = cs.search(compound_name)
-            results.wait()
-            results.ready()
-            if len(results) == 0:
-                continue
-            c = results[0]
-            if not c.smiles:
-                continue
-            chemspipy_name_dict[compound_name] = c.smiles
+            return _search_chemspider_smiles(chemspider_api_key, query_name)
         except Exception as e:
             logger.warning(f"Error with ChemSpiPy query: {e}")
-            continue
+            return None
+
+    n_workers = max(1, min(max_workers, len(unique_queries)))
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        query_results = dict(zip(unique_queries, executor.map(_query, unique_queries)))
+
+    chemspipy_name_dict = {}
+    for compound_name, query_name in query_names.items():
+        smiles = query_results[query_name]
+        if smiles:
+            chemspipy_name_dict[compound_name] = smiles
+        elif smiles is None and failed_names is not None:
+            failed_names.add(compound_name)
 
     return chemspipy_name_dict
@@ -1,14 +1,41 @@
-from typing import Dict, List
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
+from urllib.error import HTTPError
 
 import cirpy
 
 from cholla_chem.utils.logging_config import logger
 
+CIRPY_MAX_WORKERS = 32
+
+# HTTP status CIR answers with when it cannot resolve a name
+CIR_NOT_FOUND_STATUS = 404
+
+
+@lru_cache(maxsize=100_000)
+def _resolve_cirpy_smiles(compound_name: str) -> str:
+    """
+    Query CIRpy for a SMILES string, returning "" if CIR has no match.
+
+    Other exceptions propagate, so they are never cached.
+    """
+    try:
+        return cirpy.resolve(compound_name, "smiles") or ""
+    except HTTPError as e:
+        if e.code == CIR_NOT_FOUND_STATUS:
+            return ""
+        raise
+
 
 def retrieve_cirpy_results(compound_name: str) -> str:
     """
     Retrieves the SMILES string for a given compound identifier using CIRpy.
 
+    Results are memoized on the NFC-normalized name, so repeated queries within a
+    process share a single HTTP request.
+
     Args:
         compound_name (str): The compound name.
 
@@ -16,7 +43,7 @@ def retrieve_cirpy_results(compound_name: str) -> str:
         str: The SMILES string of the compound, or an empty string if an exception occurs.
     """
     try:
-        smiles = cirpy.resolve(compound_name, "smiles")
+        smiles = _resolve_cirpy_smiles(unicodedata.normalize("NFC", compound_name))
 
     except Exception as e:
         logger.warning(f"Exception with CIRpy query: {str(e)}")
@@ -25,19 +52,52 @@ def retrieve_cirpy_results(compound_name: str) -> str:
     return smiles
 
 
-def name_to_smiles_cirpy(compound_name_list: List[str]) -> Dict[str, str]:
+def name_to_smiles_cirpy(
+    compound_name_list: List[str],
+    max_workers: int = CIRPY_MAX_WORKERS,
+    failed_names: Optional[Set[str]] = None,
+) -> Dict[str, str]:
     """
     Converts a list of chemical names to their corresponding SMILES strings using CIRpy.
 
+    Lookups are network-bound, so they are issued concurrently from a thread pool.
+    Duplicate names (after NFC normalization) are only queried once.
+
     Args:
         compound_name_list (List[str]): A list of chemical names to be converted.
+        max_workers (int): Maximum number of concurrent CIRpy requests.
+        failed_names (Set[str], optional): If given, names whose lookup raised an
+            error (rather than finding no match) are added to this set.
 
     Returns:
         Dict[str, str]: A dictionary mapping each chemical name to its SMILES string.
     """
+    if not compound_name_list:
+        return {}
+
+    def _query(query_name: str) -> Optional[str]:
+        """Return the SMILES for a name, "" if CIRpy has none, or None on error."""
+        try:
+            return _resolve_cirpy_smiles(query_name)
+        except Exception as e:
+            logger.warning(f"Exception with CIRpy query: {str(e)}")
+            return None
+
+    query_names = {
+        compound_name: unicodedata.normalize("NFC", compound_name)
+        for compound_name in compound_name_list
+    }
+    unique_queries = list(dict.fromkeys(query_names.values()))
+
+    n_workers = max(1, min(max_workers, len(unique_queries)))
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        query_results = dict(zip(unique_queries, executor.map(_query, unique_queries)))
+
     cirpy_name_dict = {}
-    for compound_name in compound_name_list:
-        result = retrieve_cirpy_results(compound_name)
+    for compound_name, query_name in query_names.items():
+        result = query_results[query_name]
         if result:
             cirpy_name_dict[compound_name] = result
+        elif result is None and failed_names is not None:
+            failed_names.add(compound_name)
     return cirpy_name_dict
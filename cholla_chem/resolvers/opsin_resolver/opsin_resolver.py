@@ -1,9 +1,20 @@
-import os
+import atexit
+import re
 import subprocess
-import tempfile
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
 from importlib import resources
-from typing import Dict, Iterator, List, Sequence, Tuple, TypedDict, Union
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from cholla_chem.utils.logging_config import logger
 
@@ -14,25 +25,38 @@ except ImportError:
     from typing_extensions import Literal
 
 
+# Only split on the line separators OPSIN emits. str.splitlines() would also split on
+# characters like U+2028 that can appear in echoed names, misaligning the outputs.
+LINE_BREAK_PATTERN = re.compile(r"\r?\n")
+
+# Prompt OPSIN writes to stderr before reading names from stdin
+OPSIN_STDIN_PROMPT = "Run the jar using the -h flag for help."
+
+
 class OpsinResult(TypedDict):
     outputs: List[str]
     errors: List[str]
     returncode: int
 
 
+OPSIN_JAR_NAME = "opsin-cli-2.9.0-jar-with-dependencies.jar"
+
+# Keeps the resolved jar path alive (e.g. an extracted copy from a zipped install)
+# until interpreter exit.
+_jar_path_stack = ExitStack()
+atexit.register(_jar_path_stack.close)
+
+
+@lru_cache(maxsize=None)
+def _resolve_opsin_jar_path() -> str:
+    """Resolve the packaged OPSIN jar to a filesystem path once per process."""
+    jar_resource = resources.files("cholla_chem.datafiles").joinpath(OPSIN_JAR_NAME)
+    return str(_jar_path_stack.enter_context(resources.as_file(jar_resource)))
+
+
 @contextmanager
 def opsin_jar_path() -> Iterator[str]:
-    jar_name = "opsin-cli-2.9.0-jar-with-dependencies.jar"
-
-    try:
-        # py >= 3.9
-        jar_resource = resources.files("cholla_chem.datafiles").joinpath(jar_name)
-        with resources.as_file(jar_resource) as jar_path:
-            yield str(jar_path)
-    except Exception:
-        # py < 3.9 fallback
-        with resources.path("cholla_chem.datafiles", jar_name) as jar_path:
-            yield str(jar_path)
+    yield _resolve_opsin_jar_path()
 
 
 def run_opsin(
@@ -55,7 +79,7 @@ def run_opsin(
 
     Args:
         chemical_name (Union[str, Sequence[str]]): A single chemical name, or a sequence of names. Each name is
-            sanitized by stripping newline characters before being written to a temporary input file.
+            sanitized by stripping newline characters before being piped to OPSIN's stdin.
         output_format (Literal["SMILES", "ExtendedSMILES", "InChI", "StdInChI", "StdInChIKey"]): The OPSIN
             output format to request.
         allow_acid (bool): If True, enable OPSIN's acid interpretation mode.
@@ -76,7 +100,7 @@ def run_opsin(
     Note:
         This function shells out to `java -jar <opsin-cli-...jar>` and therefore requires Java to be available on
         the system PATH.
-        The input is passed via a temporary file and the file is removed in a `finally` block.
+        The names are piped to OPSIN's stdin, one per line, so no temporary file is written.
         OPSIN emits per-input failures as blank lines in stdout; this function aligns those blank outputs with
         corresponding stderr lines.
         If an unexpected exception occurs while running OPSIN, an `OpsinResult` is returned with empty outputs and
@@ -104,29 +128,22 @@ def run_opsin(
 
         sanitized_names = [s.replace("\n", "") for s in names]
 
-        tmp_fpath = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".txt", delete=False, encoding="utf-8"
-            ) as f:
-                tmp_fpath = f.name
-                f.write("\n".join(sanitized_names) + "\n")
-
-            if allow_acid:
-                arg_list.append("-a")
-            if allow_radicals:
-                arg_list.append("-r")
-            if allow_bad_stereo:
-                arg_list.append("-s")
-            if wildcard_radicals:
-                arg_list.append("-w")
-            if failure_analysis:
-                arg_list.append("-detailedFailureAnalysis")
-
-            arg_list.append(tmp_fpath)
+        if allow_acid:
+            arg_list.append("-a")
+        if allow_radicals:
+            arg_list.append("-r")
+        if allow_bad_stereo:
+            arg_list.append("-s")
+        if wildcard_radicals:
+            arg_list.append("-w")
+        if failure_analysis:
+            arg_list.append("-detailedFailureAnalysis")
 
+        try:
+            # With no input file argument, OPSIN reads names from stdin
             result = subprocess.run(
                 arg_list,
+                input="\n".join(sanitized_names) + "\n",
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
@@ -134,26 +151,21 @@ def run_opsin(
                 errors="replace",
             )
 
-            stdout_lines = (result.stdout or "").replace("\r", "").split("\n")
-            stderr_lines = (result.stderr or "").replace("\r", "").split("\n")
+            stdout_lines = LINE_BREAK_PATTERN.split(result.stdout or "")
+            stderr_lines = LINE_BREAK_PATTERN.split(result.stderr or "")
 
             if stdout_lines and stdout_lines[-1] == "":
                 stdout_lines = stdout_lines[:-1]
             if stderr_lines and stderr_lines[-1] == "":
                 stderr_lines = stderr_lines[:-1]
+            if stderr_lines and stderr_lines[0].startswith(OPSIN_STDIN_PROMPT):
+                stderr_lines = stderr_lines[1:]
 
             outputs = stdout_lines
 
-            errors: List[str] = []
-            err_i = 0
-            for out in outputs:
-                if out != "":
-                    errors.append("")
-                else:
-                    errors.append(
-                        stderr_lines[err_i] if err_i < len(stderr_lines) else ""
-                    )
-                    err_i += 1
+            # OPSIN writes one stderr line per failed (blank) output, in input order
+            stderr_iter = iter(stderr_lines)
+            errors = ["" if out else next(stderr_iter, "") for out in outputs]
 
             if len(outputs) != len(sanitized_names):
                 logger.warning(
@@ -185,13 +197,6 @@ def run_opsin(
                     returncode=1,
                 )
 
-        finally:
-            if tmp_fpath is not None:
-                try:
-                    os.remove(tmp_fpath)
-                except FileNotFoundError:
-                    pass
-
 
 def name_to_smiles_opsin(
     compound_name_list: List[str],
@@ -199,6 +204,7 @@ def name_to_smiles_opsin(
     allow_radicals: bool = True,
     allow_bad_stereo: bool = False,
     wildcard_radicals: bool = False,
+    failed_names: Optional[Set[str]] = None,
 ) -> Tuple[Dict[str, str], Dict[str, str]]:
     """
     Convert a list of chemical names to their corresponding SMILES representations using OPSIN.
@@ -209,6 +215,9 @@ def name_to_smiles_opsin(
     allow_radicals (bool): If True, enable radical interpretation.
     allow_bad_stereo (bool): If True, allow OPSIN to ignore uninterpretable stereochem.
     wildcard_radicals (bool): If True, output radicals as wildcards.
+    failed_names (Set[str], optional): If given, names OPSIN could not be run on (e.g.
+        because Java failed), as opposed to names it could not interpret, are added
+        to this set.
 
     Returns:
     Tuple[Dict[str, str], Dict[str, str]]:
@@ -222,13 +231,15 @@ def name_to_smiles_opsin(
     opsin_name_dict: Dict[str, str] = {}
     failure_message_dict: Dict[str, str] = {}
 
-    # Strip newlines to prevent CLI parsing issues
-    sanitized_names = [
-        compound_name.replace("\n", "") for compound_name in compound_name_list
-    ]
+    # Strip newlines to prevent CLI parsing issues, and only send each name once
+    sanitized_names = {
+        compound_name: compound_name.replace("\n", "")
+        for compound_name in compound_name_list
+    }
+    unique_names = list(dict.fromkeys(sanitized_names.values()))
 
     result = run_opsin(
-        chemical_name=sanitized_names,
+        chemical_name=unique_names,
         output_format="SMILES",
         failure_analysis=True,
         allow_acid=allow_acid,
@@ -240,22 +251,27 @@ def name_to_smiles_opsin(
     smiles_strings = result["outputs"]
     failure_messages = result["errors"]
 
-    if len(smiles_strings) != len(compound_name_list) or len(failure_messages) != len(
-        compound_name_list
+    if len(smiles_strings) != len(unique_names) or len(failure_messages) != len(
+        unique_names
     ):
         logger.warning(
             f"Mismatching lengths: "
             f"smiles_strings ({len(smiles_strings)}), "
-            f"compound_name_list ({len(compound_name_list)}), "
+            f"unique_names ({len(unique_names)}), "
             f"failure_messages ({len(failure_messages)})"
         )
+        if failed_names is not None:
+            failed_names.update(compound_name_list)
         return {}, {}
 
-    for compound_name, smiles, msg in zip(
-        compound_name_list, smiles_strings, failure_messages
-    ):
+    results_by_name = dict(zip(unique_names, zip(smiles_strings, failure_messages)))
+    for compound_name, sanitized_name in sanitized_names.items():
+        smiles, msg = results_by_name[sanitized_name]
         if smiles:
             opsin_name_dict[compound_name] = smiles
+        elif result["returncode"] != 0 and failed_names is not None:
+            # OPSIN exits 0 when it only failed to interpret some names
+            failed_names.add(compound_name)
         if msg:
             failure_message_dict[compound_name] = msg
 
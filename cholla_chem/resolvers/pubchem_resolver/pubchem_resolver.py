@@ -1,38 +1,48 @@
 from __future__ import annotations
 
-import json
-import os
+import gzip
 import ssl
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote
-from urllib.request import urlopen
+from urllib.request import Request, urlopen
 
+from cholla_chem.resolvers.pubchem_resolver.pubchem_utils import (
+    API_BASE,
+    CA_FILE,
+    json_loads,
+)
 from cholla_chem.utils.logging_config import logger
 from cholla_chem.utils.string_utils import filter_latin1_compatible
 
-_CA_FILE = os.getenv("PUBCHEMPY_CA_BUNDLE") or os.getenv("REQUESTS_CA_BUNDLE")
-if not _CA_FILE:
-    try:
-        import certifi
+# HTTP status PubChem answers with when it has no compound for a name
+PUBCHEM_NOT_FOUND_STATUS = 404
 
-        _CA_FILE = certifi.where()
-    except ImportError:
-        _CA_FILE = None
 
-API_BASE = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
+@lru_cache(maxsize=None)
+def _get_ssl_context() -> ssl.SSLContext:
+    """
+    Return an SSL context for PubChem requests, built once per process.
+
+    Loading the CA bundle takes milliseconds, which would otherwise be paid on every
+    request. A client-side context is safe to share between threads.
+    """
+    return ssl.create_default_context(cafile=CA_FILE)
 
 
 def request_smiles_by_name(compound_name: str, timeout: int = 15) -> bytes:
     """
     Request the canonical SMILES for a single compound name from PubChem.
 
+    The response is requested gzip-compressed and decompressed transparently.
+
     Args:
         compound_name (str): Compound name to resolve.
         timeout (int): Timeout in seconds for the HTTP request.
 
     Returns:
-        bytes: Raw response body from the PubChem PUG REST API.
+        bytes: Decompressed response body from the PubChem PUG REST API.
 
     Raises:
         ValueError: If `compound_name` is empty.
@@ -43,34 +53,34 @@ def request_smiles_by_name(compound_name: str, timeout: int = 15) -> bytes:
 
     encoded_name = quote(compound_name, safe="")
     api_url = f"{API_BASE}/compound/name/{encoded_name}/property/SMILES/JSON"
-    context = ssl.create_default_context(cafile=_CA_FILE)
-
+    req = Request(api_url, headers={"Accept-Encoding": "gzip"})
     try:
-        with urlopen(api_url, timeout=timeout, context=context) as response:
-            return response.read()
+        with urlopen(req, timeout=timeout, context=_get_ssl_context()) as response:
+            body = response.read()
+            if response.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            return body
     except HTTPError as e:
         raise Exception(f"HTTP Error {e.code}: {e.msg}") from e
     except URLError as e:
         raise Exception(f"URL Error: {e.reason}") from e
 
 
-def get_smiles_by_name(compound_name: str) -> str:
+def _query_smiles_by_name(compound_name: str) -> str:
     """
     Resolve a single compound name to a canonical SMILES string.
 
-    Args:
-        compound_name (str): Compound name to resolve.
-
-    Returns:
-        str: The resolved canonical SMILES string, or an empty string if resolution
-            fails or no SMILES is available.
+    Returns an empty string if PubChem has no compound, or no SMILES, for the name.
+    Any other request or parsing error is raised.
     """
     try:
         response = request_smiles_by_name(compound_name)
-        payload: Dict[str, Any] = json.loads(response.decode())
     except Exception as e:
-        logger.info(e)
-        return ""
+        cause = e.__cause__
+        if isinstance(cause, HTTPError) and cause.code == PUBCHEM_NOT_FOUND_STATUS:
+            return ""
+        raise
+    payload: Dict[str, Any] = json_loads(response)
 
     property_table = payload.get("PropertyTable", {})
     properties = property_table.get("Properties", [])
@@ -85,30 +95,51 @@ def get_smiles_by_name(compound_name: str) -> str:
     return smiles
 
 
-def name_to_smiles_pubchem(compound_name_list: List[str]) -> Dict[str, str]:
+def get_smiles_by_name(compound_name: str) -> str:
+    """
+    Resolve a single compound name to a canonical SMILES string.
+
+    Args:
+        compound_name (str): Compound name to resolve.
+
+    Returns:
+        str: The resolved canonical SMILES string, or an empty string if resolution
+            fails or no SMILES is available.
+    """
+    try:
+        return _query_smiles_by_name(compound_name)
+    except Exception as e:
+        logger.info(e)
+        return ""
+
+
+def name_to_smiles_pubchem(
+    compound_name_list: List[str], failed_names: Optional[Set[str]] = None
+) -> Dict[str, str]:
     """
     Convert chemical names to SMILES using PubChem PUG REST single-name lookups.
 
     Args:
         compound_name_list (List[str]): List of compound names to convert to SMILES.
+        failed_names (Set[str], optional): If given, names whose lookup raised an
+            error (rather than finding no match) are added to this set.
 
     Returns:
         Dict[str, str]: Dictionary of compound names to SMILES.
     """
-    filtered_compound_name_list = filter_latin1_compatible(compound_name_list)
-    if not filtered_compound_name_list:
+    # Only query each name once
+    unique_names = list(dict.fromkeys(filter_latin1_compatible(compound_name_list)))
+    if not unique_names:
         return {}
 
     pubchem_name_dict: Dict[str, str] = {}
-    for compound_name in filtered_compound_name_list:
-        pubchem_name_dict[compound_name] = get_smiles_by_name(compound_name)
-
-    if len(filtered_compound_name_list) != len(pubchem_name_dict):
-        logger.warning(
-            f"Mismatching lengths: "
-            f"filtered_compound_name_list ({len(filtered_compound_name_list)}), "
-            f"pubchem_name_dict ({len(pubchem_name_dict)})"
-        )
-        return {}
+    for compound_name in unique_names:
+        try:
+            pubchem_name_dict[compound_name] = _query_smiles_by_name(compound_name)
+        except Exception as e:
+            logger.info(e)
+            pubchem_name_dict[compound_name] = ""
+            if failed_names is not None:
+                failed_names.add(compound_name)
 
     return pubchem_name_dict
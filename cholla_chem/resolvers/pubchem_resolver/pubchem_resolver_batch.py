@@ -1,43 +1,151 @@
 from __future__ import annotations
 
-import json
-import os
-import ssl
+import atexit
+import csv
+import io
+import random
 import time
 import xml.etree.ElementTree as ET
-from http.client import HTTPResponse
-from typing import Any, Dict, List, Optional
-from urllib.error import HTTPError
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import quote, urlencode
-from urllib.request import Request, urlopen
+from xml.sax.saxutils import escape as xml_escape
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from cholla_chem.resolvers.pubchem_resolver.pubchem_utils import (
+    API_BASE,
+    CA_FILE,
+    json_loads,
+)
 from cholla_chem.utils.logging_config import logger
 from cholla_chem.utils.string_utils import filter_latin1_compatible
 
-# Get SSL certs from env var or certifi package if available.
-_CA_FILE = os.getenv("PUBCHEMPY_CA_BUNDLE") or os.getenv("REQUESTS_CA_BUNDLE")
-if not _CA_FILE:
-    try:
-        import certifi
-
-        _CA_FILE = certifi.where()
-    except ImportError:
-        _CA_FILE = None
-
 # Dummy values for instances where pubchem fails to return a result
 # Selected to be a valid but exceedingly rare CID and SMILES
 DUMMY_CID = "58965162"
 DUMMY_SMILES = "[22CH4]"
 
-# Base URL for the PubChem PUG REST API.
-API_BASE = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
-
 # URL for batch identifier exchange service
 PUBCHEM_PUG_URL = "https://pubchem.ncbi.nlm.nih.gov/pug/pug.cgi"
 
 # Type alias for URL query parameters.
 QueryParam = str | int | float | bool | list[str] | None
 
+# Namespaces whose list identifiers are first exchanged for CIDs in bulk
+_BATCH_CID_NAMESPACES = frozenset({"name", "smiles", "inchi", "inchikey"})
+
+# Namespaces whose identifier goes in the URL path rather than the POST body
+_URL_ID_NAMESPACES = frozenset({"listkey", "formula", "sourceid"})
+
+# Static parts of the ID exchange request XML, which wrap the identifier list
+_ID_EXCHANGE_XML_PROLOGUE = (
+    "<PCT-Data><PCT-Data_input><PCT-InputData>"
+    "<PCT-InputData_query><PCT-Query><PCT-Query_type><PCT-QueryType>"
+    "<PCT-QueryType_id-exchange><PCT-QueryIDExchange>"
+    "<PCT-QueryIDExchange_input><PCT-QueryUids>"
+)
+_ID_EXCHANGE_XML_EPILOGUE = (
+    "</PCT-QueryUids></PCT-QueryIDExchange_input>"
+    '<PCT-QueryIDExchange_operation-type value="same" />'
+    '<PCT-QueryIDExchange_output-type value="cid" />'
+    '<PCT-QueryIDExchange_output-method value="file-pair" />'
+    '<PCT-QueryIDExchange_compression value="none" />'
+    "</PCT-QueryIDExchange></PCT-QueryType_id-exchange>"
+    "</PCT-QueryType></PCT-Query_type></PCT-Query></PCT-InputData_query>"
+    "</PCT-InputData></PCT-Data_input></PCT-Data>"
+)
+
+# Element holding the identifier list for each identifier type
+_QUERY_UIDS_TAGS = {
+    "name": "PCT-QueryUids_synonyms",
+    "smiles": "PCT-QueryUids_smiles",
+    "inchi": "PCT-QueryUids_inchis",
+    "inchikey": "PCT-QueryUids_inchi-keys",
+}
+
+_STATUS_REQUEST_XML = (
+    "<PCT-Data><PCT-Data_input><PCT-InputData>"
+    "<PCT-InputData_request><PCT-Request>"
+    "<PCT-Request_reqid>{req_id}</PCT-Request_reqid>"
+    '<PCT-Request_type value="status" />'
+    "</PCT-Request></PCT-InputData_request>"
+    "</PCT-InputData></PCT-Data_input></PCT-Data>"
+)
+
+# Polling schedule for ID exchange jobs: initial wait, growth factor, and max wait (s)
+PUBCHEM_POLL_INITIAL_INTERVAL = 0.5
+PUBCHEM_POLL_BACKOFF = 1.5
+PUBCHEM_POLL_MAX_INTERVAL = 15.0
+
+# Max pooled keep-alive connections per host for the shared session
+PUBCHEM_POOL_MAXSIZE = 32
+
+# Max ID exchange jobs submitted and polled at once, to stay within PubChem's
+# limit of 5 requests per second
+PUBCHEM_MAX_CONCURRENT_JOBS = 5
+
+# Retries for throttled (429/503) or otherwise transiently failing requests, with
+# exponential backoff that honours PubChem's Retry-After header
+PUBCHEM_RETRY = Retry(
+    total=5,
+    backoff_factor=1.0,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET", "POST"),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Shared HTTP session, so repeated PubChem calls (e.g. status polling) reuse
+# keep-alive connections instead of doing a new TCP + TLS handshake per request.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=PUBCHEM_POOL_MAXSIZE,
+        max_retries=PUBCHEM_RETRY,
+    ),
+)
+if CA_FILE:
+    _SESSION.verify = CA_FILE
+
+
+def close_session() -> None:
+    """Close the shared PubChem HTTP session and its pooled connections."""
+    _SESSION.close()
+
+
+atexit.register(close_session)
+
+
+def _raise_for_status(response: requests.Response) -> None:
+    """Raise an exception if the response has an HTTP error status."""
+    if not response.ok:
+        raise Exception(f"HTTP Error {response.status_code}: {response.reason}")
+
+
+@lru_cache(maxsize=128)
+def _api_url_parts(
+    domain: str,
+    searchtype: str | None,
+    namespace: str,
+    operation: str | None,
+    output: str,
+) -> Tuple[str, str]:
+    """
+    Return the parts of an API URL before and after the identifier segment.
+
+    Only a handful of distinct combinations are used, so the joined strings are
+    cached rather than rebuilt for every request.
+    """
+    prefix = "/".join(filter(None, [API_BASE, domain, searchtype, namespace]))
+    suffix = "/".join(filter(None, [operation, output]))
+    return prefix, suffix
+
 
 def request(
     identifier: str | int | List[str] | List[int] | List[str | int],
@@ -47,7 +155,7 @@ def request(
     output: str = "JSON",
     searchtype: str | None = None,
     **kwargs: QueryParam,
-) -> HTTPResponse:
+) -> requests.Response:
     """
     Construct API request from parameters and return the response.
 
@@ -59,12 +167,7 @@ def request(
     if isinstance(identifier, int):
         identifier = str(identifier)
     # If identifier is a list and in specified namespace, batch retrieve cids, then join with commas into string
-    if not isinstance(identifier, str) and namespace in [
-        "name",
-        "smiles",
-        "inchi",
-        "inchikey",
-    ]:
+    if not isinstance(identifier, str) and namespace in _BATCH_CID_NAMESPACES:
         id_list = [str(x) for x in identifier]
         cid_list = batch_retrieve_cids(id_list, namespace)
         identifier = ",".join(cid_list)
@@ -73,33 +176,34 @@ def request(
     elif not isinstance(identifier, str):
         identifier = ",".join(str(x) for x in identifier)
     # Filter None values from kwargs
-    kwargs = {k: v for k, v in kwargs.items() if v is not None}
+    if kwargs:
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
     # Build API URL
     urlid, postdata = None, None
     if namespace == "sourceid":
         identifier = identifier.replace("/", ".")
     if (
-        namespace in ["listkey", "formula", "sourceid"]
+        namespace in _URL_ID_NAMESPACES
         or searchtype == "xref"
         or (searchtype and namespace == "cid")
         or domain == "sources"
     ):
         urlid = quote(identifier.encode("utf8"))
     else:
-        postdata = urlencode([(namespace, identifier)]).encode("utf8")
-    comps = filter(
-        None, [API_BASE, domain, searchtype, namespace, urlid, operation, output]
-    )
-    apiurl = "/".join(comps)
+        postdata = {namespace: identifier}
+    prefix, suffix = _api_url_parts(domain, searchtype, namespace, operation, output)
+    apiurl = f"{prefix}/{urlid}" if urlid else prefix
+    if suffix:
+        apiurl += f"/{suffix}"
     if kwargs:
         apiurl += f"?{urlencode(kwargs)}"
     # Make request
-    try:
-        context = ssl.create_default_context(cafile=_CA_FILE)
-        response = urlopen(apiurl, postdata, context=context)
-        return response
-    except HTTPError as e:
-        raise Exception(f"HTTP Error {e.code}: {e.msg}") from e
+    if postdata is None:
+        response = _SESSION.get(apiurl)
+    else:
+        response = _SESSION.post(apiurl, data=postdata)
+    _raise_for_status(response)
+    return response
 
 
 def get(
@@ -117,8 +221,8 @@ def get(
     if (searchtype and searchtype != "xref") or namespace in ["formula"]:
         response = request(
             identifier, namespace, domain, None, "JSON", searchtype, **kwargs
-        ).read()
-        status = json.loads(response.decode())
+        ).content
+        status = json_loads(response)
         if "Waiting" in status and "ListKey" in status["Waiting"]:
             identifier = status["Waiting"]["ListKey"]
             namespace = "listkey"
@@ -132,9 +236,9 @@ def get(
                     output="JSON",
                     searchtype=None,
                     **kwargs,
-                ).read()
+                ).content
 
-                status = json.loads(response.decode())
+                status = json_loads(response)
             if not output == "JSON":
                 response = request(
                     identifier,
@@ -144,26 +248,91 @@ def get(
                     output,
                     searchtype,
                     **kwargs,
-                ).read()
+                ).content
     else:
         response = request(
             identifier, namespace, domain, operation, output, searchtype, **kwargs
-        ).read()
+        ).content
     return response
 
 
+def _find_first(root: ET.Element, tag: str) -> Optional[ET.Element]:
+    """
+    Return the first element named `tag` in the tree, or None.
+
+    Equivalent to root.find(f".//{tag}"), but Element.iter() filters in C rather than
+    going through the ElementPath evaluator on every call.
+    """
+    return next(root.iter(tag), None)
+
+
+def _submit_cid_request(chunk: List[str], namespace: str) -> Optional[str]:
+    """
+    Submits one ID exchange job for a chunk of identifiers and returns its request
+    ID, or None if PubChem did not accept the job.
+    """
+    # Create and send the batch request
+    xml_request = create_batch_cid_request_xml(chunk, namespace)
+    initial_response = send_xml_to_pug(xml_request)
+
+    # Extract request ID
+    root = ET.fromstring(initial_response)
+    req_id_elem = _find_first(root, "PCT-Waiting_reqid")
+
+    if req_id_elem is None:
+        # Check for immediate error in response
+        status_elem = _find_first(root, "PCT-Status")
+        if status_elem is not None and status_elem.get("value") == "error":
+            error_message_elem = _find_first(root, "PCT-Status-Message_message")
+            error_message = (
+                error_message_elem.text
+                if error_message_elem is not None
+                and error_message_elem.text is not None
+                else "Unknown error"
+            )
+            logger.warning(f"Error retrieving CIDs from PubChem: {error_message}")
+        return None
+
+    return req_id_elem.text or None
+
+
+def _download_chunk_cids(chunk: List[str], download_url: Optional[str]) -> List[str]:
+    """
+    Downloads the CID file of a finished job and returns the CIDs in chunk order
+    (DUMMY_CID where no CID was found).
+    """
+    if download_url is None:
+        return [DUMMY_CID] * len(chunk)
+
+    # Download and parse CID file
+    file_content = download_file_from_pug(download_url)
+    identifier_to_cid = parse_cid_file(file_content)
+
+    if not identifier_to_cid:
+        return [DUMMY_CID] * len(chunk)
+
+    # Fetch CIDs
+    return [identifier_to_cid.get(identifier, DUMMY_CID) for identifier in chunk]
+
+
 def batch_retrieve_cids(
     identifiers: List[str],
     namespace: str = "name",
     chunk_size: int = 1000,
-    check_interval: int = 3,
+    check_interval: float = PUBCHEM_POLL_INITIAL_INTERVAL,
     timeout: int = 120,
+    max_workers: int = PUBCHEM_MAX_CONCURRENT_JOBS,
 ) -> List[str]:
     """
     Retrieves cids from PubChem in batches.
 
     This is the main function for batch retrieval. It chunks the input identifiers,
     submits batch requests, polls for completion, and returns aggregated results.
+    Chunks are independent jobs: up to `max_workers` of them are submitted and
+    downloaded concurrently, and all outstanding jobs are polled from a single loop.
+    Duplicate identifiers are only submitted once. In the cid namespace, numeric
+    identifiers are returned as-is without being submitted; in every other namespace
+    they are looked up like any other identifier (e.g. a name that is a number).
     """
 
     # Validate chunk size
@@ -171,62 +340,58 @@ def batch_retrieve_cids(
         chunk_size = 1000
         logger.warning("Chunk size limited to 1000")
 
-    # Process in chunks
-    cids = []
-    for i in range(0, len(identifiers), chunk_size):
-        chunk = identifiers[i : i + chunk_size]
-
-        # Create and send the batch request
-        xml_request = create_batch_cid_request_xml(chunk, namespace)
-        initial_response = send_xml_to_pug(xml_request)
-
-        # Extract request ID
-        root = ET.fromstring(initial_response)
-        req_id_elem = root.find(".//PCT-Waiting_reqid")
-
-        if req_id_elem is None:
-            # Check for immediate error in response
-            error_elem = root.find(".//PCT-Status[@value='error']")
-            if error_elem is not None:
-                error_message_elem = root.find(".//PCT-Status-Message_message")
-                error_message = (
-                    error_message_elem.text
-                    if error_message_elem is not None
-                    and error_message_elem.text is not None
-                    else "Unknown error"
-                )
-                logger.warning(f"Error retrieving CIDs from PubChem: {error_message}")
-
-            cids.extend([DUMMY_CID] * len(chunk))
-            continue
-
-        req_id = req_id_elem.text
-        if not req_id:
-            cids.extend([DUMMY_CID] * len(chunk))
-            continue
+    unique_identifiers = list(dict.fromkeys(identifiers))
+    # Identifiers that are already CIDs need no ID exchange
+    identifier_to_cid = (
+        {
+            identifier: str(int(identifier))
+            for identifier in unique_identifiers
+            if identifier.isascii() and identifier.isdigit()
+        }
+        if namespace.lower() == "cid"
+        else {}
+    )
+    lookup_identifiers = [
+        identifier
+        for identifier in unique_identifiers
+        if identifier not in identifier_to_cid
+    ]
+    chunks = [
+        lookup_identifiers[i : i + chunk_size]
+        for i in range(0, len(lookup_identifiers), chunk_size)
+    ]
+    if not chunks:
+        return [identifier_to_cid[identifier] for identifier in identifiers]
+
+    n_workers = max(1, min(max_workers, len(chunks)))
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        req_ids = list(
+            executor.map(lambda chunk: _submit_cid_request(chunk, namespace), chunks)
+        )
 
         # Poll for completion
-        download_url = poll_request_status(req_id, check_interval, timeout)
-
-        if download_url is None:
-            cids.extend([DUMMY_CID] * len(chunk))
-            continue
-
-        # Download and parse CID file
-        file_content = download_file_from_pug(download_url)
-        identifier_to_cid = parse_cid_file(file_content)
-
-        if not identifier_to_cid:
-            cids.extend([DUMMY_CID] * len(chunk))
-            continue
+        submitted_req_ids = [req_id for req_id in req_ids if req_id is not None]
+        download_urls = (
+            poll_request_statuses(submitted_req_ids, check_interval, timeout)
+            if submitted_req_ids
+            else {}
+        )
 
-        # Fetch CIDs
-        chunk_cids = [
-            identifier_to_cid.get(identifier, DUMMY_CID) for identifier in chunk
-        ]
-        cids.extend(chunk_cids)
+        chunk_results = executor.map(
+            lambda chunk, req_id: _download_chunk_cids(
+                chunk, download_urls.get(req_id) if req_id is not None else None
+            ),
+            chunks,
+            req_ids,
+        )
+        identifier_to_cid.update(
+            zip(
+                lookup_identifiers,
+                (cid for chunk_cids in chunk_results for cid in chunk_cids),
+            )
+        )
 
-    return cids
+    return [identifier_to_cid.get(identifier, DUMMY_CID) for identifier in identifiers]
 
 
 def send_xml_to_pug(xml_data: str) -> str:
@@ -235,15 +400,9 @@ def send_xml_to_pug(xml_data: str) -> str:
     """
     headers = {"Content-Type": "application/xml"}
     data = xml_data.encode("utf-8")
-    req = Request(PUBCHEM_PUG_URL, data=data, headers=headers, method="POST")
-    context = ssl.create_default_context(cafile=_CA_FILE)
-
-    try:
-        with urlopen(req, timeout=30, context=context) as resp:
-            body = resp.read()
-            return body.decode("utf-8", errors="replace")
-    except HTTPError as e:
-        raise Exception(f"HTTP Error {e.code}: {e.msg}") from e
+    resp = _SESSION.post(PUBCHEM_PUG_URL, data=data, headers=headers, timeout=30)
+    _raise_for_status(resp)
+    return resp.content.decode("utf-8", errors="replace")
 
 
 def create_batch_cid_request_xml(
@@ -253,163 +412,153 @@ def create_batch_cid_request_xml(
     """
     Creates the initial XML request for batch property retrieval using ID exchange.
     """
-    root = ET.Element("PCT-Data")
-    input_data = ET.SubElement(root, "PCT-Data_input")
-    input_data = ET.SubElement(input_data, "PCT-InputData")
-
-    # Query section
-    query = ET.SubElement(input_data, "PCT-InputData_query")
-    query = ET.SubElement(query, "PCT-Query")
-    query_type = ET.SubElement(query, "PCT-Query_type")
-    query_type = ET.SubElement(query_type, "PCT-QueryType")
-
-    # ID exchange section
-    id_exchange = ET.SubElement(query_type, "PCT-QueryType_id-exchange")
-    id_exchange = ET.SubElement(id_exchange, "PCT-QueryIDExchange")
-
-    # Input section with identifiers
-    input_elem = ET.SubElement(id_exchange, "PCT-QueryIDExchange_input")
-    query_uids = ET.SubElement(input_elem, "PCT-QueryUids")
-
-    # Add identifiers based on type
-    if identifier_type.lower() == "name":
-        name_elem = ET.SubElement(query_uids, "PCT-QueryUids_synonyms")
-        for identifier in identifiers:
-            ET.SubElement(name_elem, "PCT-QueryUids_synonyms_E").text = str(identifier)
-    elif identifier_type.lower() == "smiles":
-        smiles_elem = ET.SubElement(query_uids, "PCT-QueryUids_smiles")
-        for identifier in identifiers:
-            ET.SubElement(smiles_elem, "PCT-QueryUids_smiles_E").text = str(identifier)
-    elif identifier_type.lower() == "inchi":
-        inchi_elem = ET.SubElement(query_uids, "PCT-QueryUids_inchis")
-        for identifier in identifiers:
-            ET.SubElement(inchi_elem, "PCT-QueryUids_inchis_E").text = str(identifier)
-    elif identifier_type.lower() == "inchikey":
-        inchikey_elem = ET.SubElement(query_uids, "PCT-QueryUids_inchi-keys")
-        for identifier in identifiers:
-            ET.SubElement(inchikey_elem, "PCT-QueryUids_inchi-keys_E").text = str(
-                identifier
-            )
-    else:
-        # Default to synonyms for other types
-        synonyms = ET.SubElement(query_uids, "PCT-QueryUids_synonyms")
-        for identifier in identifiers:
-            ET.SubElement(synonyms, "PCT-QueryUids_synonyms_E").text = str(identifier)
-
-    # Operation and output settings
-    ET.SubElement(id_exchange, "PCT-QueryIDExchange_operation-type").set(
-        "value", "same"
+    # Default to synonyms for other types
+    tag = _QUERY_UIDS_TAGS.get(identifier_type.lower(), "PCT-QueryUids_synonyms")
+    items = "".join(
+        f"<{tag}_E>{xml_escape(str(identifier))}</{tag}_E>"
+        for identifier in identifiers
     )
-    ET.SubElement(id_exchange, "PCT-QueryIDExchange_output-type").set("value", "cid")
-    ET.SubElement(id_exchange, "PCT-QueryIDExchange_output-method").set(
-        "value", "file-pair"
+    return (
+        f"{_ID_EXCHANGE_XML_PROLOGUE}<{tag}>{items}</{tag}>{_ID_EXCHANGE_XML_EPILOGUE}"
     )
-    ET.SubElement(id_exchange, "PCT-QueryIDExchange_compression").set("value", "none")
-
-    return ET.tostring(root, encoding="unicode")
 
 
 def create_status_request_xml(req_id: str) -> str:
     """
     Creates the XML request to check the status of a previously submitted request.
     """
-    root = ET.Element("PCT-Data")
-    input_data = ET.SubElement(root, "PCT-Data_input")
-    input_data = ET.SubElement(input_data, "PCT-InputData")
-    request = ET.SubElement(input_data, "PCT-InputData_request")
-    request = ET.SubElement(request, "PCT-Request")
-    ET.SubElement(request, "PCT-Request_reqid").text = req_id
-    ET.SubElement(request, "PCT-Request_type").set("value", "status")
-
-    return ET.tostring(root, encoding="unicode")
+    return _STATUS_REQUEST_XML.format(req_id=xml_escape(req_id))
 
 
-def download_file_from_pug(url: str) -> str:
+def download_file_from_pug(url: str) -> bytes:
     """
-    Downloads a file from the given URL.
+    Downloads a file from the given URL and returns its raw contents.
     """
     # Convert FTP to HTTPS if needed
     https_url = url.replace("ftp://", "https://")
-    req = Request(https_url, method="GET")
-    context = ssl.create_default_context(cafile=_CA_FILE)
-
-    try:
-        with urlopen(req, timeout=60, context=context) as resp:
-            body = resp.read()
-            return body.decode("utf-8", errors="replace")
-    except HTTPError as e:
-        raise Exception(f"HTTP Error {e.code}: {e.msg}") from e
+    resp = _SESSION.get(https_url, timeout=60)
+    _raise_for_status(resp)
+    return resp.content
 
 
-def poll_request_status(
-    req_id: str, check_interval: int = 3, timeout: int = 120
-) -> Optional[str]:
+def _check_request_status(status_xml: str) -> Tuple[bool, Optional[str]]:
     """
-    Polls PubChem for request completion and returns the download URL.
+    Checks the status of one submitted request.
+
+    Returns:
+        Tuple[bool, Optional[str]]: Whether the request is finished, and its
+            download URL if it finished successfully.
     """
-    start_time = time.time()
+    try:
+        status_response = send_xml_to_pug(status_xml)
+    except Exception:
+        return True, None
 
-    while time.time() - start_time < timeout:
-        status_xml = create_status_request_xml(req_id)
+    root = ET.fromstring(status_response)
+    status_elem = _find_first(root, "PCT-Status")
 
-        try:
-            status_response = send_xml_to_pug(status_xml)
-        except Exception:
-            return None
+    if status_elem is None:
+        return True, None
+
+    status = status_elem.attrib.get("value", "unknown")
+
+    if status == "success":
+        download_url_elem = _find_first(root, "PCT-Download-URL_url")
+        if download_url_elem is not None:
+            return True, download_url_elem.text
+        else:
+            return True, None
 
-        root = ET.fromstring(status_response)
-        status_elem = root.find(".//PCT-Status")
+    elif status == "error":
+        error_elem = _find_first(root, "PCT-Status-Message_message")
+        error_message = error_elem.text if error_elem is not None else "Unknown error"
+        logger.warning(f"Error retrieving CIDs from PubChem: {error_message}")
+        return True, None
 
-        if status_elem is None:
-            return None
+    # Still queued/running (or an unknown status)
+    return False, None
 
-        status = status_elem.attrib.get("value", "unknown")
 
-        if status == "success":
-            download_url_elem = root.find(".//PCT-Download-URL_url")
-            if download_url_elem is not None:
-                return download_url_elem.text
+def poll_request_statuses(
+    req_ids: List[str],
+    check_interval: float = PUBCHEM_POLL_INITIAL_INTERVAL,
+    timeout: int = 120,
+    max_interval: float = PUBCHEM_POLL_MAX_INTERVAL,
+) -> Dict[str, Optional[str]]:
+    """
+    Polls PubChem for completion of several requests from a single loop, and returns
+    a mapping of each request ID to its download URL (None if it failed or timed out).
+
+    Each round checks every outstanding request, then waits. The wait starts at
+    `check_interval` seconds, so fast jobs return quickly, and grows exponentially up
+    to `max_interval`. Each wait gets up to 50% random jitter so that separate
+    pollers don't stay in phase.
+    """
+    start_time = time.time()
+    status_xmls = {req_id: create_status_request_xml(req_id) for req_id in req_ids}
+    download_urls: Dict[str, Optional[str]] = {}
+    pending = list(status_xmls)
+    delay = check_interval
+
+    while pending and time.time() - start_time < timeout:
+        still_pending = []
+        for req_id in pending:
+            finished, download_url = _check_request_status(status_xmls[req_id])
+            if finished:
+                download_urls[req_id] = download_url
             else:
-                return None
+                still_pending.append(req_id)
+        pending = still_pending
 
-        elif status == "error":
-            error_elem = root.find(".//PCT-Status-Message_message")
-            error_message = (
-                error_elem.text if error_elem is not None else "Unknown error"
-            )
-            logger.warning(f"Error retrieving CIDs from PubChem: {error_message}")
-            return None
+        if pending:
+            time.sleep(delay + random.uniform(0, 0.5 * delay))
+            delay = min(delay * PUBCHEM_POLL_BACKOFF, max_interval)
 
-        elif status in ["queued", "running"]:
-            time.sleep(check_interval)
-        else:
-            time.sleep(check_interval)
+    # Requests still outstanding at the timeout
+    for req_id in pending:
+        download_urls[req_id] = None
 
-    return None
+    return download_urls
 
 
-def parse_cid_file(file_content: str) -> Dict[str, str]:
+def poll_request_status(
+    req_id: str,
+    check_interval: float = PUBCHEM_POLL_INITIAL_INTERVAL,
+    timeout: int = 120,
+    max_interval: float = PUBCHEM_POLL_MAX_INTERVAL,
+) -> Optional[str]:
     """
-    Parses the CID file from PubChem into a dictionary mapping input to CID.
+    Polls PubChem for request completion and returns the download URL.
     """
-    identifier_to_cid = {}
-    lines = file_content.strip().split("\n")
-
-    for i, line in enumerate(lines):
-        parts = line.split("\t")
-        if len(parts) >= 2:
-            input_identifier = parts[0].strip()
-            cid = parts[1].strip()
-            # Only add if CID is numeric (valid)
-            if cid and cid.isdigit():
-                identifier_to_cid[input_identifier] = cid
-            else:
-                identifier_to_cid[input_identifier] = DUMMY_CID
-        else:
-            input_identifier = parts[0].strip()
-            identifier_to_cid[input_identifier] = DUMMY_CID
+    return poll_request_statuses([req_id], check_interval, timeout, max_interval)[
+        req_id
+    ]
 
-    return identifier_to_cid
+
+def parse_cid_file(file_content: bytes | str) -> Dict[str, str]:
+    """
+    Parses the CID file from PubChem into a dictionary mapping input to CID.
+
+    The tab-separated file is read in a single streaming pass, without first
+    decoding it to one string and splitting that into lines.
+    """
+    if isinstance(file_content, bytes):
+        stream: io.TextIOBase = io.TextIOWrapper(
+            io.BytesIO(file_content), encoding="utf-8", errors="replace", newline=""
+        )
+    else:
+        stream = io.StringIO(file_content, newline="")
+
+    # Names may contain quote characters, so disable CSV quoting
+    rows = csv.reader(stream, delimiter="\t", quoting=csv.QUOTE_NONE)
+    # Only keep the CID if it is numeric (valid)
+    return {
+        row[0].strip(): (
+            cid if len(row) >= 2 and (cid := row[1].strip()).isdigit() else DUMMY_CID
+        )
+        for row in rows
+        if row
+    }
 
 
 def get_json(
@@ -426,16 +575,30 @@ def get_json(
     This function suppresses NotFoundError and returns None if no results are found.
     """
     try:
-        return json.loads(
-            get(
-                identifier, namespace, domain, operation, "JSON", searchtype, **kwargs
-            ).decode()
+        return json_loads(
+            get(identifier, namespace, domain, operation, "JSON", searchtype, **kwargs)
         )
     except Exception as e:
         logger.info(e)
         return None
 
 
+def _extract_smiles(compound: Dict[str, Any]) -> str:
+    """
+    Return the SMILES property of a PC_Compounds record, or an empty string if it has
+    none (or only the DUMMY_SMILES placeholder).
+    """
+    for prop in compound.get("props") or ():
+        try:
+            if prop["urn"]["label"] != "SMILES":
+                continue
+        except KeyError:
+            continue
+        smiles = prop.get("value", {}).get("sval", "")
+        return "" if smiles == DUMMY_SMILES else smiles
+    return ""
+
+
 def get_compounds(
     identifier: str | int | List[str] | List[int] | List[str | int],
     namespace: str = "cid",
@@ -471,58 +634,51 @@ def get_compounds(
     if "PC_Compounds" not in results:
         raise ValueError("Error retrieving compounds from PubChem")
 
-    resolved_smiles = []
-    for compound in results.get("PC_Compounds", []):
-        if compound.get("props", []):
-            found_smiles = False
-            for prop in compound.get("props", []):
-                if prop.get("urn", {}).get("label") == "SMILES":
-                    resolved_smiles.append(prop.get("value", {}).get("sval", ""))
-                    found_smiles = True
-                    break
-
-            if not found_smiles:
-                resolved_smiles.append("")
-        else:
-            resolved_smiles.append("")
-
-    resolved_smiles = ["" if item == DUMMY_SMILES else item for item in resolved_smiles]
-
-    return resolved_smiles
+    return [_extract_smiles(compound) for compound in results["PC_Compounds"]]
 
 
-def name_to_smiles_pubchem_batch(compound_name_list: List[str]) -> Dict[str, str]:
+def name_to_smiles_pubchem_batch(
+    compound_name_list: List[str], failed_names: Optional[Set[str]] = None
+) -> Dict[str, str]:
     """
     Convert chemical names to SMILES using pubchem.
 
     Args:
         compound_name_list (List[str]): List of compound names to convert to SMILES.
+        failed_names (Set[str], optional): If given, names that could not be looked
+            up because the batch query failed (rather than finding no match) are
+            added to this set.
 
     Returns:
         Dict[str, str]: Dictionary of compound names to SMILES.
     """
-    # Filter out non-latin1 compatible strings
+    # Filter out non-latin1 compatible strings, and only query each name once
     filtered_compound_name_list = filter_latin1_compatible(compound_name_list)
-    if not filtered_compound_name_list:
+    unique_names = list(dict.fromkeys(filtered_compound_name_list))
+    if not unique_names:
         return {}
 
     try:
-        pubchem_smiles = get_compounds(filtered_compound_name_list, "name")
+        pubchem_smiles = get_compounds(unique_names, "name")
     except Exception as e:
         logger.warning(f"Error with PubChem query: {e}")
+        if failed_names is not None:
+            failed_names.update(unique_names)
         return {}
 
     pubchem_name_dict = {
         name: smiles if smiles is not None else ""
-        for name, smiles in zip(filtered_compound_name_list, pubchem_smiles)
+        for name, smiles in zip(unique_names, pubchem_smiles)
     }
 
-    if len(filtered_compound_name_list) != len(pubchem_name_dict):
+    if len(unique_names) != len(pubchem_smiles):
         logger.warning(
             f"Mismatching lengths: "
-            f"filtered_compound_name_list ({len(filtered_compound_name_list)}), "
-            f"pubchem_name_dict ({len(pubchem_name_dict)})"
+            f"unique_names ({len(unique_names)}), "
+            f"pubchem_smiles ({len(pubchem_smiles)})"
         )
+        if failed_names is not None:
+            failed_names.update(unique_names)
         return {}
 
     return pubchem_name_dict
@@ -0,0 +1,28 @@
+import json
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Get SSL certs from env var or certifi package if available.
+CA_FILE = os.getenv("PUBCHEMPY_CA_BUNDLE") or os.getenv("REQUESTS_CA_BUNDLE")
+if not CA_FILE:
+    try:
+        import certifi
+
+        CA_FILE = certifi.where()
+    except ImportError:
+        CA_FILE = None
+
+# Base URL for the PubChem PUG REST API.
+API_BASE = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,161 @@
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from cholla_chem.utils.logging_config import logger
+
+# Max rows per SELECT ... IN (...) / executemany call. Stays well below SQLite's
+# default host parameter limit.
+CACHE_CHUNK_SIZE = 500
+
+# Seconds a name a resolver found no match for is remembered before it is retried
+CACHE_MISS_TTL = 24 * 60 * 60
+
+# Environment variable giving a default cache path when none is passed explicitly
+CACHE_DB_ENV_VAR = "CHOLLA_CACHE_DB"
+
+
+class ResolverCache:
+    """
+    Persistent SQLite cache of resolved names, keyed on (resolver, name).
+
+    Each entry also stores the resolver's info message for the name (e.g. OPSIN's
+    failure analysis), so cached names are reported like freshly resolved ones.
+    Successful resolutions are kept indefinitely. Names a resolver found no match for
+    are stored as misses (empty SMILES) that expire after `miss_ttl` seconds, in case
+    the resolver's data changes. Callers should not store names whose lookup failed
+    with an error as misses.
+    """
+
+    def __init__(self, path: str | Path, miss_ttl: float = CACHE_MISS_TTL):
+        self._path = Path(path)
+        self._miss_ttl = miss_ttl
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS resolver_cache (
+                resolver TEXT NOT NULL,
+                name TEXT NOT NULL,
+                smiles TEXT NOT NULL,
+                ts INTEGER NOT NULL,
+                info TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (resolver, name)
+            )
+            """
+        )
+        # Caches created before info messages were stored lack the column
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(resolver_cache)")
+        }
+        if "info" not in columns:
+            self._conn.execute(
+                "ALTER TABLE resolver_cache ADD COLUMN info TEXT NOT NULL DEFAULT ''"
+            )
+        self._conn.commit()
+
+    @property
+    def path(self) -> Path:
+        """Return path."""
+        return self._path
+
+    def get_many_with_info(
+        self, resolver: str, names: Iterable[str]
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Look up cached SMILES and info messages for a batch of names.
+
+        Args:
+            resolver (str): Resolver key the results were stored under.
+            names (Iterable[str]): Names to look up.
+
+        Returns:
+            Dict[str, Tuple[str, str]]: Mapping of each cached name to its SMILES (an
+                empty string for unexpired misses) and its info message (an empty
+                string if there is none). Names without a cache entry are omitted.
+        """
+        names_list: List[str] = list(dict.fromkeys(names))
+        found: Dict[str, Tuple[str, str]] = {}
+        miss_cutoff = int(time.time() - self._miss_ttl)
+        for i in range(0, len(names_list), CACHE_CHUNK_SIZE):
+            chunk = names_list[i : i + CACHE_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                "SELECT name, smiles, info FROM resolver_cache "
+                f"WHERE resolver = ? AND name IN ({placeholders}) "
+                "AND (smiles != '' OR ts >= ?)",
+                (resolver, *chunk, miss_cutoff),
+            )
+            found.update((name, (smiles, info)) for name, smiles, info in rows)
+        return found
+
+    def get_many(self, resolver: str, names: Iterable[str]) -> Dict[str, str]:
+        """
+        Look up cached SMILES for a batch of names.
+
+        Args:
+            resolver (str): Resolver key the results were stored under.
+            names (Iterable[str]): Names to look up.
+
+        Returns:
+            Dict[str, str]: Mapping of each cached name to its SMILES, or to an empty
+                string for unexpired misses. Names without a cache entry are omitted.
+        """
+        return {
+            name: smiles
+            for name, (smiles, _) in self.get_many_with_info(resolver, names).items()
+        }
+
+    def set_many(
+        self,
+        resolver: str,
+        results: Dict[str, str],
+        misses: Iterable[str] = (),
+        info: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Store resolutions for a resolver, replacing existing entries.
+
+        Args:
+            resolver (str): Resolver key to store results under.
+            results (Dict[str, str]): Mapping of names to SMILES. Empty SMILES are skipped.
+            misses (Iterable[str]): Names the resolver found no match for. These are
+                stored as misses that expire after the cache's `miss_ttl`, unless
+                `results` has a SMILES for them.
+            info (Dict[str, str], optional): Resolver info messages for stored names.
+        """
+        info = info or {}
+        ts = int(time.time())
+        rows = [
+            (resolver, name, smiles, ts, info.get(name, ""))
+            for name, smiles in results.items()
+            if smiles
+        ]
+        rows.extend(
+            (resolver, name, "", ts, info.get(name, ""))
+            for name in misses
+            if not results.get(name)
+        )
+        if not rows:
+            return
+        with self._conn:
+            for i in range(0, len(rows), CACHE_CHUNK_SIZE):
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO resolver_cache "
+                    "(resolver, name, smiles, ts, info) VALUES (?, ?, ?, ?, ?)",
+                    rows[i : i + CACHE_CHUNK_SIZE],
+                )
+        logger.debug(f"Cached {len(rows)} results for resolver {resolver}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "ResolverCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -309,32 +309,35 @@ PREFIX_MAP = {
     "(tf)": "trifluoroacetyl-",
 }
 
-GREEK_LETTERS = [
-    "α",
-    "β",
-    "γ",
-    "δ",
-    "ε",
-    "ζ",
-    "η",
-    "θ",
-    "ι",
-    "κ",
-    "λ",
-    "μ",
-    "ν",
-    "ξ",
-    "ο",
-    "π",
-    "ρ",
-    "σ",
-    "τ",
-    "υ",
-    "φ",
-    "χ",
-    "ψ",
-    "ω",
-]
+# Set, since it is only used for membership tests on single characters
+GREEK_LETTERS = frozenset(
+    {
+        "α",
+        "β",
+        "γ",
+        "δ",
+        "ε",
+        "ζ",
+        "η",
+        "θ",
+        "ι",
+        "κ",
+        "λ",
+        "μ",
+        "ν",
+        "ξ",
+        "ο",
+        "π",
+        "ρ",
+        "σ",
+        "τ",
+        "υ",
+        "φ",
+        "χ",
+        "ψ",
+        "ω",
+    }
+)
 
 NON_LATIN1_REPLACEMENTS = {
     # Superscripts
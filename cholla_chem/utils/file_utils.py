@@ -1,7 +1,25 @@
 import csv
 import json
+import sys
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+IO_BUFFER_SIZE = 1 << 20
+ARROW_BLOCK_SIZE = 1 << 22
+STDOUT_CHUNK_SIZE = 10_000
 
 
 def _infer_input_format(path: str) -> str:
@@ -57,6 +75,128 @@ def _infer_output_format(path: str) -> str:
     )
 
 
+def _iter_txt_names(path: str, encoding: str) -> Iterator[str]:
+    """Yield stripped, non-empty lines from a plain text file."""
+    with open(path, "r", encoding=encoding, newline="", buffering=IO_BUFFER_SIZE) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def _read_header(path: str, delimiter: str, input_column: str, encoding: str) -> int:
+    """Return the index of `input_column` in the header row of a CSV/TSV file."""
+    with open(path, "r", encoding=encoding, newline="") as f:
+        fieldnames = next(csv.reader(f, delimiter=delimiter), None)
+    if not fieldnames:
+        raise ValueError(
+            f"{path} has no header row; expected a column like '{input_column}'"
+        )
+    try:
+        return fieldnames.index(input_column)
+    except ValueError:
+        raise ValueError(
+            f"{path} is missing column '{input_column}'. Columns: {fieldnames}"
+        ) from None
+
+
+def _read_column_arrow(
+    path: str, delimiter: str, input_column: str, encoding: str
+) -> List[str]:
+    """
+    Read one column of a CSV/TSV file as strings with pyarrow's block-based parser.
+
+    Raises pyarrow.lib.ArrowInvalid on rows whose field count differs from the
+    header's, so the caller can fall back to the csv module, which keeps them.
+    """
+    table = pa_csv.read_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=ARROW_BLOCK_SIZE, encoding=encoding),
+        parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=[input_column],
+            column_types={input_column: pa.string()},
+            strings_can_be_null=False,
+        ),
+    )
+    return table.column(input_column).to_pylist()
+
+
+def _iter_delimited_names(
+    path: str, delimiter: str, input_column: str, idx: int, encoding: str
+) -> Iterator[str]:
+    """Yield stripped, non-empty values of column `idx` from a CSV/TSV file."""
+    if pa_csv is not None:
+        try:
+            values = _read_column_arrow(path, delimiter, input_column, encoding)
+        except pa.ArrowException:
+            # e.g. ragged rows, which the csv module reads like any other row
+            pass
+        else:
+            for val in values:
+                val = val.strip()
+                if val:
+                    yield val
+            return
+
+    with open(path, "r", encoding=encoding, newline="", buffering=IO_BUFFER_SIZE) as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        next(reader, None)
+        for row in reader:
+            if len(row) <= idx:
+                continue
+            val = row[idx].strip()
+            if val:
+                yield val
+
+
+def iter_names_from_file(
+    path: str,
+    *,
+    input_format: str | None = None,
+    input_column: str = "name",
+    encoding: str = "utf-8",
+) -> Iterator[str]:
+    """
+    Lazily reads chemical names from a file.
+
+    Accepts the same input formats as `read_names_from_file`. The file is streamed
+    through a large read buffer, so names are yielded as they are parsed rather than
+    materialized up front. CSV/TSV files are parsed with pyarrow when it is
+    installed, falling back to the stdlib csv module otherwise.
+
+    Args:
+        path: Path to the file
+        input_format: Optional format of the file (txt, csv, tsv)
+        input_column: Name of the column containing the names (default: "name")
+        encoding: Encoding of the file (default: "utf-8")
+
+    Returns:
+        Iterator[str]: An iterator over the chemical names read from the file
+
+    Raises:
+        ValueError: If the input format is not supported, or a CSV/TSV file has no
+            header row or is missing `input_column`
+        OSError: If the file cannot be opened
+
+    Note:
+        Errors are raised when this function is called, not on first iteration.
+    """
+    fmt = (input_format or _infer_input_format(path)).lower()
+
+    if fmt == "txt":
+        # Open once up front so a missing or unreadable file fails at the call
+        open(path, "r", encoding=encoding).close()
+        return _iter_txt_names(path, encoding)
+
+    if fmt in ("csv", "tsv"):
+        delimiter = "," if fmt == "csv" else "\t"
+        idx = _read_header(path, delimiter, input_column, encoding)
+        return _iter_delimited_names(path, delimiter, input_column, idx, encoding)
+
+    raise ValueError(f"Unsupported input format: {fmt} (use txt, csv, tsv)")
+
+
 def read_names_from_file(
     path: str,
     *,
@@ -74,6 +214,8 @@ def read_names_from_file(
     - tsv: a tab-separated value file with a header row
         containing a column like "name"
 
+    Use `iter_names_from_file` to stream names from large files instead.
+
     Args:
         path: Path to the file
         input_format: Optional format of the file (txt, csv, tsv)
@@ -83,33 +225,14 @@ def read_names_from_file(
     Returns:
         List[str]: A list of chemical names read from the file
     """
-    fmt = (input_format or _infer_input_format(path)).lower()
-
-    if fmt == "txt":
-        with open(path, "r", encoding=encoding, newline="") as f:
-            return [line.strip() for line in f if line.strip()]
-
-    out: List[str] = []
-
-    if fmt in ("csv", "tsv"):
-        delimiter = "," if fmt == "csv" else "\t"
-        with open(path, "r", encoding=encoding, newline="") as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            if not reader.fieldnames:
-                raise ValueError(
-                    f"{path} has no header row; expected a column like '{input_column}'"
-                )
-            if input_column not in reader.fieldnames:
-                raise ValueError(
-                    f"{path} is missing column '{input_column}'. Columns: {reader.fieldnames}"
-                )
-            for row in reader:
-                val = (row.get(input_column) or "").strip()
-                if val:
-                    out.append(val)
-            return out
-
-    raise ValueError(f"Unsupported input format: {fmt} (use txt, csv, tsv)")
+    return list(
+        iter_names_from_file(
+            path,
+            input_format=input_format,
+            input_column=input_column,
+            encoding=encoding,
+        )
+    )
 
 
 def write_results(
@@ -132,37 +255,46 @@ def write_results(
         None
     """
     if not output_path:
-        out_text = "\n".join(f"{k}\t{v}" for k, v in results.items())
-        print(out_text)
+        lines = (f"{k}\t{v}\n" for k, v in results.items())
+        while chunk := list(islice(lines, STDOUT_CHUNK_SIZE)):
+            sys.stdout.writelines(chunk)
+        sys.stdout.flush()
         return
 
     fmt = (output_format or _infer_output_format(output_path)).lower()
 
     if fmt == "json":
-        with open(output_path, "w", encoding=encoding) as f:
+        if orjson is not None:
+            payload = orjson.dumps(
+                results,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_APPEND_NEWLINE,
+            )
+            with open(output_path, "wb", buffering=IO_BUFFER_SIZE) as fb:
+                if encoding.lower().replace("-", "") == "utf8":
+                    fb.write(payload)
+                else:
+                    fb.write(payload.decode("utf-8").encode(encoding))
+            return
+        with open(output_path, "w", encoding=encoding, buffering=IO_BUFFER_SIZE) as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
             f.write("\n")
         return
 
-    if fmt == "smi":
-        with open(output_path, "w", encoding=encoding) as f:
-            for name, smiles in results.items():
-                f.write(f"{name}\t{smiles}\n")
-        return
-
-    if fmt == "txt":
-        with open(output_path, "w", encoding=encoding) as f:
-            for name, smiles in results.items():
-                f.write(f"{name}\t{smiles}\n")
+    if fmt in ("smi", "txt"):
+        with open(output_path, "w", encoding=encoding, buffering=IO_BUFFER_SIZE) as f:
+            f.writelines(f"{name}\t{smiles}\n" for name, smiles in results.items())
         return
 
     if fmt in ("csv", "tsv"):
         delimiter = "," if fmt == "csv" else "\t"
-        with open(output_path, "w", encoding=encoding, newline="") as f:
-            w = csv.DictWriter(f, fieldnames=["name", "smiles"], delimiter=delimiter)
-            w.writeheader()
-            for name, smiles in results.items():
-                w.writerow({"name": name, "smiles": smiles})
+        with open(
+            output_path, "w", encoding=encoding, newline="", buffering=IO_BUFFER_SIZE
+        ) as f:
+            w = csv.writer(f, delimiter=delimiter)
+            w.writerow(("name", "smiles"))
+            w.writerows(results.items())
         return
 
     raise ValueError(f"Unsupported output format: {fmt}")
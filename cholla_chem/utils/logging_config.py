@@ -1,7 +1,8 @@
 import os
 import sys
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from loguru import logger
 
@@ -22,12 +23,51 @@ ERROR_FORMAT = (
     "{exception}</red>"
 )
 
-LOG_LEVELS = {
-    "development": "DEBUG",
-    "testing": "INFO",
-    "production": "WARNING",
-    "default": "WARNING",
-}
+# Uncolored equivalents of the formats above, for file sinks where color markup is
+# never rendered
+PLAIN_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss.SSS} | "
+    "{level: <8} | "
+    "{name}:{function}:{line} | "
+    "{message}"
+)
+
+PLAIN_ERROR_FORMAT = (
+    PLAIN_FORMAT + "\n"
+    "Exception type: {exception.__class__.__name__}\n"
+    "Traceback (most recent call last):\n"
+    "{exception}"
+)
+
+# Read-only, so the defaults can't be changed from outside configure_logging
+LOG_LEVELS: Mapping[str, str] = MappingProxyType(
+    {
+        "development": "DEBUG",
+        "testing": "INFO",
+        "production": "WARNING",
+        "default": "WARNING",
+    }
+)
+
+# Write buffer for the main log file. Loguru line-buffers files by default, which
+# costs a write() syscall per record.
+LOG_FILE_BUFFER_SIZE = 1 << 16
+
+# Levels at which only the error-log sink renders full exception diagnostics
+QUIET_LOG_LEVELS = ("WARNING", "ERROR", "CRITICAL")
+
+
+def _handle_exception(
+    exc_type: type[BaseException], exc_value: BaseException, exc_traceback: Any
+) -> None:
+    """Log uncaught exceptions, leaving KeyboardInterrupt to the default hook."""
+    if issubclass(exc_type, KeyboardInterrupt):
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
+        return
+
+    logger.opt(exception=(exc_type, exc_value, exc_traceback)).error(
+        "Uncaught exception"
+    )
 
 
 def configure_logging(
@@ -36,6 +76,8 @@ def configure_logging(
     rotation: str = "10 MB",
     retention: str = "30 days",
     serialize: bool = False,
+    enqueue: bool = False,
+    buffer_size: int = LOG_FILE_BUFFER_SIZE,
     **kwargs: Any,
 ) -> None:
     """
@@ -47,40 +89,43 @@ def configure_logging(
         rotation: Log rotation configuration (e.g., "10 MB", "1 week")
         retention: Log retention period (e.g., "30 days")
         serialize: Whether to serialize log records as JSON
+        enqueue: Whether to pass records to the sinks through a multiprocess-safe
+            queue. This makes logging safe from multiple processes and keeps slow
+            sinks off the calling thread, but each record is pickled and handed to a
+            worker thread, which adds latency per record, and the queue is unbounded,
+            so memory grows if a sink falls behind. Leave off for ordinary
+            single-process use.
+        buffer_size: Write buffer size in bytes for the main log file. Records are
+            written in batches as the buffer fills and when logging is reconfigured
+            or the interpreter exits. Pass 1 for line buffering. The error log is
+            always line-buffered so warnings and errors reach disk immediately.
+            A `buffering` argument passed through kwargs overrides this and, as
+            before, also applies to the error log.
         **kwargs: Additional arguments to pass to logger.add()
     """
     log_file: Path | None = None
     error_log_file: Path | None = None
+    # Loguru creates the log files, and any missing directories, when the sinks
+    # are added below
     if log_dir:
         log_file = log_dir / "cholla_chem.log"
         error_log_file = log_dir / "cholla_chem_errors.log"
 
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        log_file.touch()
-
-        error_log_file.parent.mkdir(parents=True, exist_ok=True)
-        error_log_file.touch()
-
     # Determine log level from environment if not specified
     if level is None:
         env = os.getenv("loguru_level", "default").lower()
         level = LOG_LEVELS.get(env, LOG_LEVELS["default"])
 
-    enable_library_logging()
-
-    # Configure exception hook for uncaught exceptions
-    def _handle_exception(
-        exc_type: type[BaseException], exc_value: BaseException, exc_traceback: Any
-    ) -> None:
-        if issubclass(exc_type, KeyboardInterrupt):
-            sys.__excepthook__(exc_type, exc_value, exc_traceback)
-            return
+    # Variable-annotated tracebacks (diagnose) and extended backtraces are costly to
+    # build, so at quieter levels they are only kept on the dedicated error-log sink
+    diagnostics = str(level).upper() not in QUIET_LOG_LEVELS
 
-        logger.opt(exception=(exc_type, exc_value, exc_traceback)).error(
-            "Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback)
-        )
+    enable_library_logging()
 
-    sys.excepthook = _handle_exception
+    # Route uncaught exceptions through the logger. The hook is module-level, so
+    # reconfiguring doesn't install a fresh one each time.
+    if sys.excepthook is not _handle_exception:
+        sys.excepthook = _handle_exception
 
     logger.remove()
 
@@ -89,9 +134,9 @@ def configure_logging(
         level=level,
         format=DEFAULT_FORMAT,
         colorize=True,
-        backtrace=True,
-        diagnose=True,
-        enqueue=False,
+        backtrace=diagnostics,
+        diagnose=diagnostics,
+        enqueue=enqueue,
         catch=True,
     )
 
@@ -101,12 +146,13 @@ def configure_logging(
             rotation=rotation,
             retention=retention,
             level=level,
-            format=DEFAULT_FORMAT,
-            enqueue=False,
-            backtrace=True,
-            diagnose=True,
+            format=PLAIN_FORMAT,
+            enqueue=enqueue,
+            backtrace=diagnostics,
+            diagnose=diagnostics,
             catch=True,
-            **kwargs,
+            # An explicit buffering= in kwargs takes precedence over buffer_size
+            **{"buffering": buffer_size, **kwargs},
         )
 
     if error_log_file:
@@ -115,8 +161,8 @@ def configure_logging(
             rotation=rotation,
             retention=retention,
             level="WARNING",
-            format=ERROR_FORMAT,
-            enqueue=False,
+            format=PLAIN_ERROR_FORMAT,
+            enqueue=enqueue,
             backtrace=True,
             diagnose=True,
             catch=True,
@@ -130,9 +176,9 @@ def configure_logging(
             level=level,
             format=DEFAULT_FORMAT,
             serialize=True,
-            enqueue=False,
-            backtrace=True,
-            diagnose=True,
+            enqueue=enqueue,
+            backtrace=diagnostics,
+            diagnose=diagnostics,
             **kwargs,
         )
 
@@ -1,5 +1,6 @@
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterable, List
 
 from cholla_chem.utils.constants import (
     ALLOWED_CHARS_WHITELIST,
@@ -8,6 +9,41 @@ from cholla_chem.utils.constants import (
 )
 from cholla_chem.utils.logging_config import logger
 
+# Single-character replacements (and newline removal) are applied in one C-level pass
+# with str.translate, multi-character ones (mojibake, HTML entities) with a single
+# longest-first regex.
+_SINGLE_CHAR_TRANS = str.maketrans(
+    {k: v for k, v in NON_LATIN1_REPLACEMENTS.items() if len(k) == 1} | {"\n": None}
+)
+_MULTI_CHAR_REPLACEMENTS = {
+    k: v for k, v in NON_LATIN1_REPLACEMENTS.items() if len(k) > 1
+}
+_MULTI_CHAR_PATTERN = re.compile(
+    "|".join(
+        re.escape(k) for k in sorted(_MULTI_CHAR_REPLACEMENTS, key=len, reverse=True)
+    )
+)
+_DISALLOWED_CHARS_PATTERN = re.compile(
+    "[^" + re.escape("".join(sorted(ALLOWED_CHARS_WHITELIST))) + "]"
+)
+
+# Matches HTML tags
+_TAG_PATTERN = re.compile(r"<.*?>")
+
+# Default character whitelist as a set, built once rather than on every call
+_COMMON_CHARS_WHITELIST_SET = frozenset(COMMON_CHARS_WHITELIST)
+
+# Matches any character outside the latin-1 range
+_NON_LATIN1_PATTERN = re.compile(r"[^\x00-\xff]")
+
+# Whitelisted characters that cannot start a replacement key or an HTML tag. A string
+# made up only of these is returned unchanged by clean_strings with the default table.
+_CLEAN_PASSTHROUGH_CHARS = (
+    frozenset(ALLOWED_CHARS_WHITELIST)
+    - {key[0] for key in NON_LATIN1_REPLACEMENTS}
+    - {"<"}
+)
+
 
 def safe_str(x: object) -> str | None:
     """Tries to convert to string, returns none upon exception"""
@@ -18,18 +54,22 @@ def safe_str(x: object) -> str | None:
 
 
 def filter_strings_by_whitelist(
-    strings: List[str], whitelist: List[str] = COMMON_CHARS_WHITELIST
+    strings: List[str], whitelist: Iterable[str] | None = None
 ) -> List[str]:
     """
     Filters a list of strings, returning only those that contain
     only characters from the whitelist.
 
     :param strings: List of strings to filter.
-    :param whitelist: List or set of allowed characters.
+    :param whitelist: List or set of allowed characters. Defaults to
+        COMMON_CHARS_WHITELIST.
     :return: List of strings that contain only whitelisted characters.
     """
-    whitelist_set = set(whitelist)  # Convert to set for faster lookup
-    return [s for s in strings if set(s).issubset(whitelist_set)]
+    whitelist_set = (
+        _COMMON_CHARS_WHITELIST_SET if whitelist is None else frozenset(whitelist)
+    )
+    # issuperset() iterates each string directly, without building a set per string
+    return [s for s in strings if whitelist_set.issuperset(s)]
 
 
 def clean_strings(
@@ -45,54 +85,111 @@ def clean_strings(
     Returns:
         The cleaned string with the specified characters replaced.
     """
+    if chars_to_replace_dict is NON_LATIN1_REPLACEMENTS:
+        return _clean_string_default(string)
+    return _clean_string(string, chars_to_replace_dict)
+
+
+@lru_cache(maxsize=65536)
+def _clean_string_default(string: str) -> str:
+    """Memoized clean_strings for the default replacement table."""
+    if _CLEAN_PASSTHROUGH_CHARS.issuperset(string):
+        return string
+    string = _MULTI_CHAR_PATTERN.sub(
+        lambda m: _MULTI_CHAR_REPLACEMENTS[m.group(0)], string
+    )
+    string = string.translate(_SINGLE_CHAR_TRANS)
+    string = remove_tags(string)
+    return _DISALLOWED_CHARS_PATTERN.sub("", string)
+
+
+def _clean_string(string: str, chars_to_replace_dict: Dict[str, str]) -> str:
+    """Apply replacements, strip newlines and tags, and drop non-whitelisted chars."""
     # sort longest to shortest to avoid partial replacements
     for char in sorted(chars_to_replace_dict, key=len, reverse=True):
         string = string.replace(char, chars_to_replace_dict[char])
     string = string.replace("\n", "")
     string = remove_tags(string)
-    string = "".join(char for char in string if char in ALLOWED_CHARS_WHITELIST)
-    return string
+    return _DISALLOWED_CHARS_PATTERN.sub("", string)
 
 
 def is_latin1_compatible(s: str) -> bool:
     """Check if a string is compatible with the latin-1 codec."""
-    try:
-        s.encode("latin-1")
+    # isascii() is O(1); other strings get one regex scan for a code point above
+    # U+00FF, instead of an encode that allocates bytes and raises on failure.
+    if s.isascii() or _NON_LATIN1_PATTERN.search(s) is None:
         return True
-    except UnicodeEncodeError:
-        logger.info(f"String {s} is not compatible with latin-1 codec")
-        return False
+    # Passed as an argument so loguru only formats the message if the record is
+    # emitted, rather than building an f-string for every rejected string.
+    logger.info("String {} is not compatible with latin-1 codec", s)
+    return False
 
 
 def filter_latin1_compatible(strings: List[str]) -> List[str]:
     """Filter a list of strings to only include those compatible with the latin-1 codec."""
-    return [s for s in strings if is_latin1_compatible(s)]
+    # Common case: every string is compatible, which a single encode of the joined
+    # strings confirms without any per-string work.
+    try:
+        "".join(strings).encode("latin-1")
+        return list(strings)
+    except UnicodeEncodeError:
+        pass
+
+    # Inline the checks for compatible strings; only rejects go through
+    # is_latin1_compatible, which logs them.
+    search = _NON_LATIN1_PATTERN.search
+    return [
+        s
+        for s in strings
+        if s.isascii() or search(s) is None or is_latin1_compatible(s)
+    ]
 
 
 def remove_tags(string: str) -> str:
     """Remove HTML tags from a string."""
-    pattern = r"<.*?>"
-    return re.sub(pattern, "", string)
+    return _TAG_PATTERN.sub("", string)
 
 
 def cas_check_digit(potential_cas_number: str) -> bool:
-    """Check if a string is a valid CAS number."""
-    check_digit = potential_cas_number[-1]
-    reversed_remaining_digits = potential_cas_number[::-1][1:]
-    total = sum(
-        (i + 1) * int(digit) for i, digit in enumerate(reversed_remaining_digits)
-    )
-    if total % 10 == int(check_digit):
-        return True
-    return False
+    """
+    Check if a string is a valid CAS number.
+
+    Raises:
+        ValueError: If the string is empty or contains anything but ASCII digits
+    """
+    if not (potential_cas_number.isascii() and potential_cas_number.isdigit()):
+        raise ValueError(
+            f"Expected the digits of a CAS number, got {potential_cas_number!r}"
+        )
+    # Weight each digit before the check digit by its position from the right,
+    # using ord() arithmetic rather than reversing the string and calling int()
+    n = len(potential_cas_number) - 1
+    total = 0
+    for i in range(n):
+        total += (n - i) * (ord(potential_cas_number[i]) - 48)
+    return total % 10 == ord(potential_cas_number[-1]) - 48
 
 
 def is_valid_cas(synonym: str) -> bool:
     """Check if a string is a valid CAS number."""
-    synonym = synonym.replace("-", "")
-    if not synonym.isdigit():
-        return False
-    if len(synonym) < 3:
+    # Single pass over the string: hyphens are skipped and anything else that is
+    # not an ASCII digit rejects it. Summing the running digit sum after each
+    # digit weights every digit by its distance from the last one, so when the
+    # loop ends `total` is the checksum of the digits before the check digit.
+    n_digits = 0
+    digit_sum = 0
+    total = 0
+    digit = 0
+    for ch in synonym:
+        if ch == "-":
+            continue
+        digit = ord(ch) - 48
+        if digit < 0 or digit > 9:
+            return False
+        total += digit_sum
+        digit_sum += digit
+        n_digits += 1
+    if n_digits < 3:
         return False
 
-    return cas_check_digit(synonym)
+    return total % 10 == digit
@@ -0,0 +1,34 @@
+"""
+Optional mypyc build.
+
+Project metadata lives in pyproject.toml; this file only adds compiled extensions when
+CHOLLA_CHEM_USE_MYPYC=1 is set. The listed modules are then compiled to C with mypyc,
+which needs mypy in the build environment, e.g.:
+
+    pip install mypy
+    CHOLLA_CHEM_USE_MYPYC=1 pip install --no-build-isolation .
+
+Without the variable the package builds as pure Python.
+"""
+
+import os
+
+from setuptools import setup
+
+# String-heavy, fully annotated modules where mypyc gives the largest speedup
+MYPYC_MODULES = [
+    "cholla_chem/name_manipulation/peptide_shorthand_handler.py",
+]
+
+if os.getenv("CHOLLA_CHEM_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # mypyc fails the build on any mypy message, including the notes mypy emits
+    # for annotated locals in untyped functions elsewhere in the package
+    setup(
+        ext_modules=mypycify(
+            ["--disable-error-code=annotation-unchecked", *MYPYC_MODULES]
+        )
+    )
+else:
+    setup()
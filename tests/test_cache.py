@@ -0,0 +1,187 @@
+import os
+import sqlite3
+import sys
+
+# Ensure project root is on sys.path so we can import cholla_chem modules
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from cholla_chem.main import (  # noqa: E402
+    ChemicalNameResolver,
+    OpsinNameResolver,
+    resolve_compounds_using_resolvers,
+)
+from cholla_chem.utils import cache as cache_module  # noqa: E402
+from cholla_chem.utils.cache import ResolverCache  # noqa: E402
+
+
+class CountingResolver(ChemicalNameResolver):
+    """Fake resolver that records which names it was asked to resolve."""
+
+    def __init__(self, resolver_name, cacheable=True):
+        super().__init__("fake", resolver_name, 1, cacheable=cacheable)
+        self.calls = []
+
+    def name_to_smiles(self, compound_name_list):
+        self.calls.append(list(compound_name_list))
+        return (
+            {
+                name: f"SMILES_{name}"
+                for name in compound_name_list
+                if name not in ("bad", "flaky")
+            },
+            {"bad": "bad is uninterpretable"} if "bad" in compound_name_list else {},
+        )
+
+    def name_to_smiles_with_failures(self, compound_name_list):
+        # "bad" has no match, while looking up "flaky" raises an error
+        resolved_names, info = self.name_to_smiles(compound_name_list)
+        return resolved_names, info, {"flaky"} & set(compound_name_list)
+
+
+class UnreportingResolver(CountingResolver):
+    """Fake resolver that cannot tell lookup errors from names without a match."""
+
+    name_to_smiles_with_failures = ChemicalNameResolver.name_to_smiles_with_failures
+
+
+def test_resolver_cache_round_trip(tmp_path):
+    """Stored results should be returned on lookup, per resolver, across connections."""
+    path = tmp_path / "cache.sqlite"
+    with ResolverCache(path) as cache:
+        cache.set_many("opsin", {"ethanol": "CCO", "water": "O", "failed": ""})
+
+    with ResolverCache(path) as cache:
+        assert cache.get_many("opsin", ["ethanol", "water", "failed", "x"]) == {
+            "ethanol": "CCO",
+            "water": "O",
+        }
+        assert cache.get_many("pubchem", ["ethanol"]) == {}
+
+
+def test_resolver_cache_large_lookup(tmp_path):
+    """Lookups larger than a single query chunk should return every entry."""
+    names = {f"name{i}": f"C{i}" for i in range(1234)}
+    with ResolverCache(tmp_path / "cache.sqlite") as cache:
+        cache.set_many("opsin", names)
+        assert cache.get_many("opsin", list(names)) == names
+
+
+def test_resolve_compounds_using_resolvers_uses_cache(tmp_path):
+    """Cached names should not be sent to cacheable resolvers again."""
+    path = tmp_path / "cache.sqlite"
+    names = ["ethanol", "water", "bad"]
+
+    first = CountingResolver("fake")
+    with ResolverCache(path) as cache:
+        out = resolve_compounds_using_resolvers(names, [first], 10, cache=cache)
+    assert first.calls == [names]
+    assert out["fake"]["out"] == {"ethanol": "SMILES_ethanol", "water": "SMILES_water"}
+
+    second = CountingResolver("fake")
+    uncached = CountingResolver("uncached", cacheable=False)
+    with ResolverCache(path) as cache:
+        out = resolve_compounds_using_resolvers(
+            names, [second, uncached], 10, cache=cache
+        )
+    # "bad" failed on the first run and is remembered as a miss
+    assert second.calls == []
+    assert uncached.calls == [names]
+    assert out["fake"]["out"] == {"ethanol": "SMILES_ethanol", "water": "SMILES_water"}
+    # Info messages are served from the cache like fresh results
+    assert out["fake"]["additional_info"] == {"bad": "bad is uninterpretable"}
+
+
+def test_resolver_cache_key_depends_on_configuration():
+    """Resolvers sharing a name but configured differently should not share cache entries."""
+    default = OpsinNameResolver("opsin")
+
+    assert default.cache_key == OpsinNameResolver("opsin").cache_key
+    assert default.cache_key.startswith("opsin:")
+    assert default.cache_key != OpsinNameResolver("opsin", allow_acid=True).cache_key
+    assert default.cache_key != CountingResolver("opsin").cache_key
+
+
+def test_resolver_cache_adds_info_column_to_old_databases(tmp_path):
+    """Caches created before info messages were stored should still be readable."""
+    path = tmp_path / "cache.sqlite"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE resolver_cache (resolver TEXT NOT NULL, name TEXT NOT NULL, "
+        "smiles TEXT NOT NULL, ts INTEGER NOT NULL, PRIMARY KEY (resolver, name))"
+    )
+    conn.execute("INSERT INTO resolver_cache VALUES ('opsin', 'ethanol', 'CCO', 0)")
+    conn.commit()
+    conn.close()
+
+    with ResolverCache(path) as cache:
+        assert cache.get_many_with_info("opsin", ["ethanol"]) == {
+            "ethanol": ("CCO", "")
+        }
+        cache.set_many("opsin", {"water": "O"}, info={"water": "note"})
+        assert cache.get_many_with_info("opsin", ["water"]) == {"water": ("O", "note")}
+
+
+def test_names_that_failed_with_an_error_are_not_cached_as_misses(tmp_path):
+    """Only names a resolver answered negatively should be cached as misses."""
+    path = tmp_path / "cache.sqlite"
+    names = ["ethanol", "bad", "flaky"]
+
+    with ResolverCache(path) as cache:
+        resolve_compounds_using_resolvers(names, [CountingResolver("fake")], 10, cache)
+        resolve_compounds_using_resolvers(
+            names, [UnreportingResolver("unreporting")], 10, cache
+        )
+
+    second = CountingResolver("fake")
+    unreporting = UnreportingResolver("unreporting")
+    with ResolverCache(path) as cache:
+        resolve_compounds_using_resolvers(names, [second, unreporting], 10, cache)
+    assert second.calls == [["flaky"]]
+    # Without failure reporting every unresolved name is retried
+    assert unreporting.calls == [["bad", "flaky"]]
+
+
+def test_misses_returned_as_empty_smiles_are_cached(tmp_path):
+    """Resolvers that map unmatched names to "" should still have their misses cached."""
+
+    class EmptyStringResolver(CountingResolver):
+        def name_to_smiles_with_failures(self, compound_name_list):
+            resolved_names, info, failed_names = super().name_to_smiles_with_failures(
+                compound_name_list
+            )
+            return (
+                {name: resolved_names.get(name, "") for name in compound_name_list},
+                info,
+                failed_names,
+            )
+
+    path = tmp_path / "cache.sqlite"
+    names = ["ethanol", "bad"]
+    with ResolverCache(path) as cache:
+        resolve_compounds_using_resolvers(
+            names, [EmptyStringResolver("fake")], 10, cache
+        )
+
+    second = EmptyStringResolver("fake")
+    with ResolverCache(path) as cache:
+        out = resolve_compounds_using_resolvers(names, [second], 10, cache)
+    assert second.calls == []
+    assert out["fake"]["out"] == {"ethanol": "SMILES_ethanol"}
+
+
+def test_resolver_cache_misses_expire(tmp_path, monkeypatch):
+    """Cached misses should be returned as empty strings until they expire."""
+    now = 1_000_000.0
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+
+    with ResolverCache(tmp_path / "cache.sqlite", miss_ttl=60) as cache:
+        cache.set_many("pubchem", {"ethanol": "CCO"}, misses=["bad", "ethanol"])
+        assert cache.get_many("pubchem", ["ethanol", "bad"]) == {
+            "ethanol": "CCO",
+            "bad": "",
+        }
+
+        now += 120
+        assert cache.get_many("pubchem", ["ethanol", "bad"]) == {"ethanol": "CCO"}
@@ -1,14 +1,43 @@
 import os
 import sys
+import time
+
+import pytest
 
 # Ensure project root is on sys.path so we can import cholla_chem modules
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+from cholla_chem.main import (  # noqa: E402
+    ChemSpiPyResolver,
+    resolve_compounds_using_resolvers,
+)
 from cholla_chem.resolvers.chemspipy_resolver import (  # noqa: E402
+    _get_chemspider_client,
+    _search_chemspider_smiles,
     name_to_smiles_chemspipy,
 )
+from cholla_chem.utils.cache import ResolverCache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    """Don't throttle fake ChemSpider searches."""
+    monkeypatch.setattr(
+        "cholla_chem.resolvers.chemspipy_resolver.CHEMSPIDER_MAX_REQUESTS_PER_SECOND",
+        float("inf"),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_chemspider_caches():
+    """Keep memoized clients and search results from leaking between tests."""
+    _get_chemspider_client.cache_clear()
+    _search_chemspider_smiles.cache_clear()
+    yield
+    _get_chemspider_client.cache_clear()
+    _search_chemspider_smiles.cache_clear()
 
 
 def test_name_to_smiles_chemspipy_basic_mapping(monkeypatch):
@@ -43,7 +72,7 @@ def test_name_to_smiles_chemspipy_basic_mapping(monkeypatch):
         def __init__(self, api_key):
             captured["api_key"] = api_key
 
-        def search(self, compound_name):
+        def search(self, compound_name, raise_errors=False):
             captured["search_terms"].append(compound_name)
             return FakeResults(compound_name)
 
@@ -72,7 +101,7 @@ def test_name_to_smiles_chemspipy_basic_mapping(monkeypatch):
     assert captured["api_key"] == api_key
 
     # Each name should have been searched exactly once
-    assert captured["search_terms"] == compound_names
+    assert sorted(captured["search_terms"]) == sorted(compound_names)
 
     # Result dict should contain all names with the expected SMILES
     assert set(result.keys()) == set(compound_names)
@@ -111,7 +140,7 @@ def test_name_to_smiles_chemspipy_respects_filter_latin1(monkeypatch):
         ):  # pragma: no cover - behavior validated via side effects
             self.api_key = api_key
 
-        def search(self, compound_name):
+        def search(self, compound_name, raise_errors=False):
             captured_search_terms.append(compound_name)
             return FakeResults(compound_name)
 
@@ -184,7 +213,7 @@ def test_name_to_smiles_chemspipy_skips_empty_results_and_missing_smiles(monkeyp
         ):  # pragma: no cover - construction side effects not needed
             self.api_key = api_key
 
-        def search(self, compound_name):
+        def search(self, compound_name, raise_errors=False):
             if compound_name == "no_results":
                 return EmptyResults()
             if compound_name == "no_smiles":
@@ -240,6 +269,134 @@ def test_name_to_smiles_chemspipy_init_failure_returns_empty(monkeypatch):
         raising=True,
     )
 
-    result = name_to_smiles_chemspipy(["ethanol"], "KEY")
+    failed_names = set()
+    result = name_to_smiles_chemspipy(
+        ["ethanol"], "UNUSABLE KEY", failed_names=failed_names
+    )
+
+    assert result == {}
+    assert failed_names == {"ethanol"}
+
+
+def test_name_to_smiles_chemspipy_queries_duplicates_once(monkeypatch):
+    """Duplicate names should be searched once and fanned back out to each input."""
+
+    captured_search_terms = []
+
+    class FakeCompound:
+        def __init__(self, smiles):
+            self.smiles = smiles
+
+    class FakeResults:
+        def __init__(self, compound_name):
+            self._items = [FakeCompound(f"SMILES_{compound_name}")]
+
+        def wait(self):
+            return None
+
+        def ready(self):
+            return True
+
+        def __len__(self):
+            return len(self._items)
+
+        def __getitem__(self, index):
+            return self._items[index]
+
+    class FakeChemSpider:
+        def __init__(self, api_key):
+            self.api_key = api_key
+
+        def search(self, compound_name, raise_errors=False):
+            captured_search_terms.append(compound_name)
+            return FakeResults(compound_name)
+
+    monkeypatch.setattr(
+        "cholla_chem.resolvers.chemspipy_resolver.ChemSpider",
+        FakeChemSpider,
+        raising=True,
+    )
+
+    result = name_to_smiles_chemspipy(["ethanol", "water", "ethanol"], "KEY")
+    name_to_smiles_chemspipy(["water"], "KEY")
+
+    assert sorted(captured_search_terms) == ["ethanol", "water"]
+    assert result == {"ethanol": "SMILES_ethanol", "water": "SMILES_water"}
+
+
+def test_name_to_smiles_chemspipy_reports_search_errors(monkeypatch):
+    """Search errors should be reported as failed names and not memoized as misses."""
+
+    captured_search_terms = []
+
+    class FakeResults:
+        """Like ChemSpiPy's Results, only raising a stored error if asked to."""
+
+        def __init__(self, raise_errors):
+            self._raise_errors = raise_errors
+
+        def wait(self):
+            if self._raise_errors:
+                raise RuntimeError("ChemSpider request failed")
+
+        def __len__(self):
+            return 0
+
+    class FakeChemSpider:
+        def __init__(self, api_key):
+            self.api_key = api_key
+
+        def search(self, compound_name, raise_errors=False):
+            captured_search_terms.append(compound_name)
+            return FakeResults(raise_errors)
+
+    monkeypatch.setattr(
+        "cholla_chem.resolvers.chemspipy_resolver.ChemSpider",
+        FakeChemSpider,
+        raising=True,
+    )
+
+    failed_names = set()
+    result = name_to_smiles_chemspipy(["ethanol"], "KEY", failed_names=failed_names)
+    name_to_smiles_chemspipy(["ethanol"], "KEY")
 
     assert result == {}
+    assert failed_names == {"ethanol"}
+    assert captured_search_terms == ["ethanol", "ethanol"]
+
+
+def test_chemspipy_resolver_errors_are_not_cached_as_misses(monkeypatch, tmp_path):
+    """Names whose ChemSpider search fails should be retried rather than cached."""
+    from chemspipy import ChemSpider
+
+    searched = []
+
+    def failing_filter_name(self, name, *args, **kwargs):
+        searched.append(name)
+        raise RuntimeError("ChemSpider request failed")
+
+    monkeypatch.setattr(ChemSpider, "filter_name", failing_filter_name)
+    resolver = ChemSpiPyResolver("chemspipy", "KEY")
+
+    resolved, _, failed_names = resolver.name_to_smiles_with_failures(["ethanol"])
+    assert resolved == {}
+    assert failed_names == {"ethanol"}
+
+    with ResolverCache(tmp_path / "cache.sqlite") as cache:
+        resolve_compounds_using_resolvers(["ethanol"], [resolver], 10, cache)
+        resolve_compounds_using_resolvers(["ethanol"], [resolver], 10, cache)
+        assert cache.get_many(resolver.cache_key, ["ethanol"]) == {}
+    assert searched == ["ethanol"] * 3
+
+
+def test_wait_for_rate_limit_spaces_requests(monkeypatch):
+    """Consecutive requests should be spaced by the configured rate limit."""
+    from cholla_chem.resolvers import chemspipy_resolver
+
+    monkeypatch.setattr(chemspipy_resolver, "CHEMSPIDER_MAX_REQUESTS_PER_SECOND", 20.0)
+    monkeypatch.setattr(chemspipy_resolver, "_next_request_time", 0.0)
+
+    start = time.monotonic()
+    for _ in range(3):
+        chemspipy_resolver._wait_for_rate_limit()
+    assert time.monotonic() - start >= 0.1
@@ -1,5 +1,8 @@
 import os
 import sys
+from urllib.error import HTTPError
+
+import pytest
 
 # Ensure project root is on sys.path so we can import cholla_chem modules
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
@@ -7,11 +10,20 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from cholla_chem.resolvers.cirpy_resolver import (  # noqa: E402
+    _resolve_cirpy_smiles,
     retrieve_cirpy_results,
     name_to_smiles_cirpy,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_cirpy_cache():
+    """Keep memoized CIRpy results from leaking between tests."""
+    _resolve_cirpy_smiles.cache_clear()
+    yield
+    _resolve_cirpy_smiles.cache_clear()
+
+
 def test_retrieve_cirpy_results_success(monkeypatch):
     """retrieve_cirpy_results should return the SMILES string from cirpy.resolve."""
 
@@ -70,3 +82,93 @@ def test_name_to_smiles_cirpy_uses_retrieve_for_each_name(monkeypatch):
     assert set(result_dict.keys()) == set(names)
     for name in names:
         assert result_dict[name] == f"SMILES_{name}"
+
+
+def test_name_to_smiles_cirpy_skips_failed_lookups(monkeypatch):
+    """Names whose lookup fails should be omitted, and input order preserved."""
+
+    def fake_resolve(compound_name, identifier_type):
+        if compound_name == "bad":
+            raise RuntimeError("Test error from cirpy")
+        return f"SMILES_{compound_name}"
+
+    monkeypatch.setattr(
+        "cholla_chem.resolvers.cirpy_resolver.cirpy.resolve",
+        fake_resolve,
+        raising=True,
+    )
+
+    names = ["ethanol", "bad", "water", "acetone"]
+    result_dict = name_to_smiles_cirpy(names, max_workers=2)
+
+    assert list(result_dict.keys()) == ["ethanol", "water", "acetone"]
+    assert name_to_smiles_cirpy([]) == {}
+
+
+def test_name_to_smiles_cirpy_reports_failed_lookups(monkeypatch):
+    """Lookups that raise should be reported as failed, unlike names without a match."""
+
+    def fake_resolve(compound_name, identifier_type):
+        if compound_name == "flaky name":
+            raise RuntimeError("Test error from cirpy")
+        return None
+
+    monkeypatch.setattr(
+        "cholla_chem.resolvers.cirpy_resolver.cirpy.resolve",
+        fake_resolve,
+        raising=True,
+    )
+
+    failed_names = set()
+    result_dict = name_to_smiles_cirpy(
+        ["unknown name", "flaky name"], failed_names=failed_names
+    )
+
+    assert result_dict == {}
+    assert failed_names == {"flaky name"}
+
+
+def test_name_to_smiles_cirpy_treats_not_found_as_no_match(monkeypatch):
+    """CIR's 404 for unknown names is a miss; other HTTP errors are failures."""
+
+    def fake_resolve(compound_name, identifier_type):
+        code = 404 if compound_name == "unknown name" else 503
+        raise HTTPError("https://cactus.nci.nih.gov", code, "error", None, None)
+
+    monkeypatch.setattr(
+        "cholla_chem.resolvers.cirpy_resolver.cirpy.resolve",
+        fake_resolve,
+        raising=True,
+    )
+
+    failed_names = set()
+    result_dict = name_to_smiles_cirpy(
+        ["unknown name", "flaky name"], failed_names=failed_names
+    )
+
+    assert result_dict == {}
+    assert failed_names == {"flaky name"}
+
+
+def test_name_to_smiles_cirpy_queries_duplicates_once(monkeypatch):
+    """Duplicate names, including differently composed unicode, share one query."""
+    queried = []
+
+    def fake_resolve(compound_name, identifier_type):
+        queried.append(compound_name)
+        return f"SMILES_{compound_name}"
+
+    monkeypatch.setattr(
+        "cholla_chem.resolvers.cirpy_resolver.cirpy.resolve",
+        fake_resolve,
+        raising=True,
+    )
+
+    names = ["café", "cafe\u0301", "water", "water"]
+    result_dict = name_to_smiles_cirpy(names)
+
+    assert sorted(queried) == ["café", "water"]
+    assert result_dict["cafe\u0301"] == "SMILES_café"
+
+    name_to_smiles_cirpy(["water"])
+    assert queried.count("water") == 1
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+# Ensure project root is on sys.path so we can import cholla_chem modules
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from cholla_chem.cli import build_parser  # noqa: E402
+
+
+def test_boolean_flags_parse_as_switches():
+    """Boolean options should be toggled by --flag / --no-flag, not by string values."""
+    parser = build_parser()
+
+    args = parser.parse_args(["aspirin"])
+    assert args.detailed_name_dict is False
+    assert args.attempt_name_correction is True
+
+    args = parser.parse_args(
+        ["aspirin", "--detailed-name-dict", "--no-attempt-name-correction"]
+    )
+    assert args.detailed_name_dict is True
+    assert args.attempt_name_correction is False
+    assert args.names == ["aspirin"]
+
+
+def test_importing_cli_does_not_load_resolvers():
+    """The CLI module should not import the resolver stack until it runs."""
+    code = (
+        "import sys, cholla_chem.cli; "
+        "sys.exit(1 if 'cholla_chem.main' in sys.modules else 0)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT)
+    assert result.returncode == 0
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+# Ensure project root is on sys.path so we can import cholla_chem modules
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from cholla_chem.name_manipulation.name_correction.correction_strategies import (  # noqa: E402
+    squash_whitespace,
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected_text, expected_idx_map",
+    [
+        ("", "", []),
+        ("benzene", "benzene", [0, 1, 2, 3, 4, 5, 6]),
+        ("acetic acid", "aceticacid", [0, 1, 2, 3, 4, 5, 7, 8, 9, 10]),
+        (" a  b\n", "ab", [1, 4]),
+        ("   ", "", []),
+    ],
+)
+def test_squash_whitespace_maps_back_to_original_indices(
+    text, expected_text, expected_idx_map
+):
+    clean_text, idx_map = squash_whitespace(text)
+    assert clean_text == expected_text
+    assert list(idx_map) == expected_idx_map
@@ -0,0 +1,143 @@
+import json
+import os
+import sys
+
+import pytest
+
+# Ensure project root is on sys.path so we can import cholla_chem modules
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from cholla_chem.utils.file_utils import (  # noqa: E402
+    iter_names_from_file,
+    read_names_from_file,
+    write_results,
+)
+
+
+def test_read_names_from_txt(tmp_path):
+    """Plain text inputs should yield one stripped name per non-blank line."""
+    path = tmp_path / "names.txt"
+    path.write_text("ethanol\n\n  water \nacetone\n", encoding="utf-8")
+
+    assert read_names_from_file(str(path)) == ["ethanol", "water", "acetone"]
+
+
+@pytest.mark.parametrize("use_arrow", [True, False])
+@pytest.mark.parametrize("fmt,delimiter", [("csv", ","), ("tsv", "\t")])
+def test_read_names_from_delimited_file(
+    tmp_path, monkeypatch, fmt, delimiter, use_arrow
+):
+    """CSV/TSV inputs should read the requested column, skipping blanks and short rows."""
+    if use_arrow:
+        pytest.importorskip("pyarrow.csv")
+    else:
+        monkeypatch.setattr("cholla_chem.utils.file_utils.pa_csv", None)
+    path = tmp_path / f"names.{fmt}"
+    rows = [
+        ["id", "name"],
+        ["1", "ethanol"],
+        ["2", ""],
+        ["3"],
+        [],
+        ["4", '"2,4-dinitrophenol"' if fmt == "csv" else "2,4-dinitrophenol"],
+    ]
+    path.write_text(
+        "\n".join(delimiter.join(row) for row in rows) + "\n", encoding="utf-8"
+    )
+
+    assert list(read_names_from_file(str(path))) == ["ethanol", "2,4-dinitrophenol"]
+
+
+def test_read_names_from_ragged_csv_matches_with_and_without_arrow(
+    tmp_path, monkeypatch
+):
+    """Rows with too few or too many fields should be read the same by both parsers."""
+    pytest.importorskip("pyarrow.csv")
+    path = tmp_path / "names.csv"
+    path.write_text(
+        "name,id\nethanol,1\ntoluene\nbenzene,2,extra\n,3\nwater,4\n",
+        encoding="utf-8",
+    )
+    expected = ["ethanol", "toluene", "benzene", "water"]
+
+    assert list(read_names_from_file(str(path))) == expected
+    monkeypatch.setattr("cholla_chem.utils.file_utils.pa_csv", None)
+    assert list(read_names_from_file(str(path))) == expected
+
+
+def test_read_names_from_csv_missing_column(tmp_path):
+    """A missing input column should raise a ValueError listing the columns."""
+    path = tmp_path / "names.csv"
+    path.write_text("id,compound\n1,ethanol\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="missing column 'name'"):
+        list(read_names_from_file(str(path)))
+
+
+def test_iter_names_from_file_streams_names(tmp_path):
+    """The streaming reader should yield the same names as the list reader."""
+    path = tmp_path / "names.csv"
+    path.write_text("name\nethanol\nwater\n", encoding="utf-8")
+
+    names = iter_names_from_file(str(path))
+
+    assert not isinstance(names, list)
+    assert list(names) == read_names_from_file(str(path)) == ["ethanol", "water"]
+
+
+@pytest.mark.parametrize(
+    "filename,contents,error",
+    [
+        ("names.csv", "id,compound\n1,ethanol\n", ValueError),
+        ("names.csv", "", ValueError),
+        ("missing.txt", None, FileNotFoundError),
+    ],
+)
+def test_iter_names_from_file_raises_at_call(tmp_path, filename, contents, error):
+    """File and header errors should be raised before iteration starts."""
+    path = tmp_path / filename
+    if contents is not None:
+        path.write_text(contents, encoding="utf-8")
+
+    with pytest.raises(error):
+        iter_names_from_file(str(path))
+
+
+@pytest.mark.parametrize("fmt,delimiter", [("csv", ","), ("tsv", "\t")])
+def test_write_results_delimited(tmp_path, fmt, delimiter):
+    """CSV/TSV outputs should have a header row and quote fields where needed."""
+    path = tmp_path / f"out.{fmt}"
+    write_results({"ethanol": "CCO", "2,4-x": "C"}, output_path=str(path))
+
+    expected_name = '"2,4-x"' if fmt == "csv" else "2,4-x"
+    assert path.read_text(encoding="utf-8").splitlines() == [
+        f"name{delimiter}smiles",
+        f"ethanol{delimiter}CCO",
+        f"{expected_name}{delimiter}C",
+    ]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_results_json(tmp_path, monkeypatch, use_orjson):
+    """JSON outputs should round-trip the results dictionary."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr("cholla_chem.utils.file_utils.orjson", None)
+    path = tmp_path / "out.json"
+    results = {"ethanol": "CCO", "café": ""}
+    write_results(results, output_path=str(path))
+
+    text = path.read_text(encoding="utf-8")
+    assert json.loads(text) == results
+    assert "café" in text
+    assert text.endswith("}\n")
+
+
+def test_write_results_stdout(capsys):
+    """Without an output path, results should be printed as tab-separated lines."""
+    write_results({"ethanol": "CCO", "water": "O"}, output_path=None)
+
+    assert capsys.readouterr().out == "ethanol\tCCO\nwater\tO\n"
@@ -0,0 +1,129 @@
+import os
+import sys
+
+import pytest
+
+# Ensure project root is on sys.path so we can import cholla_chem modules
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from cholla_chem.utils.logging_config import (  # noqa: E402
+    configure_logging,
+    disable_library_logging,
+    logger,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    excepthook = sys.excepthook
+    yield
+    logger.remove()
+    disable_library_logging()
+    sys.excepthook = excepthook
+
+
+def _log_zero_division() -> None:
+    denominator = 0
+    try:
+        1 / denominator
+    except ZeroDivisionError:
+        logger.exception("division failed")
+
+
+def test_quiet_levels_keep_diagnostics_on_error_sink_only(tmp_path):
+    """At WARNING, variable values are only annotated in the error log."""
+    configure_logging(level="WARNING", log_dir=tmp_path)
+    _log_zero_division()
+    logger.remove()
+
+    main_log = (tmp_path / "cholla_chem.log").read_text(encoding="utf-8")
+    error_log = (tmp_path / "cholla_chem_errors.log").read_text(encoding="utf-8")
+    assert "ZeroDivisionError" in main_log
+    assert "└ 0" not in main_log
+    assert "└ 0" in error_log
+
+
+def test_verbose_levels_keep_diagnostics(tmp_path):
+    """At DEBUG, every sink renders variable-annotated tracebacks."""
+    configure_logging(level="DEBUG", log_dir=tmp_path)
+    _log_zero_division()
+    logger.remove()
+
+    main_log = (tmp_path / "cholla_chem.log").read_text(encoding="utf-8")
+    assert "└ 0" in main_log
+
+
+def test_enqueued_sinks_receive_records(tmp_path):
+    """Records logged through the queue reach the file once the sinks are stopped."""
+    configure_logging(level="INFO", log_dir=tmp_path, enqueue=True)
+    logger.info("queued message")
+    logger.remove()
+
+    main_log = (tmp_path / "cholla_chem.log").read_text(encoding="utf-8")
+    assert "queued message" in main_log
+
+
+def test_main_log_is_buffered_until_logging_is_reconfigured(tmp_path):
+    """Records are held in the write buffer and flushed when the sink is removed."""
+    configure_logging(level="INFO", log_dir=tmp_path)
+    logger.info("buffered message")
+
+    main_log = tmp_path / "cholla_chem.log"
+    assert "buffered message" not in main_log.read_text(encoding="utf-8")
+    logger.remove()
+    assert "buffered message" in main_log.read_text(encoding="utf-8")
+
+
+def test_line_buffered_main_log(tmp_path):
+    """A buffer size of 1 writes each record as soon as it is logged."""
+    configure_logging(level="INFO", log_dir=tmp_path, buffer_size=1)
+    logger.info("unbuffered message")
+
+    main_log = (tmp_path / "cholla_chem.log").read_text(encoding="utf-8")
+    assert "unbuffered message" in main_log
+
+
+def test_buffering_passed_through_kwargs_overrides_buffer_size(tmp_path):
+    """A logger.add() buffering argument should still be accepted and take precedence."""
+    configure_logging(level="INFO", log_dir=tmp_path, buffering=1)
+    logger.info("unbuffered message")
+
+    main_log = (tmp_path / "cholla_chem.log").read_text(encoding="utf-8")
+    assert "unbuffered message" in main_log
+    logger.remove()
+
+
+def test_reconfiguring_reuses_the_exception_hook():
+    """Repeated configure_logging calls keep a single excepthook installed."""
+    configure_logging(level="INFO")
+    hook = sys.excepthook
+    configure_logging(level="DEBUG")
+    assert sys.excepthook is hook
+
+
+def test_exception_hook_logs_uncaught_exceptions():
+    """The hook attaches the exception once, without copying it into extra."""
+    configure_logging(level="INFO")
+    records = []
+    logger.add(records.append, level="ERROR", format="{message}")
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        sys.excepthook(type(e), e, e.__traceback__)
+
+    (message,) = records
+    record = message.record
+    assert record["message"] == "Uncaught exception"
+    assert record["exception"].type is ValueError
+    assert record["extra"] == {}
+
+
+def test_log_files_are_created_in_a_new_directory(tmp_path):
+    """Both log files exist as soon as logging is configured."""
+    log_dir = tmp_path / "logs" / "nested"
+    configure_logging(level="INFO", log_dir=log_dir)
+
+    assert (log_dir / "cholla_chem.log").is_file()
+    assert (log_dir / "cholla_chem_errors.log").is_file()
@@ -0,0 +1,214 @@
+import os
+import sys
+
+import pytest
+
+# Ensure project root is on sys.path so we can import cholla_chem modules
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from cholla_chem.name_manipulation.name_correction.dataclasses import (  # noqa: E402
+    CorrectionCandidate,
+    CorrectorConfig,
+)
+from cholla_chem.name_manipulation.name_correction import (  # noqa: E402
+    name_corrector,
+)
+from cholla_chem.name_manipulation.name_correction.name_corrector import (  # noqa: E402
+    ChemNameCorrector,
+)
+
+
+@pytest.fixture(scope="module")
+def shared_corrector():
+    # Building the scorer's keyword processor is slow, so tests share one corrector
+    return ChemNameCorrector(CorrectorConfig(enable_external_validation=False))
+
+
+@pytest.fixture
+def corrector(shared_corrector):
+    strategies = list(shared_corrector.strategies)
+    shared_corrector._ranked_cache.clear()
+    yield shared_corrector
+    shared_corrector.strategies = strategies
+    shared_corrector._ranked_cache.clear()
+
+
+def ranked(candidates):
+    return [(c.name, c.score, c.num_corrections) for c in candidates]
+
+
+def test_repeated_names_reuse_cached_ranking(corrector, monkeypatch):
+    first = corrector.correct("ethy1 acetate", use_validator=False)
+
+    def fail(name):
+        raise AssertionError(f"candidates regenerated for {name}")
+
+    monkeypatch.setattr(corrector, "_generate_all_candidates", fail)
+    assert ranked(corrector.correct("ethy1 acetate", use_validator=False)) == ranked(
+        first
+    )
+
+
+def test_returned_candidates_are_copies_of_the_cache(corrector):
+    first = corrector.correct("ethy1 acetate", use_validator=False)
+    expected = ranked(first)
+    first[0].score = -1.0
+
+    assert ranked(corrector.correct("ethy1 acetate", use_validator=False)) == expected
+
+
+def test_cache_evicts_least_recently_used_names(corrector, monkeypatch):
+    monkeypatch.setattr(corrector.config, "cache_size", 2)
+    for name in ("ethy1 acetate", "rnethanol", "ethy1 acetate", "acetonitri1e"):
+        corrector.correct(name, use_validator=False)
+
+    assert list(corrector._ranked_cache) == ["ethy1 acetate", "acetonitri1e"]
+
+
+def test_changing_strategies_clears_cache(corrector):
+    corrector.correct("ethy1 acetate", use_validator=False)
+    strategy_name = corrector.strategies[0].name
+
+    assert corrector.remove_strategy(strategy_name)
+    assert not corrector._ranked_cache
+
+
+def test_correct_batch_corrects_duplicate_names_once(corrector, monkeypatch):
+    calls = []
+    correct = corrector.correct
+
+    def counting_correct(name, *args, **kwargs):
+        calls.append(name)
+        return correct(name, *args, **kwargs)
+
+    monkeypatch.setattr(corrector, "correct", counting_correct)
+    results = corrector.correct_batch(
+        ["rnethanol", "rnethanol", "acetonitri1e"], use_validator=False
+    )
+
+    assert calls == ["rnethanol", "acetonitri1e"]
+    assert list(results) == ["rnethanol", "acetonitri1e"]
+
+
+def test_strategies_are_applied_to_at_most_beam_width_texts(corrector, monkeypatch):
+    monkeypatch.setattr(corrector.config, "beam_width", 3)
+    inputs = []
+    for strategy in corrector.strategies:
+        generate = strategy.generate_candidates
+
+        def recording_generate(text, *args, _generate=generate, **kwargs):
+            inputs.append(text)
+            return _generate(text, *args, **kwargs)
+
+        monkeypatch.setattr(strategy, "generate_candidates", recording_generate)
+
+    candidates = corrector._generate_all_candidates("4-rnethylphenol")
+
+    assert candidates
+    assert inputs[0] == "4-rnethylphenol"
+    assert len(set(inputs)) <= 3
+
+
+def test_generated_candidates_are_unique_with_fewest_corrections(corrector):
+    candidates = corrector._generate_all_candidates("2-ch1oropropanoic acid")
+    names = [c.name for c in candidates]
+
+    assert len(names) == len(set(names))
+    assert all(c.original_name == "2-ch1oropropanoic acid" for c in candidates)
+
+
+class RecordingValidator:
+    """Fake validator that accepts "methanol" and records each batch it is given."""
+
+    def __init__(self):
+        self.batches = []
+
+    def batch_validate(self, names):
+        self.batches.append(list(names))
+        return {
+            name: (True, "CO") if name == "methanol" else (False, None)
+            for name in names
+        }
+
+
+def test_shared_candidate_texts_are_validated_once_for_every_name(corrector):
+    validator = RecordingValidator()
+    candidates = {
+        original: [
+            CorrectionCandidate(name="methanol", original_name=original, score=0.5),
+            CorrectionCandidate(name="ethanol", original_name=original, score=0.5),
+        ]
+        for original in ("rnethanol", "methanoI")
+    }
+
+    corrector._validate_candidates_batch(candidates, validator, validate_all=False)
+
+    assert validator.batches == [["methanol", "ethanol"]]
+    for candidates_list in candidates.values():
+        methanol, ethanol = candidates_list
+        assert (methanol.validated, methanol.validation_result) == (True, "CO")
+        assert methanol.score == pytest.approx(0.8)
+        assert ethanol.validated and ethanol.score == pytest.approx(0.3)
+
+
+def test_correct_batch_in_worker_processes_matches_serial(corrector, monkeypatch):
+    names = ["rnethanol", "acetonitri1e", "ethy1 acetate", "cyc1ohexanone"]
+    serial = corrector.correct_batch(names, use_validator=False)
+    corrector._ranked_cache.clear()
+
+    generated = []
+    generate = corrector._generate_all_candidates
+
+    def recording_generate(name):
+        generated.append(name)
+        return generate(name)
+
+    monkeypatch.setattr(corrector, "_generate_all_candidates", recording_generate)
+    monkeypatch.setattr(name_corrector, "CORRECT_BATCH_MIN_PARALLEL", 0)
+    monkeypatch.setattr(corrector.config, "workers", 2)
+    parallel = corrector.correct_batch(names, use_validator=False)
+
+    assert {name: ranked(c) for name, c in parallel.items()} == {
+        name: ranked(c) for name, c in serial.items()
+    }
+    # Only the first name is ranked in this process; the rest are cached from workers
+    assert generated == ["rnethanol"]
+    assert list(corrector._ranked_cache) == names
+
+
+def test_correct_batch_stays_in_process_without_fork(corrector, monkeypatch):
+    names = ["rnethanol", "acetonitri1e"]
+    monkeypatch.setattr(name_corrector, "CORRECT_BATCH_MIN_PARALLEL", 0)
+    monkeypatch.setattr(corrector.config, "workers", 2)
+    monkeypatch.setattr(
+        name_corrector.multiprocessing, "get_all_start_methods", lambda: ["spawn"]
+    )
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("worker pool should not be created")
+
+    monkeypatch.setattr(name_corrector, "ProcessPoolExecutor", no_pool)
+    results = corrector.correct_batch(names, use_validator=False)
+
+    assert list(results) == names
+    assert all(results[name] for name in names)
+
+
+def test_generation_stops_applying_strategies_at_the_ceiling(corrector, monkeypatch):
+    monkeypatch.setattr(corrector.config, "generation_ceiling", 1)
+    applied = []
+    for strategy in corrector.strategies:
+        generate = strategy.generate_candidates
+
+        def recording_generate(text, *args, _name=strategy.name, _generate=generate):
+            applied.append(_name)
+            return _generate(text, *args)
+
+        monkeypatch.setattr(strategy, "generate_candidates", recording_generate)
+
+    candidates = corrector._generate_all_candidates("ethy1 acetate")
+
+    assert candidates
+    assert 0 < len(set(applied)) < len(corrector.strategies)
@@ -320,6 +320,32 @@ def test_name_to_smiles_opsin_records_failures(monkeypatch):
         assert result_failures[name] == f"Error for {name}"
 
 
+@pytest.mark.parametrize("returncode,expected_failed", [(0, set()), (1, {"bad1"})])
+def test_name_to_smiles_opsin_reports_names_opsin_could_not_run_on(
+    monkeypatch, returncode, expected_failed
+):
+    """Unresolved names are only reported as failed when OPSIN itself failed."""
+
+    def fake_run_opsin(chemical_name, **kwargs):
+        return OpsinResult(
+            outputs=["", "C(C)O"], errors=["Error", ""], returncode=returncode
+        )
+
+    monkeypatch.setattr(
+        "cholla_chem.resolvers.opsin_resolver.opsin_resolver.run_opsin",
+        fake_run_opsin,
+        raising=True,
+    )
+
+    failed_names = set()
+    result_smiles, _ = name_to_smiles_opsin(
+        ["bad1", "ethanol"], failed_names=failed_names
+    )
+
+    assert result_smiles == {"ethanol": "C(C)O"}
+    assert failed_names == expected_failed
+
+
 def test_name_to_smiles_opsin_strips_newlines(monkeypatch):
     """name_to_smiles_opsin should strip newline characters before passing to py2opsin."""
 
@@ -383,3 +409,31 @@ def test_name_to_smiles_opsin_mismatched_lengths_logs_warning_and_returns_empty(
     assert result_failures == {}
     assert len(warnings) == 1
     assert "Mismatching lengths" in warnings[0]
+
+
+def test_name_to_smiles_opsin_sends_duplicates_once(monkeypatch):
+    """Duplicate names should be sent to OPSIN once and mapped back to every input."""
+
+    seen_chemical_names = []
+
+    def fake_run_opsin(chemical_name, **kwargs):
+        seen_chemical_names.extend(chemical_name)
+        outputs = [f"SMILES_{name}" for name in chemical_name]
+        errors = [""] * len(chemical_name)
+        return OpsinResult(outputs=outputs, errors=errors, returncode=0)
+
+    monkeypatch.setattr(
+        "cholla_chem.resolvers.opsin_resolver.opsin_resolver.run_opsin",
+        fake_run_opsin,
+        raising=True,
+    )
+
+    names = ["ethanol", "water", "ethanol\n"]
+    result_smiles, _ = name_to_smiles_opsin(names)
+
+    assert seen_chemical_names == ["ethanol", "water"]
+    assert result_smiles == {
+        "ethanol": "SMILES_ethanol",
+        "water": "SMILES_water",
+        "ethanol\n": "SMILES_ethanol",
+    }
@@ -0,0 +1,123 @@
+import os
+import sys
+
+import pytest
+
+# Ensure project root is on sys.path so we can import cholla_chem modules
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from cholla_chem.name_manipulation.peptide_shorthand_handler import (  # noqa: E402
+    AA_YL_FORMS,
+    PLAIN_RESIDUE_NAMES,
+    _peptide_shorthand_to_iupac,
+    peptide_shorthand_to_iupac,
+    peptide_shorthands_to_iupac,
+    process_amino_acid_token,
+    split_peptide_shorthand,
+)
+from cholla_chem.name_manipulation import peptide_shorthand_handler  # noqa: E402
+from cholla_chem.utils.constants import AA_FULL  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "shorthand, expected",
+    [
+        ("Ala-Gly", "l-alanyl-glycine"),
+        ("H-Ala-Gly-OH", "l-alanyl-glycine"),
+        (
+            "Boc-Ala-Phe-OMe",
+            "tert-butoxycarbonyl-l-alanyl-l-phenylalanine methyl ester",
+        ),
+        ("D-Ala-Gly", "d-alanyl-glycine"),
+        ("cyclo(Ala-Gly)", "cyclo(l-alanyl-glycyl)"),
+        ("Cyclo-[Ala-Gly]", "cyclo(l-alanyl-glycyl)"),
+        ("cyclo{Ala-Gly}", "cyclo(l-alanyl-glycyl)"),
+        ("cyclo-Ala-Gly", "cyclo(l-alanyl-glycyl)"),
+        ("Ala-Gly.HCl", "l-alanyl-glycine hydrochloride"),
+        ("TFA.Ala-Gly", "l-alanyl-glycine trifluoroacetate"),
+        ("Ala-Gly . tfa", "l-alanyl-glycine trifluoroacetate"),
+        ("Ala.Gly", "l-Ala.Gly"),
+        ("βAla-Gly", "β-l-alanyl-glycine"),
+        ("DL-Ala-Gly", "dl-alanyl-glycine"),
+        ("d,l-Ala-Gly", "dl-alanyl-glycine"),
+        ("(D)Ala-Gly", "d-alanyl-glycine"),
+        ("Ala-D", "l-alanyl-d"),
+    ],
+)
+def test_peptide_shorthand_to_iupac(shorthand, expected):
+    assert peptide_shorthand_to_iupac(shorthand) == expected
+
+
+@pytest.mark.parametrize(
+    "shorthand, expected",
+    [
+        ("Cys-Gly", "l-cysteinyl-glycine"),
+        ("Trp-Gly", "l-tryptophyl-glycine"),
+        ("Gln-Gly", "l-glutaminyl-glycine"),
+    ],
+)
+def test_intermediate_residues_use_tabulated_yl_form(shorthand, expected):
+    """-yl forms come from AA_FULL rather than suffix replacement on the name."""
+    assert peptide_shorthand_to_iupac(shorthand) == expected
+
+
+def test_aa_yl_forms_keep_first_code_for_shared_names():
+    assert AA_YL_FORMS["leucine"] == AA_FULL["leu"][1]
+    assert AA_YL_FORMS["pyroglutamic acid"] == AA_FULL["glp"][1]
+
+
+def test_plain_residue_names_hold_intermediate_and_final_forms():
+    assert PLAIN_RESIDUE_NAMES["ala"] == ("l-alanyl", "l-alanine")
+    assert PLAIN_RESIDUE_NAMES["gly"] == ("glycyl", "glycine")
+
+
+@pytest.mark.parametrize("token", ["", "β"])
+def test_empty_residue_tokens_do_not_raise(token):
+    """A token that is empty, or empty after its Greek prefix, is left unresolved."""
+    assert process_amino_acid_token(token, is_last=True, is_cyclic=False) == "l-"
+
+
+def test_no_residues_raises():
+    with pytest.raises(ValueError, match="No residues found"):
+        peptide_shorthand_to_iupac("H-OH")
+
+
+@pytest.mark.parametrize(
+    "shorthand, expected",
+    [
+        (" H-Ala--Gly-OH- ", ["H", "Ala", "Gly", "OH"]),
+        ("Ala-Tyr(2,6-Cl2-Bn)-Gly", ["Ala", "Tyr(2,6-Cl2-Bn)", "Gly"]),
+        ("Ala-(Gly-Ser)-Val", ["Ala", "(Gly-Ser)", "Val"]),
+        ("Ala-X(a(b-c)-d)-Val", ["Ala", "X(a(b-c)-d)", "Val"]),
+        ("Ala-Gly(-Ser", ["Ala", "Gly(-Ser"]),
+        ("Ala)-Gly", ["Ala)-Gly"]),
+    ],
+)
+def test_split_peptide_shorthand(shorthand, expected):
+    """Hyphens only separate tokens outside parentheses, including nested ones."""
+    assert split_peptide_shorthand(shorthand) == expected
+
+
+def test_conversions_are_cached_on_stripped_shorthand():
+    _peptide_shorthand_to_iupac.cache_clear()
+    assert peptide_shorthand_to_iupac("Ala-Gly") == "l-alanyl-glycine"
+    assert peptide_shorthand_to_iupac("  Ala-Gly\n") == "l-alanyl-glycine"
+    info = _peptide_shorthand_to_iupac.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_batch_conversion_deduplicates_and_omits_failures():
+    results = peptide_shorthands_to_iupac(["Ala-Gly", "H-OH", "Ala-Gly", "Gly-Ala"])
+    assert results == {
+        "Ala-Gly": "l-alanyl-glycine",
+        "Gly-Ala": "glycyl-l-alanine",
+    }
+
+
+def test_batch_conversion_in_worker_pool_matches_serial(monkeypatch):
+    shorthands = ["Ala-Gly", "H-OH", "Boc-Lys(Boc)-OMe", "cyclo(Arg-Gly-Asp)"]
+    serial = peptide_shorthands_to_iupac(shorthands, max_workers=1)
+    monkeypatch.setattr(peptide_shorthand_handler, "PEPTIDE_BATCH_MIN_PARALLEL", 0)
+    assert peptide_shorthands_to_iupac(shorthands, max_workers=2) == serial
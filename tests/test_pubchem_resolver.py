@@ -1,3 +1,4 @@
+import gzip
 import os
 import sys
 from urllib.error import HTTPError, URLError
@@ -13,8 +14,9 @@ from cholla_chem.resolvers.pubchem_resolver import pubchem_resolver as pcr  # no
 
 
 class _FakeHTTPResponse:
-    def __init__(self, body: bytes):
+    def __init__(self, body: bytes, headers=None):
         self._body = body
+        self.headers = headers or {}
 
     def read(self) -> bytes:
         return self._body
@@ -29,8 +31,9 @@ class _FakeHTTPResponse:
 def test_request_smiles_by_name_builds_expected_url(monkeypatch):
     captured = {}
 
-    def fake_urlopen(api_url, timeout=None, context=None):
-        captured["api_url"] = api_url
+    def fake_urlopen(req, timeout=None, context=None):
+        captured["api_url"] = req.full_url
+        captured["accept_encoding"] = req.get_header("Accept-encoding")
         captured["timeout"] = timeout
         return _FakeHTTPResponse(b'{"ok": true}')
 
@@ -43,17 +46,29 @@ def test_request_smiles_by_name_builds_expected_url(monkeypatch):
         captured["api_url"]
         == f"{pcr.API_BASE}/compound/name/sodium%20chloride/property/SMILES/JSON"
     )
+    assert captured["accept_encoding"] == "gzip"
     assert captured["timeout"] == 7
 
 
+def test_request_smiles_by_name_decompresses_gzip_response(monkeypatch):
+    def fake_urlopen(req, timeout=None, context=None):
+        return _FakeHTTPResponse(
+            gzip.compress(b'{"ok": true}'), headers={"Content-Encoding": "gzip"}
+        )
+
+    monkeypatch.setattr(pcr, "urlopen", fake_urlopen, raising=True)
+
+    assert pcr.request_smiles_by_name("ethanol") == b'{"ok": true}'
+
+
 def test_request_smiles_by_name_raises_for_empty_name():
     with pytest.raises(ValueError, match="compound_name cannot be empty"):
         pcr.request_smiles_by_name("")
 
 
 def test_request_smiles_by_name_wraps_http_error(monkeypatch):
-    def fake_urlopen(api_url, timeout=None, context=None):
-        raise HTTPError(api_url, 404, "Not Found", hdrs=None, fp=None)
+    def fake_urlopen(req, timeout=None, context=None):
+        raise HTTPError(req.full_url, 404, "Not Found", hdrs=None, fp=None)
 
     monkeypatch.setattr(pcr, "urlopen", fake_urlopen, raising=True)
 
@@ -62,7 +77,7 @@ def test_request_smiles_by_name_wraps_http_error(monkeypatch):
 
 
 def test_request_smiles_by_name_wraps_url_error(monkeypatch):
-    def fake_urlopen(api_url, timeout=None, context=None):
+    def fake_urlopen(req, timeout=None, context=None):
         raise URLError("network down")
 
     monkeypatch.setattr(pcr, "urlopen", fake_urlopen, raising=True)
@@ -116,7 +131,7 @@ def test_name_to_smiles_pubchem_maps_each_filtered_name(monkeypatch):
     )
     monkeypatch.setattr(
         pcr,
-        "get_smiles_by_name",
+        "_query_smiles_by_name",
         lambda compound_name: f"SMILES_{compound_name}",
         raising=True,
     )
@@ -131,6 +146,23 @@ def test_name_to_smiles_pubchem_maps_each_filtered_name(monkeypatch):
     }
 
 
+def test_name_to_smiles_pubchem_reports_failed_lookups(monkeypatch):
+    """Request errors should be reported as failed, but not PubChem's 404 for no match."""
+
+    def fake_urlopen(req, timeout=None, context=None):
+        if "unknown" in req.full_url:
+            raise HTTPError(req.full_url, 404, "Not Found", hdrs=None, fp=None)
+        raise URLError("network down")
+
+    monkeypatch.setattr(pcr, "urlopen", fake_urlopen, raising=True)
+
+    failed_names = set()
+    result = pcr.name_to_smiles_pubchem(["unknown", "flaky"], failed_names=failed_names)
+
+    assert result == {"unknown": "", "flaky": ""}
+    assert failed_names == {"flaky"}
+
+
 def test_name_to_smiles_pubchem_returns_empty_dict_when_filtered_names_empty(
     monkeypatch,
 ):
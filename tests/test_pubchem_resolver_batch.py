@@ -12,20 +12,15 @@ if PROJECT_ROOT not in sys.path:
 from cholla_chem.resolvers.pubchem_resolver import (  # noqa: E402
     pubchem_resolver_batch as pcr,
 )
+from cholla_chem.resolvers.pubchem_resolver import pubchem_utils  # noqa: E402
 
 
 class _FakeHTTPResponse:
-    def __init__(self, body: bytes):
-        self._body = body
-
-    def read(self) -> bytes:
-        return self._body
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):
-        return False
+    def __init__(self, body: bytes, status_code: int = 200, reason: str = "OK"):
+        self.content = body
+        self.status_code = status_code
+        self.reason = reason
+        self.ok = status_code < 400
 
 
 def test_name_to_smiles_pubchem_batch_basic_mapping(monkeypatch):
@@ -67,6 +62,25 @@ def test_name_to_smiles_pubchem_batch_basic_mapping(monkeypatch):
         assert result[name] == f"SMILES_{name}"
 
 
+def test_name_to_smiles_pubchem_batch_queries_duplicates_once(monkeypatch):
+    monkeypatch.setattr(
+        pcr, "filter_latin1_compatible", lambda names: names, raising=True
+    )
+
+    captured_names = []
+
+    def fake_get_compounds(names, identifier_type):
+        captured_names.append(names)
+        return [f"SMILES_{name}" for name in names]
+
+    monkeypatch.setattr(pcr, "get_compounds", fake_get_compounds, raising=True)
+
+    result = pcr.name_to_smiles_pubchem_batch(["ethanol", "water", "ethanol"])
+
+    assert captured_names == [["ethanol", "water"]]
+    assert result == {"ethanol": "SMILES_ethanol", "water": "SMILES_water"}
+
+
 def test_name_to_smiles_pubchem_batch_handles_none_results(monkeypatch):
     """If PubChem returns None for an entry, the corresponding SMILES should be an empty string."""
 
@@ -96,6 +110,23 @@ def test_name_to_smiles_pubchem_batch_handles_none_results(monkeypatch):
     assert result["missing_name"] == ""
 
 
+def test_name_to_smiles_pubchem_batch_reports_failed_query(monkeypatch):
+    """If the batch query raises, every queried name should be reported as failed."""
+
+    def fake_get_compounds(names, identifier_type):
+        raise RuntimeError("PubChem is down")
+
+    monkeypatch.setattr(pcr, "get_compounds", fake_get_compounds, raising=True)
+
+    failed_names = set()
+    result = pcr.name_to_smiles_pubchem_batch(
+        ["ethanol", "water", "ethanol"], failed_names=failed_names
+    )
+
+    assert result == {}
+    assert failed_names == {"ethanol", "water"}
+
+
 def test_name_to_smiles_pubchem_batch_logs_length_mismatch(monkeypatch):
     """If lengths mismatch, a warning should be logged and an empty dictionary should be returned."""
 
@@ -150,6 +181,17 @@ def test_parse_cid_file_maps_valid_and_invalid_to_dummy():
     assert out["acetone"] == pcr.DUMMY_CID
 
 
+def test_parse_cid_file_reads_bytes_with_quotes_and_crlf():
+    content = '5"-GMP\t135398631\r\n"quoted" name\t702\r\n\r\nwater\t\r\n'.encode()
+    out = pcr.parse_cid_file(content)
+
+    assert out == {
+        '5"-GMP': "135398631",
+        '"quoted" name': "702",
+        "water": pcr.DUMMY_CID,
+    }
+
+
 def test_create_batch_cid_request_xml_contains_synonyms_for_name():
     xml = pcr.create_batch_cid_request_xml(["ethanol", "water"], "name")
 
@@ -206,22 +248,83 @@ def test_poll_request_status_error_logs_warning_and_returns_none(monkeypatch):
     assert any("Error retrieving CIDs from PubChem" in w for w in warnings)
 
 
+def test_poll_request_status_backs_off_exponentially(monkeypatch):
+    running_xml = '<PCT-Data><PCT-Status value="running"/></PCT-Data>'
+    success_xml = (
+        '<PCT-Data><PCT-Status value="success"/>'
+        "<PCT-Download-URL_url>ftp://example.com/file.txt</PCT-Download-URL_url>"
+        "</PCT-Data>"
+    )
+    responses = iter([running_xml] * 4 + [success_xml])
+    monkeypatch.setattr(
+        pcr, "send_xml_to_pug", lambda xml: next(responses), raising=True
+    )
+
+    sleeps = []
+    monkeypatch.setattr(pcr.time, "sleep", sleeps.append, raising=True)
+    monkeypatch.setattr(pcr.random, "uniform", lambda a, b: 0.0, raising=True)
+
+    url = pcr.poll_request_status("REQID", check_interval=1, max_interval=3)
+    assert url == "ftp://example.com/file.txt"
+    assert sleeps == [1, 1.5, 2.25, 3]
+
+
+def test_poll_request_statuses_polls_outstanding_requests_together(monkeypatch):
+    def status_xml(status):
+        return f'<PCT-Data><PCT-Status value="{status}"/></PCT-Data>'
+
+    def success_xml(req_id):
+        return (
+            '<PCT-Data><PCT-Status value="success"/>'
+            f"<PCT-Download-URL_url>ftp://example.com/{req_id}</PCT-Download-URL_url>"
+            "</PCT-Data>"
+        )
+
+    # A finishes on the first check, B on the third, C fails on the second
+    responses = {
+        "A": iter([success_xml("A")]),
+        "B": iter([status_xml("queued"), status_xml("running"), success_xml("B")]),
+        "C": iter([status_xml("running"), status_xml("error")]),
+    }
+    checked = []
+
+    def fake_send_xml_to_pug(xml):
+        req_id = xml.split("<PCT-Request_reqid>")[1].split("<")[0]
+        checked.append(req_id)
+        return next(responses[req_id])
+
+    monkeypatch.setattr(pcr, "send_xml_to_pug", fake_send_xml_to_pug, raising=True)
+    sleeps = []
+    monkeypatch.setattr(pcr.time, "sleep", sleeps.append, raising=True)
+    monkeypatch.setattr(pcr.random, "uniform", lambda a, b: 0.0, raising=True)
+
+    out = pcr.poll_request_statuses(["A", "B", "C"], check_interval=1)
+    assert out == {"A": "ftp://example.com/A", "B": "ftp://example.com/B", "C": None}
+    assert checked == ["A", "B", "C", "B", "C", "B"]
+    assert sleeps == [1, 1.5]
+
+
 def test_download_file_from_pug_converts_ftp_to_https(monkeypatch):
     captured = {}
 
-    def fake_urlopen(req, timeout=None, context=None):
-        # `req` is a urllib.request.Request
-        captured["url"] = req.full_url
+    def fake_get(url, timeout=None):
+        captured["url"] = url
         return _FakeHTTPResponse(b"hello")
 
-    monkeypatch.setattr(pcr, "urlopen", fake_urlopen, raising=True)
+    monkeypatch.setattr(pcr._SESSION, "get", fake_get, raising=True)
 
     out = pcr.download_file_from_pug("ftp://pubchem.ncbi.nlm.nih.gov/somefile")
-    assert out == "hello"
+    assert out == b"hello"
     assert captured["url"].startswith("https://")
 
 
-def test_get_json_returns_dict_when_get_returns_json_bytes(monkeypatch):
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_get_json_returns_dict_when_get_returns_json_bytes(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(pubchem_utils, "orjson", None)
+
     def fake_get(
         identifier, namespace, domain, operation, output, searchtype, **kwargs
     ):
@@ -336,8 +439,10 @@ def test_batch_retrieve_cids_happy_path(monkeypatch):
     monkeypatch.setattr(pcr, "send_xml_to_pug", lambda xml: initial_xml, raising=True)
     monkeypatch.setattr(
         pcr,
-        "poll_request_status",
-        lambda req_id, check_interval, timeout: "ftp://example.com/file",
+        "poll_request_statuses",
+        lambda req_ids, check_interval, timeout: {
+            req_id: "ftp://example.com/file" for req_id in req_ids
+        },
         raising=True,
     )
     monkeypatch.setattr(
@@ -353,6 +458,134 @@ def test_batch_retrieve_cids_happy_path(monkeypatch):
     assert out == ["702", "962"]
 
 
+def test_batch_retrieve_cids_runs_chunks_concurrently_and_keeps_order(monkeypatch):
+    # Each chunk's names travel through the fake job as its reqid/download URL
+    monkeypatch.setattr(
+        pcr,
+        "create_batch_cid_request_xml",
+        lambda chunk, ns: ",".join(chunk),
+        raising=True,
+    )
+    monkeypatch.setattr(
+        pcr,
+        "send_xml_to_pug",
+        lambda xml: (
+            f"<PCT-Data><PCT-Waiting_reqid>{xml}</PCT-Waiting_reqid></PCT-Data>"
+        ),
+        raising=True,
+    )
+    polled = []
+
+    def fake_poll_request_statuses(req_ids, check_interval, timeout):
+        polled.append(req_ids)
+        return {req_id: req_id for req_id in req_ids}
+
+    monkeypatch.setattr(
+        pcr, "poll_request_statuses", fake_poll_request_statuses, raising=True
+    )
+    monkeypatch.setattr(
+        pcr,
+        "download_file_from_pug",
+        lambda url: "".join(f"{name}\t{name[1:]}\n" for name in url.split(",")),
+        raising=True,
+    )
+
+    identifiers = [f"n{i}" for i in range(7)]
+    out = pcr.batch_retrieve_cids(identifiers, namespace="name", chunk_size=2)
+    assert out == [str(i) for i in range(7)]
+    # All submitted jobs are polled together from one loop
+    assert polled == [["n0,n1", "n2,n3", "n4,n5", "n6"]]
+
+
+def test_batch_retrieve_cids_submits_duplicates_once(monkeypatch):
+    submitted = []
+
+    def fake_submit_cid_request(chunk, namespace):
+        submitted.extend(chunk)
+        return "REQ"
+
+    monkeypatch.setattr(
+        pcr, "_submit_cid_request", fake_submit_cid_request, raising=True
+    )
+    monkeypatch.setattr(
+        pcr,
+        "poll_request_statuses",
+        lambda req_ids, check_interval, timeout: {"REQ": "ftp://example.com/file"},
+        raising=True,
+    )
+    monkeypatch.setattr(
+        pcr,
+        "download_file_from_pug",
+        lambda url: "ethanol\t702\nwater\t962\n",
+        raising=True,
+    )
+
+    out = pcr.batch_retrieve_cids(["ethanol", "water", "ethanol"], namespace="name")
+    assert submitted == ["ethanol", "water"]
+    assert out == ["702", "962", "702"]
+
+
+def test_batch_retrieve_cids_passes_numeric_cids_through(monkeypatch):
+    submitted = []
+
+    def fake_submit_cid_request(chunk, namespace):
+        submitted.append(chunk)
+        return "REQ"
+
+    monkeypatch.setattr(
+        pcr, "_submit_cid_request", fake_submit_cid_request, raising=True
+    )
+    monkeypatch.setattr(
+        pcr,
+        "poll_request_statuses",
+        lambda req_ids, check_interval, timeout: {"REQ": "ftp://example.com/file"},
+        raising=True,
+    )
+    monkeypatch.setattr(
+        pcr, "download_file_from_pug", lambda url: "ethanol\t702\n", raising=True
+    )
+
+    out = pcr.batch_retrieve_cids(["962", "ethanol", "0702"], namespace="cid")
+    assert submitted == [["ethanol"]]
+    assert out == ["962", "702", "702"]
+
+    submitted.clear()
+    assert pcr.batch_retrieve_cids(["962", "2244"], namespace="cid") == [
+        "962",
+        "2244",
+    ]
+    assert submitted == []
+
+
+def test_batch_retrieve_cids_looks_up_numeric_names(monkeypatch):
+    submitted = []
+
+    def fake_submit_cid_request(chunk, namespace):
+        submitted.append(chunk)
+        return "REQ"
+
+    monkeypatch.setattr(
+        pcr, "_submit_cid_request", fake_submit_cid_request, raising=True
+    )
+    monkeypatch.setattr(
+        pcr,
+        "poll_request_statuses",
+        lambda req_ids, check_interval, timeout: {"REQ": "ftp://example.com/file"},
+        raising=True,
+    )
+    # PubChem has no compound named "999999999999", so it gets no CID
+    monkeypatch.setattr(
+        pcr,
+        "download_file_from_pug",
+        lambda url: "ethanol\t702\n999999999999\t\n",
+        raising=True,
+    )
+
+    out = pcr.batch_retrieve_cids(["ethanol", "999999999999"], namespace="name")
+    assert submitted == [["ethanol", "999999999999"]]
+    assert out == ["702", pcr.DUMMY_CID]
+
+
 def test_batch_retrieve_cids_handles_missing_reqid_by_returning_dummy(monkeypatch):
     # No reqid + no error details -> should dummy-fill the chunk
     initial_xml = "<PCT-Data></PCT-Data>"
@@ -366,19 +599,96 @@ def test_batch_retrieve_cids_handles_missing_reqid_by_returning_dummy(monkeypatc
     assert out == [pcr.DUMMY_CID, pcr.DUMMY_CID, pcr.DUMMY_CID]
 
 
+def test_batch_retrieve_cids_logs_immediate_error(monkeypatch):
+    initial_xml = """
+    <PCT-Data>
+      <PCT-Status-Message>
+        <PCT-Status value="error"/>
+        <PCT-Status-Message_message>too many requests</PCT-Status-Message_message>
+      </PCT-Status-Message>
+    </PCT-Data>
+    """.strip()
+
+    monkeypatch.setattr(pcr, "send_xml_to_pug", lambda xml: initial_xml, raising=True)
+
+    warnings = []
+
+    class FakeLogger:
+        @staticmethod
+        def warning(msg):
+            warnings.append(msg)
+
+    monkeypatch.setattr(pcr, "logger", FakeLogger, raising=True)
+
+    out = pcr.batch_retrieve_cids(["a", "b"], namespace="name")
+    assert out == [pcr.DUMMY_CID, pcr.DUMMY_CID]
+    assert warnings == ["Error retrieving CIDs from PubChem: too many requests"]
+
+
 def test_request_with_list_identifier_in_name_namespace_uses_batch_retrieve_and_switches_to_cid(
     monkeypatch,
 ):
-    # We don't want to actually urlopen; just capture what request() passes to it.
+    # We don't want to actually hit the network; just capture what request() sends.
     monkeypatch.setattr(
         pcr, "batch_retrieve_cids", lambda ids, namespace: ["1", "2"], raising=True
     )
 
     captured = {}
 
-    def fake_urlopen(apiurl, postdata=None, context=None):
+    def fake_post(apiurl, data=None):
+        captured["apiurl"] = apiurl
+        captured["postdata"] = data
+        return _FakeHTTPResponse(b"{}")
+
+    monkeypatch.setattr(pcr._SESSION, "post", fake_post, raising=True)
+
+    response = pcr.request(["ethanol", "water"], namespace="name")
+
+    assert response.content == b"{}"
+    assert captured["apiurl"] == f"{pcr.API_BASE}/compound/cid/JSON"
+    assert captured["postdata"] == {"cid": "1,2"}
+
+
+def test_request_puts_url_identifiers_in_path(monkeypatch):
+    captured = {}
+
+    def fake_get(apiurl):
         captured["apiurl"] = apiurl
-        captured["postdata"] = postdata
         return _FakeHTTPResponse(b"{}")
 
-    monkeypatch.setattr(pcr, "urlopen", fake_urlopen, raising=True)
+    monkeypatch.setattr(pcr._SESSION, "get", fake_get, raising=True)
+
+    pcr.request(
+        "C6H6", namespace="formula", operation="cids", output="TXT", MaxRecords=5
+    )
+    assert captured["apiurl"] == (
+        f"{pcr.API_BASE}/compound/formula/C6H6/cids/TXT?MaxRecords=5"
+    )
+
+    pcr.request("LK123", namespace="listkey", operation=None, output="JSON")
+    assert captured["apiurl"] == f"{pcr.API_BASE}/compound/listkey/LK123/JSON"
+
+
+def test_session_retries_transient_http_errors():
+    retry = pcr._SESSION.get_adapter(pcr.PUBCHEM_PUG_URL).max_retries
+
+    assert retry.total == 5
+    assert {429, 503}.issubset(retry.status_forcelist)
+    assert {"GET", "POST"}.issubset(retry.allowed_methods)
+    assert retry.respect_retry_after_header
+    # Exhausted retries still surface as an HTTP error status
+    assert not retry.raise_on_status
+
+
+def test_send_xml_to_pug_wraps_http_error_status(monkeypatch):
+    monkeypatch.setattr(
+        pcr._SESSION,
+        "post",
+        lambda url, data=None, headers=None, timeout=None: _FakeHTTPResponse(
+            b"", status_code=503, reason="Service Unavailable"
+        ),
+        raising=True,
+    )
+
+    with pytest.raises(Exception, match="HTTP Error 503: Service Unavailable"):
+        pcr.send_xml_to_pug("<xml/>")
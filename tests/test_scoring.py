@@ -0,0 +1,53 @@
+import os
+import sys
+
+import pytest
+
+# Ensure project root is on sys.path so we can import cholla_chem modules
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from cholla_chem.name_manipulation.name_correction.dataclasses import (  # noqa: E402
+    CorrectionCandidate,
+)
+from cholla_chem.name_manipulation.name_correction.scoring import (  # noqa: E402
+    ChemicalNameScorer,
+)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("benzene", 1.0),
+        ("2-amino-3-(4-hydroxyphenyl)propanoic acid", 1.0),
+        ("[1,1'-biphenyl]-4-carboxylic acid", 1.0),
+        ("2-amino-3-(4-hydroxyphenyl propanoic acid", 0.25),
+        ("a)(b", 0.5),
+        ("((2S)-x]", 0.0),
+    ],
+)
+def test_score_bracket_balance(name, expected):
+    assert ChemicalNameScorer()._score_bracket_balance(name) == expected
+
+
+def test_original_name_counts_are_computed_once_per_original_name(monkeypatch):
+    scorer = ChemicalNameScorer()
+    counted = []
+    monkeypatch.setattr(
+        scorer,
+        "_get_number_of_chemical_morphemes",
+        lambda name: counted.append(name) or 1,
+    )
+
+    for name in ("methanol", "rnethanoI"):
+        scorer.score(CorrectionCandidate(name=name, original_name="rnethanol"))
+    scorer.score(CorrectionCandidate(name="ethanol", original_name="ethano1"))
+
+    assert counted == [
+        "rnethanol",
+        "methanol",
+        "rnethanoI",
+        "ethano1",
+        "ethanol",
+    ]
@@ -0,0 +1,134 @@
+import os
+import random
+import sys
+
+import pytest
+
+# Ensure project root is on sys.path so we can import cholla_chem modules
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from cholla_chem.name_manipulation.unicode_normalization import (  # noqa: E402
+    normalize_unicode_and_return_mapping,
+)
+from cholla_chem.utils.constants import NON_LATIN1_REPLACEMENTS  # noqa: E402
+from cholla_chem.utils.string_utils import (  # noqa: E402
+    _clean_string,
+    cas_check_digit,
+    clean_strings,
+    filter_latin1_compatible,
+    filter_strings_by_whitelist,
+    is_latin1_compatible,
+    is_valid_cas,
+    remove_tags,
+    safe_str,
+)
+
+
+def test_clean_strings_replaces_and_strips():
+    """Non-Latin-1 characters, tags and newlines should be replaced or removed."""
+    assert clean_strings("H₂O") == "H2O"
+    assert clean_strings("α-pinene") == "alpha-pinene"
+    assert clean_strings("<b>benzene</b>\n") == "benzene"
+    assert clean_strings("acetone?") == "acetone"
+    assert clean_strings("2,4-dinitrophenol") == "2,4-dinitrophenol"
+
+
+def test_clean_strings_matches_reference_on_random_inputs():
+    """The cached fast path must agree with the full replacement pass."""
+    rng = random.Random(0)
+    alphabet = list("abcXYZ0123(),-[]<>&#;?% \n") + list(NON_LATIN1_REPLACEMENTS)
+    for _ in range(2000):
+        s = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert clean_strings(s) == _clean_string(s, NON_LATIN1_REPLACEMENTS)
+
+
+def test_clean_strings_custom_replacements():
+    """A custom replacement table should bypass the default cache."""
+    assert clean_strings("foo", {"o": "0"}) == "f00"
+
+
+def test_normalize_unicode_and_return_mapping_handles_duplicates():
+    """Duplicates should be cleaned once and map to the same cleaned value."""
+    cleaned_list, mapping = normalize_unicode_and_return_mapping(
+        ["H₂O", "ethanol", "H₂O"]
+    )
+    assert cleaned_list == ["H2O", "ethanol", "H2O"]
+    assert mapping == {"H₂O": "H2O", "ethanol": "ethanol"}
+
+
+def test_filter_latin1_compatible():
+    """Only strings encodable as latin-1 should be kept, in order."""
+    assert filter_latin1_compatible(["ethanol", "naïve", "water"]) == [
+        "ethanol",
+        "naïve",
+        "water",
+    ]
+    assert filter_latin1_compatible(["ethanol", "α-pinene", "water", "H₂O"]) == [
+        "ethanol",
+        "water",
+    ]
+    assert filter_latin1_compatible([]) == []
+
+
+def test_remove_tags():
+    """HTML tags should be removed non-greedily, leaving the text between them."""
+    assert remove_tags("<i>tert</i>-butanol") == "tert-butanol"
+    assert remove_tags("a < b") == "a < b"
+
+
+def test_filter_strings_by_whitelist():
+    """Only strings made up entirely of whitelisted characters should be kept."""
+    names = ["ethanol", "α-pinene", "", "H2O", "H₂O"]
+    assert filter_strings_by_whitelist(names) == ["ethanol", "", "H2O"]
+    assert filter_strings_by_whitelist(names, whitelist=list("ehlnota")) == [
+        "ethanol",
+        "",
+    ]
+
+
+def test_is_latin1_compatible():
+    """Strings with code points up to U+00FF are latin-1 compatible."""
+    assert is_latin1_compatible("ethanol")
+    assert is_latin1_compatible("naïve\xff")
+    assert is_latin1_compatible("")
+    assert not is_latin1_compatible("α-pinene")
+    assert not is_latin1_compatible("H₂O")
+
+
+def test_cas_check_digit():
+    """The last digit should equal the position-weighted digit sum mod 10."""
+    assert cas_check_digit("7732185")  # water, 7732-18-5
+    assert cas_check_digit("64175")  # ethanol, 64-17-5
+    assert not cas_check_digit("7732186")
+
+
+@pytest.mark.parametrize("value", ["7732-18-5", "77a2185", "", "７７３２１８５"])
+def test_cas_check_digit_rejects_non_digits(value):
+    """Anything but ASCII digits should raise rather than give an arbitrary answer."""
+    with pytest.raises(ValueError):
+        cas_check_digit(value)
+
+
+def test_is_valid_cas():
+    """Hyphens are ignored; other non-digits and short numbers are rejected."""
+    assert is_valid_cas("7732-18-5")
+    assert is_valid_cas("64-17-5")
+    assert not is_valid_cas("7732-18-6")
+    assert not is_valid_cas("2-methylpropan-1-ol")
+    assert not is_valid_cas("1-1")
+    assert not is_valid_cas("--")
+
+
+def test_safe_str():
+    """Strings pass through; other objects are converted, or None if str() fails."""
+
+    class Unprintable:
+        def __str__(self):
+            raise ValueError("no string form")
+
+    assert safe_str("ethanol") == "ethanol"
+    assert safe_str(42) == "42"
+    assert safe_str(None) == "None"
+    assert safe_str(Unprintable()) is None